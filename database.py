@@ -5,14 +5,17 @@
 SQLAlchemyデータベースモデルとセッション管理機能を提供します。
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import and_, or_, create_engine, event, insert, inspect, Column, Index, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, selectinload
 from sqlalchemy.sql import func
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Tuple
 import json
 import os
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
+import orjson
 
 # 環境変数からデータベースURLを取得
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./fuzzer_requests.db")
@@ -21,16 +24,49 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./fuzzer_requests.db")
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+# マイグレーションの設定ファイル（migrations ディレクトリの場所を指定）
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
+# 一括INSERT（executemany）を複数行のVALUES句にまとめる際の1文あたりの行数
+INSERT_PAGE_SIZE = 1000
+
+def _json_serializer(value) -> str:
+    """JSON型カラムの値をorjsonでJSON文字列に変換（aiohttpのヘッダー名など、strのサブクラスのキーも許可）"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 # SQLAlchemyエンジンの作成
 if DATABASE_URL.startswith("sqlite"):
     # SQLite用の設定
     engine = create_engine(
         DATABASE_URL, 
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        insertmanyvalues_page_size=INSERT_PAGE_SIZE,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads
     )
+    
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        接続ごとにSQLiteの書き込み設定を調整
+        
+        WALモードでは読み取りと書き込みが互いにブロックせず、synchronous=NORMAL により
+        コミットごとのfsyncをチェックポイント時のみに減らします。
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-16384")  # 接続あたり16MiBのページキャッシュ
+        cursor.close()
 else:
     # PostgreSQL用の設定
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(
+        DATABASE_URL,
+        insertmanyvalues_page_size=INSERT_PAGE_SIZE,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads
+    )
 
 # セッションクラスの作成
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -49,31 +85,15 @@ class FuzzerRequest(Base):
     
     id = Column(Integer, primary_key=True, index=True, comment="リクエストの一意識別子")
     template = Column(Text, nullable=False, comment="プレースホルダを含むテンプレート文字列")
-    placeholders = Column(Text, nullable=False, comment="プレースホルダ名のリスト（JSON形式）")
+    placeholders = Column(JSON, nullable=False, comment="プレースホルダ名のリスト（JSON形式）")
     strategy = Column(String(50), nullable=False, comment="攻撃戦略（sniper, battering_ram, pitchfork, cluster_bomb）")
-    payload_sets = Column(Text, nullable=False, comment="ペイロードセットのリスト（JSON形式）")
+    payload_sets = Column(JSON, nullable=False, comment="ペイロードセットのリスト（JSON形式）")
     total_requests = Column(Integer, nullable=False, comment="生成されたリクエストの総数")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="リクエスト作成日時")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="最終更新日時")
     
     # リレーションシップ: このリクエストから生成されたリクエストのリスト
     generated_requests = relationship("GeneratedRequest", back_populates="fuzzer_request", cascade="all, delete-orphan")
-    
-    def set_placeholders(self, placeholders: List[str]):
-        """プレースホルダリストをJSON形式で保存"""
-        self.placeholders = json.dumps(placeholders, ensure_ascii=False)
-    
-    def get_placeholders(self) -> List[str]:
-        """保存されたプレースホルダリストを取得"""
-        return json.loads(self.placeholders) if self.placeholders else []
-    
-    def set_payload_sets(self, payload_sets: List[dict]):
-        """ペイロードセットをJSON形式で保存"""
-        self.payload_sets = json.dumps(payload_sets, ensure_ascii=False)
-    
-    def get_payload_sets(self) -> List[dict]:
-        """保存されたペイロードセットを取得"""
-        return json.loads(self.payload_sets) if self.payload_sets else []
 
 class GeneratedRequest(Base):
     """
@@ -83,6 +103,10 @@ class GeneratedRequest(Base):
     各生成されたリクエストは、元のファザーリクエストに関連付けられます。
     """
     __tablename__ = "generated_requests"
+    __table_args__ = (
+        # ファザーリクエストごとの番号順の読み込みと、番号を指定した1件の取得に使用
+        Index("ix_generated_requests_fuzzer_request_id_request_number", "fuzzer_request_id", "request_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True, comment="生成されたリクエストの一意識別子")
     fuzzer_request_id = Column(Integer, ForeignKey("fuzzer_requests.id"), nullable=False, comment="元のファザーリクエストのID")
@@ -104,6 +128,25 @@ class GeneratedRequest(Base):
     def get_applied_to(self) -> List[str]:
         """保存された適用プレースホルダリストを取得"""
         return json.loads(self.applied_to) if self.applied_to else []
+    
+    def to_dict(self) -> dict:
+        """APIレスポンス用の辞書に変換（applied_toは保存されている場合のみ含める）"""
+        req_dict = {
+            "request": self.request_content,
+            "placeholder": self.placeholder,
+            "payload": self.payload,
+            "position": self.position
+        }
+        if self.applied_to:
+            req_dict["applied_to"] = json.loads(self.applied_to)
+        return req_dict
+
+def _to_datetime(value):
+    """ISO形式の日時文字列をdatetimeに変換（それ以外の値はそのまま返す）"""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+# 進捗情報のうち、jobsテーブルの専用カラムにも保存する項目
+_PROGRESS_COLUMNS = ('total_requests', 'completed_requests', 'start_time', 'end_time')
 
 class Job(Base):
     """
@@ -116,10 +159,14 @@ class Job(Base):
     
     id = Column(String(36), primary_key=True, index=True, comment="ジョブの一意識別子（UUID）")
     name = Column(String(255), nullable=False, comment="ジョブ名")
-    status = Column(String(20), nullable=False, comment="ジョブの状態（pending, running, completed, failed, cancelled）")
+    status = Column(String(20), nullable=False, index=True, comment="ジョブの状態（pending, running, completed, failed, cancelled）")
     fuzzer_request_id = Column(Integer, ForeignKey("fuzzer_requests.id"), nullable=False, comment="関連するファザーリクエストのID")
     http_config = Column(JSON, nullable=True, comment="HTTP設定（JSON形式）")
     progress = Column(JSON, nullable=False, comment="進捗情報（JSON形式）")
+    total_requests = Column(Integer, nullable=True, comment="総リクエスト数")
+    completed_requests = Column(Integer, nullable=True, comment="完了したリクエスト数")
+    start_time = Column(DateTime, nullable=True, comment="実行開始日時")
+    end_time = Column(DateTime, nullable=True, comment="実行終了日時")
     error_message = Column(Text, nullable=True, comment="エラーメッセージ")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="作成日時")
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), comment="最終更新日時")
@@ -128,12 +175,24 @@ class Job(Base):
     results = relationship("JobResult", back_populates="job", cascade="all, delete-orphan")
     
     def set_progress(self, progress: dict):
-        """進捗情報をJSON形式で保存"""
+        """進捗情報をJSON形式で保存（主要な項目は専用カラムにも保存）"""
         self.progress = json.dumps(progress, ensure_ascii=False)
+        self.total_requests = progress.get('total_requests')
+        self.completed_requests = progress.get('completed_requests')
+        self.start_time = _to_datetime(progress.get('start_time'))
+        self.end_time = _to_datetime(progress.get('end_time'))
     
     def get_progress(self) -> dict:
-        """保存された進捗情報を取得"""
-        return json.loads(self.progress) if self.progress else {}
+        """保存された進捗情報を取得（日時はdatetimeオブジェクトで返す）"""
+        progress = json.loads(self.progress) if self.progress else {}
+        for key in _PROGRESS_COLUMNS:
+            value = getattr(self, key)
+            if value is not None:
+                progress[key] = value
+            elif key in progress:
+                # 専用カラム追加前に保存されたジョブはJSONの値を変換して使用
+                progress[key] = _to_datetime(progress[key])
+        return progress
 
 class JobResult(Base):
     """
@@ -198,8 +257,22 @@ class DatabaseManager:
         self.SessionLocal = SessionLocal
     
     def create_tables(self):
-        """データベーステーブルを作成"""
-        Base.metadata.create_all(bind=self.engine)
+        """
+        データベーステーブルを作成し、マイグレーションを適用
+        
+        新規のデータベースはモデルからテーブルを作成して最新のリビジョンとして記録します。
+        マイグレーション導入前に作成されたデータベースは起点のリビジョン（0001）として記録してから、
+        alembic のマイグレーション（migrations/versions）で最新のスキーマに更新します。
+        """
+        config = AlembicConfig(ALEMBIC_INI)
+        with self.engine.begin() as conn:
+            config.attributes["connection"] = conn
+            tables = set(inspect(conn).get_table_names())
+            if "alembic_version" not in tables:
+                existing = tables & set(Base.metadata.tables)
+                Base.metadata.create_all(bind=conn)
+                alembic_command.stamp(config, "0001" if existing else "head")
+            alembic_command.upgrade(config, "head")
     
     def get_db(self):
         """データベースセッションを取得"""
@@ -211,54 +284,107 @@ class DatabaseManager:
     
     def save_fuzzer_request(self, db, template: str, placeholders: List[str], 
                           strategy: str, payload_sets: List[dict], 
-                          generated_requests: List[dict]) -> FuzzerRequest:
+                          generated_requests: List[Any], chunk_size: int = INSERT_PAGE_SIZE) -> int:
         """
         ファザーリクエストと生成されたリクエストを保存
         
+        ファザーリクエストのIDは INSERT ... RETURNING で取得し（ORMのrefreshによる再SELECTなし）、
+        生成されたリクエストは chunk_size件ごとにまとめて一括INSERTします。コミットは最後の1回のみです。
+        
         Args:
             db: データベースセッション
             template (str): プレースホルダを含むテンプレート文字列
             placeholders (List[str]): プレースホルダ名のリスト
             strategy (str): 攻撃戦略
             payload_sets (List[dict]): ペイロードセットのリスト
-            generated_requests (List[dict]): 生成されたリクエストのリスト
+            generated_requests (List[Any]): 生成されたリクエスト（request, placeholder, payload, position, applied_to 属性を持つ）のリスト
+            chunk_size (int): 1回のINSERTにまとめる件数
             
         Returns:
-            FuzzerRequest: 保存されたファザーリクエストオブジェクト
+            int: 保存されたファザーリクエストのID
         """
-        # ファザーリクエストを作成
-        fuzzer_request = FuzzerRequest(
-            template=template,
-            strategy=strategy,
-            total_requests=len(generated_requests)
+        fuzzer_request_id = self.create_fuzzer_request(
+            db, template, placeholders, strategy, payload_sets, total_requests=len(generated_requests)
         )
-        fuzzer_request.set_placeholders(placeholders)
-        fuzzer_request.set_payload_sets(payload_sets)
+        self.save_generated_requests(db, fuzzer_request_id, generated_requests, chunk_size=chunk_size)
+        return fuzzer_request_id
+    
+    def create_fuzzer_request(self, db, template: str, placeholders: List[str], strategy: str,
+                              payload_sets: List[dict], total_requests: int = 0) -> int:
+        """
+        ファザーリクエストのみを INSERT ... RETURNING で追加（コミットは呼び出し元で行う）
         
-        # データベースに保存
-        db.add(fuzzer_request)
-        db.commit()
-        db.refresh(fuzzer_request)
-        
-        # 生成されたリクエストを保存
-        for i, req in enumerate(generated_requests):
-            generated_request = GeneratedRequest(
-                fuzzer_request_id=fuzzer_request.id,
-                request_number=i + 1,
-                request_content=req.get("request", ""),
-                placeholder=req.get("placeholder"),
-                payload=req.get("payload"),
-                position=req.get("position")
-            )
+        Args:
+            db: データベースセッション
+            template (str): プレースホルダを含むテンプレート文字列
+            placeholders (List[str]): プレースホルダ名のリスト
+            strategy (str): 攻撃戦略
+            payload_sets (List[dict]): ペイロードセットのリスト
+            total_requests (int): 生成されたリクエストの総数
             
-            # applied_toフィールドがある場合は保存
-            if "applied_to" in req:
-                generated_request.set_applied_to(req["applied_to"])
+        Returns:
+            int: 追加されたファザーリクエストのID
+        """
+        # placeholders と payload_sets はJSON型カラムのため、リストのまま渡す
+        return db.execute(
+            insert(FuzzerRequest)
+            .values(
+                template=template,
+                placeholders=placeholders,
+                strategy=strategy,
+                payload_sets=payload_sets,
+                total_requests=total_requests
+            )
+            .returning(FuzzerRequest.id)
+        ).scalar_one()
+    
+    def save_generated_requests(self, db, fuzzer_request_id: int, generated_requests: List[Any],
+                                chunk_size: int = INSERT_PAGE_SIZE, start_number: int = 1) -> int:
+        """
+        生成されたリクエストを chunk_size件ごとにまとめて一括INSERTし、コミット
+        
+        Args:
+            db: データベースセッション
+            fuzzer_request_id (int): ファザーリクエストのID
+            generated_requests (List[Any]): 生成されたリクエスト（request, placeholder, payload, position, applied_to 属性を持つ）のリスト
+            chunk_size (int): 1回のINSERTにまとめる件数
+            start_number (int): 先頭のリクエストのリクエスト番号
             
-            db.add(generated_request)
+        Returns:
+            int: 保存されたリクエストの件数
+        """
+        for start in range(0, len(generated_requests), chunk_size):
+            rows = [
+                {
+                    'fuzzer_request_id': fuzzer_request_id,
+                    'request_number': start_number + start + i,
+                    'request_content': req.request,
+                    'placeholder': req.placeholder,
+                    'payload': req.payload,
+                    'position': req.position,
+                    # GeneratedRequest.set_applied_to と同じ形式で保存
+                    'applied_to': json.dumps(req.applied_to, ensure_ascii=False) if req.applied_to else None
+                }
+                for i, req in enumerate(generated_requests[start:start + chunk_size])
+            ]
+            db.execute(insert(GeneratedRequest), rows)
         
         db.commit()
-        return fuzzer_request
+        return len(generated_requests)
+    
+    def update_fuzzer_request_total(self, db, fuzzer_request_id: int, total_requests: int) -> None:
+        """
+        ファザーリクエストの生成されたリクエストの総数を更新
+        
+        Args:
+            db: データベースセッション
+            fuzzer_request_id (int): ファザーリクエストのID
+            total_requests (int): 生成されたリクエストの総数
+        """
+        db.query(FuzzerRequest).filter(FuzzerRequest.id == fuzzer_request_id).update(
+            {FuzzerRequest.total_requests: total_requests}, synchronize_session=False
+        )
+        db.commit()
     
     def get_all_fuzzer_requests(self, db, limit: int = 100, offset: int = 0) -> List[FuzzerRequest]:
         """
@@ -285,7 +411,55 @@ class DatabaseManager:
         Returns:
             Optional[FuzzerRequest]: ファザーリクエストオブジェクト（見つからない場合はNone）
         """
-        return db.query(FuzzerRequest).filter(FuzzerRequest.id == request_id).first()
+        # 生成されたリクエストは SELECT ... IN の1クエリでまとめて読み込む
+        return (db.query(FuzzerRequest)
+                .options(selectinload(FuzzerRequest.generated_requests))
+                .filter(FuzzerRequest.id == request_id)
+                .first())
+    
+    def get_generated_request(self, db, fuzzer_request_id: int, request_number: int) -> Optional[GeneratedRequest]:
+        """
+        指定されたファザーリクエストの、指定された番号の生成されたリクエストのみを取得
+        
+        Args:
+            db: データベースセッション
+            fuzzer_request_id (int): ファザーリクエストのID
+            request_number (int): リクエスト番号（1始まり）
+            
+        Returns:
+            Optional[GeneratedRequest]: 生成されたリクエスト（見つからない場合はNone）
+        """
+        return (db.query(GeneratedRequest)
+                .filter(GeneratedRequest.fuzzer_request_id == fuzzer_request_id,
+                        GeneratedRequest.request_number == request_number)
+                .first())
+    
+    def get_fuzzer_request_total(self, db, request_id: int) -> Optional[int]:
+        """
+        指定されたIDのファザーリクエストの、生成されたリクエストの総数を取得（生成されたリクエストは読み込まない）
+        
+        Args:
+            db: データベースセッション
+            request_id (int): ファザーリクエストのID
+            
+        Returns:
+            Optional[int]: 生成されたリクエストの総数（ファザーリクエストが見つからない場合はNone）
+        """
+        row = db.query(FuzzerRequest.total_requests).filter(FuzzerRequest.id == request_id).first()
+        return row[0] if row is not None else None
+    
+    def fuzzer_request_exists(self, db, request_id: int) -> bool:
+        """
+        指定されたIDのファザーリクエストが存在するかを確認（生成されたリクエストは読み込まない）
+        
+        Args:
+            db: データベースセッション
+            request_id (int): ファザーリクエストのID
+            
+        Returns:
+            bool: 存在する場合はTrue
+        """
+        return db.query(FuzzerRequest.id).filter(FuzzerRequest.id == request_id).first() is not None
     
     def delete_fuzzer_request(self, db, request_id: int) -> bool:
         """
@@ -333,7 +507,7 @@ class DatabaseManager:
     # ジョブ関連の操作メソッド
     def save_job(self, db, job_id: str, name: str, status: str, fuzzer_request_id: int, 
                  http_config: Optional[dict] = None, progress: Optional[dict] = None, 
-                 error_message: Optional[str] = None) -> Job:
+                 error_message: Optional[str] = None, created_at: Optional[datetime] = None) -> Job:
         """
         ジョブを保存
         
@@ -346,6 +520,7 @@ class DatabaseManager:
             http_config (Optional[dict]): HTTP設定
             progress (Optional[dict]): 進捗情報
             error_message (Optional[str]): エラーメッセージ
+            created_at (Optional[datetime]): 作成日時（Noneの場合はデータベースの現在時刻）
             
         Returns:
             Job: 保存されたジョブオブジェクト
@@ -358,6 +533,8 @@ class DatabaseManager:
             http_config=http_config,
             error_message=error_message
         )
+        if created_at is not None:
+            job.created_at = created_at
         
         if progress:
             job.set_progress(progress)
@@ -381,6 +558,70 @@ class DatabaseManager:
         """
         return db.query(Job).order_by(Job.created_at.desc()).all()
     
+    def get_jobs_page(self, db, status: Optional[str] = None, limit: Optional[int] = None, offset: int = 0,
+                      before: Optional[Tuple[float, str]] = None) -> List[Job]:
+        """
+        ジョブを作成日時の新しい順（同時刻の場合はIDの降順）に取得
+        
+        Args:
+            db: データベースセッション
+            status (Optional[str]): 絞り込むジョブの状態（Noneの場合は全て）
+            limit (Optional[int]): 取得件数の制限（Noneの場合は制限なし）
+            offset (int): オフセット
+            before (Optional[Tuple[float, str]]): 指定された場合、この（作成日時のタイムスタンプ, ジョブID）より
+                古いジョブのみを取得
+            
+        Returns:
+            List[Job]: ジョブのリスト
+        """
+        query = db.query(Job)
+        if status is not None:
+            query = query.filter(Job.status == status)
+        if before is not None:
+            timestamp, job_id = before
+            created_at = self._created_at_from_timestamp(timestamp)
+            query = query.filter(or_(Job.created_at < created_at,
+                                     and_(Job.created_at == created_at, Job.id < job_id)))
+        query = query.order_by(Job.created_at.desc(), Job.id.desc()).offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+    
+    def _created_at_from_timestamp(self, timestamp: float) -> datetime:
+        """タイムスタンプをジョブの作成日時と比較できる日時に変換"""
+        # SQLiteはタイムゾーンなしのローカル日時、それ以外はタイムゾーン付きの日時として比較
+        if self.engine.dialect.name == "sqlite":
+            return datetime.fromtimestamp(timestamp)
+        return datetime.fromtimestamp(timestamp, timezone.utc)
+    
+    def count_jobs(self, db, status: Optional[str] = None) -> int:
+        """
+        ジョブ数を取得
+        
+        Args:
+            db: データベースセッション
+            status (Optional[str]): 絞り込むジョブの状態（Noneの場合は全て）
+            
+        Returns:
+            int: ジョブ数
+        """
+        query = db.query(func.count(Job.id))
+        if status is not None:
+            query = query.filter(Job.status == status)
+        return query.scalar()
+    
+    def get_pending_jobs(self, db) -> List[Job]:
+        """
+        実行待ちのジョブを取得（statusのインデックスを使用）
+        
+        Args:
+            db: データベースセッション
+            
+        Returns:
+            List[Job]: 実行待ちのジョブのリスト（作成日時の古い順）
+        """
+        return db.query(Job).filter(Job.status == "pending").order_by(Job.created_at).all()
+    
     def get_job_by_id(self, db, job_id: str) -> Optional[Job]:
         """
         指定されたIDのジョブを取得
@@ -426,7 +667,9 @@ class DatabaseManager:
     
     def delete_job(self, db, job_id: str) -> bool:
         """
-        指定されたIDのジョブを削除
+        指定されたIDのジョブを実行結果とともに削除
+        
+        実行結果は1件ずつ読み込まず、一括で削除します。
         
         Args:
             db: データベースセッション
@@ -435,51 +678,92 @@ class DatabaseManager:
         Returns:
             bool: 削除が成功した場合はTrue
         """
-        job = db.query(Job).filter(Job.id == job_id).first()
-        if job:
-            db.delete(job)
-            db.commit()
-            return True
-        return False
+        db.query(JobResult).filter(JobResult.job_id == job_id).delete(synchronize_session=False)
+        deleted = db.query(Job).filter(Job.id == job_id).delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
     
-    def save_job_results(self, db, job_id: str, results: List[dict]) -> List[JobResult]:
+    def delete_jobs_created_before(self, db, timestamp: float, statuses: List[str]) -> List[str]:
+        """
+        指定された日時より前に作成された、指定された状態のジョブを実行結果とともに削除
+        
+        Args:
+            db: データベースセッション
+            timestamp (float): 作成日時のタイムスタンプ（これより前に作成されたジョブが対象）
+            statuses (List[str]): 対象とするジョブの状態
+            
+        Returns:
+            List[str]: 削除されたジョブのIDのリスト
+        """
+        condition = and_(Job.created_at < self._created_at_from_timestamp(timestamp), Job.status.in_(statuses))
+        job_ids = [job_id for job_id, in db.query(Job.id).filter(condition)]
+        if job_ids:
+            target_ids = db.query(Job.id).filter(condition).scalar_subquery()
+            db.query(JobResult).filter(JobResult.job_id.in_(target_ids)).delete(synchronize_session=False)
+            db.query(Job).filter(condition).delete(synchronize_session=False)
+        db.commit()
+        return job_ids
+    
+    def save_job_results(self, db, job_id: str, results: List[dict], chunk_size: int = INSERT_PAGE_SIZE,
+                         start_number: int = 1, request_numbers: Optional[List[int]] = None) -> int:
         """
         ジョブの実行結果を保存
         
+        1行ずつINSERTせず、chunk_size件ごとにまとめて一括INSERTします。
+        
         Args:
             db: データベースセッション
             job_id (str): ジョブID
             results (List[dict]): 実行結果のリスト
+            chunk_size (int): 1回のINSERTにまとめる件数
+            start_number (int): 先頭の結果のリクエスト番号
+            request_numbers (Optional[List[int]]): 各結果のリクエスト番号（省略時は start_number からの連番）
             
         Returns:
-            List[JobResult]: 保存された実行結果のリスト
+            int: 保存された実行結果の件数
         """
-        job_results = []
+        rows = []
+        if request_numbers is None:
+            request_numbers = range(start_number, start_number + len(results))
         
-        for i, result in enumerate(results):
+        for request_number, result in zip(request_numbers, results):
             http_response = result.get('http_response', {})
             is_success = not http_response.get('error')
             
-            job_result = JobResult(
-                job_id=job_id,
-                request_number=i + 1,
-                request_content=result.get('request', ''),
-                placeholder=result.get('placeholder'),
-                payload=result.get('payload'),
-                position=result.get('position'),
-                success=1 if is_success else 0,
-                error_message=http_response.get('error'),
-                elapsed_time=int(http_response.get('elapsed_time', 0) * 1000) if http_response.get('elapsed_time') else None
-            )
-            
-            if http_response:
-                job_result.set_http_response(http_response)
-            
-            db.add(job_result)
-            job_results.append(job_result)
+            rows.append({
+                'job_id': job_id,
+                'request_number': request_number,
+                'request_content': result.get('request', ''),
+                'placeholder': result.get('placeholder'),
+                'payload': result.get('payload'),
+                'position': result.get('position'),
+                # JobResult.set_http_response と同じ形式で保存
+                'http_response': json.dumps(http_response, ensure_ascii=False) if http_response else None,
+                'success': 1 if is_success else 0,
+                'error_message': http_response.get('error'),
+                'elapsed_time': int(http_response.get('elapsed_time', 0) * 1000) if http_response.get('elapsed_time') else None
+            })
+        
+        for start in range(0, len(rows), chunk_size):
+            db.execute(insert(JobResult), rows[start:start + chunk_size])
         
         db.commit()
-        return job_results
+        return len(rows)
+    
+    def delete_job_results(self, db, job_id: str) -> int:
+        """
+        ジョブの実行結果を削除
+        
+        Args:
+            db: データベースセッション
+            job_id (str): ジョブID
+            
+        Returns:
+            int: 削除された実行結果の件数
+        """
+        deleted = db.query(JobResult).filter(JobResult.job_id == job_id).delete(synchronize_session=False)
+        db.commit()
+        return deleted
     
     def get_job_results(self, db, job_id: str) -> List[dict]:
         """
@@ -518,47 +802,40 @@ class DatabaseManager:
             # エラーが発生した場合は空のリストを返す
             return []
     
-    def get_job_statistics(self, db) -> dict:
+    def get_job_statistics_grouped(self, db) -> dict:
         """
-        ジョブの統計情報を取得
+        ジョブの統計情報を1回のGROUP BYクエリで取得
         
         Args:
             db: データベースセッション
             
         Returns:
-            dict: ジョブ統計情報
+            dict: 状態別のジョブ数（by_status）と、完了ジョブの総リクエスト数・平均実行時間（秒）
         """
-        total_jobs = db.query(Job).count()
+        # 作成から最終更新までの秒数（方言ごとに日時の差の求め方が異なる）
+        if self.engine.dialect.name == "sqlite":
+            execution_time = (func.julianday(Job.updated_at) - func.julianday(Job.created_at)) * 86400
+        else:
+            execution_time = func.extract("epoch", Job.updated_at - Job.created_at)
         
-        # 状態別の統計
-        status_counts = {}
-        for status in ["pending", "running", "completed", "failed", "cancelled"]:
-            count = db.query(Job).filter(Job.status == status).count()
-            status_counts[status] = count
+        rows = db.query(
+            Job.status,
+            func.count(Job.id),
+            func.sum(Job.total_requests),
+            func.avg(execution_time)
+        ).group_by(Job.status).all()
         
-        # 総リクエスト数と平均実行時間
+        by_status = {}
         total_requests = 0
-        total_execution_time = 0
-        completed_jobs = 0
-        
-        for job in db.query(Job).filter(Job.status == "completed").all():
-            progress = job.get_progress()
-            total_requests += progress.get('total_requests', 0)
-            
-            if job.created_at and job.updated_at:
-                execution_time = (job.updated_at - job.created_at).total_seconds()
-                total_execution_time += execution_time
-                completed_jobs += 1
-        
-        avg_execution_time = total_execution_time / completed_jobs if completed_jobs > 0 else 0
+        avg_execution_time = 0
+        for status, count, requests_sum, avg_time in rows:
+            by_status[status] = count
+            if status == "completed":
+                total_requests = requests_sum or 0
+                avg_execution_time = float(avg_time) if avg_time is not None else 0
         
         return {
-            "total_jobs": total_jobs,
-            "pending_jobs": status_counts.get("pending", 0),
-            "running_jobs": status_counts.get("running", 0),
-            "completed_jobs": status_counts.get("completed", 0),
-            "failed_jobs": status_counts.get("failed", 0),
-            "cancelled_jobs": status_counts.get("cancelled", 0),
+            "by_status": by_status,
             "total_requests": total_requests,
             "avg_execution_time": avg_execution_time
         }
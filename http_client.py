@@ -6,8 +6,8 @@ HTTPリクエスト送信機能
 
 import aiohttp
 import asyncio
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 import json
 import re
 from urllib.parse import urlparse
@@ -17,6 +17,51 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 共有接続プールの上限（全ジョブ合計の同時接続数）
+MAX_CONNECTIONS = 1000
+# 同一ホストへの同時接続数の上限（ファジング対象は通常1ホストのため、実質的な上限はこちら）
+MAX_CONNECTIONS_PER_HOST = 100
+# 使用後の接続をキープアライブで保持する秒数
+KEEPALIVE_TIMEOUT = 30
+# DNS解決結果をキャッシュする秒数
+DNS_CACHE_TTL = 300
+# 1回の並列実行で同時に送信するリクエスト数の上限
+MAX_CONCURRENT_REQUESTS = 100
+
+# イベントループごとに共有する接続プール（aiohttpの接続プールは作成したループでのみ使用可能）
+_shared_connectors: Dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector] = {}
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """
+    実行中のイベントループで共有する接続プールを取得（初回呼び出し時に作成）
+    
+    リクエストのたびに接続プールを作成せず、キープアライブ中の接続を再利用することで、
+    TCP/TLSの接続確立を繰り返さないようにします。クッキーは共有せず、
+    HTTPClient ごとのセッションが個別に保持します。
+    
+    Returns:
+        aiohttp.TCPConnector: 共有の接続プール
+    """
+    loop = asyncio.get_running_loop()
+    connector = _shared_connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            verify_ssl=False,
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            enable_cleanup_closed=True
+        )
+        _shared_connectors[loop] = connector
+    return connector
+
+async def close_shared_connector() -> None:
+    """実行中のイベントループで共有している接続プールを閉じる（ループの終了前に呼び出す）"""
+    connector = _shared_connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
+
 @dataclass
 class HTTPRequestConfig:
     """HTTPリクエスト設定"""
@@ -29,6 +74,17 @@ class HTTPRequestConfig:
     base_url: str = "localhost:8000"  # ベースURL（スキームなし）
     sequential_execution: bool = False  # True: 同期実行（順次）, False: 並列実行
     request_delay: float = 0.0  # リクエスト間の待機時間（秒）
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS  # 並列実行時に同時に送信するリクエスト数の上限
+    _client_timeout: Optional[aiohttp.ClientTimeout] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        """aiohttpのタイムアウト設定（同じ設定で送信するリクエスト間で1つのオブジェクトを共有）"""
+        client_timeout = self._client_timeout
+        # 生成後に timeout が変更された場合は作り直す
+        if client_timeout is None or client_timeout.total != self.timeout:
+            client_timeout = self._client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+        return client_timeout
 
 @dataclass
 class HTTPResponse:
@@ -44,19 +100,34 @@ class HTTPResponse:
 class HTTPClient:
     """HTTPリクエスト送信クライアント"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Args:
+            session (Optional[aiohttp.ClientSession]): 使用するHTTPセッション
+                （Noneの場合は共有の接続プールを使うセッションを作成）
+        """
+        self._session = session
         self.session = None
     
     async def __aenter__(self):
-        """非同期コンテキストマネージャーの開始"""
-        connector = aiohttp.TCPConnector(verify_ssl=False)
-        self.session = aiohttp.ClientSession(connector=connector)
+        """
+        非同期コンテキストマネージャーの開始
+        
+        セッションの指定がなければ、共有の接続プールを使うセッションを作成します。
+        クッキーはこのセッション（ジョブや個別実行の単位）の中でのみ保持され、
+        他のジョブやユーザーのリクエストに送信されることはありません。
+        """
+        if self._session is not None:
+            self.session = self._session
+        else:
+            self.session = aiohttp.ClientSession(connector=get_shared_connector(), connector_owner=False)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """非同期コンテキストマネージャーの終了"""
-        if self.session:
+        """非同期コンテキストマネージャーの終了（作成したセッションのみ閉じ、接続プールは再利用する）"""
+        if self._session is None and self.session is not None:
             await self.session.close()
+        self.session = None
     
     def encode_url_query(self, query: str) -> str:
         """
@@ -344,7 +415,6 @@ class HTTPClient:
             # リクエスト1行目のパス部分を抽出
             if request_url.startswith(('http://', 'https://')):
                 # 完全なURLの場合はパス部分のみを抽出
-                from urllib.parse import urlparse
                 parsed_url = urlparse(request_url)
                 path = parsed_url.path
                 
@@ -456,7 +526,7 @@ class HTTPClient:
                 "method": parsed["method"],
                 "url": url,
                 "headers": headers,
-                "timeout": aiohttp.ClientTimeout(total=config.timeout),
+                "timeout": config.client_timeout,
                 "allow_redirects": config.follow_redirects
             }
             
@@ -538,10 +608,25 @@ class HTTPClient:
             config (HTTPRequestConfig): リクエスト設定
             
         Returns:
-            List[HTTPResponse]: レスポンス情報のリスト
+            List[HTTPResponse]: レスポンス情報のリスト（送信に失敗したリクエストは例外オブジェクト）
         """
-        tasks = [self.send_request(req, config) for req in requests]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        if config is None:
+            config = HTTPRequestConfig()
+        
+        # 同時に送信するリクエスト数を制限し、接続プールの空き待ちや一時的なメモリ増加を抑える
+        semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+        
+        async def bounded(req: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self.send_request(req, config)
+                except Exception as e:
+                    # 1件の失敗で他のリクエストを中断しないよう、例外は結果として返す
+                    return e
+        
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(bounded(req)) for req in requests]
+        return [task.result() for task in tasks]
     
     async def send_multiple_requests_sequential(self, requests: List[str], config: HTTPRequestConfig = None) -> List[HTTPResponse]:
         """
@@ -584,13 +669,16 @@ class RequestExecutor:
     """リクエスト実行クラス"""
     
     @staticmethod
-    async def execute_requests(requests: List[Dict[str, Any]], config: HTTPRequestConfig = None) -> List[Dict[str, Any]]:
+    async def execute_requests(requests: List[Dict[str, Any]], config: HTTPRequestConfig = None,
+                               session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
         """
         生成されたリクエストを実行
         
         Args:
             requests (List[Dict[str, Any]]): 生成されたリクエストのリスト
             config (HTTPRequestConfig): リクエスト設定
+            session (Optional[aiohttp.ClientSession]): 使用するHTTPセッション
+                （Noneの場合は共有の接続プールを使うセッションを作成）
             
         Returns:
             List[Dict[str, Any]]: 実行結果のリスト
@@ -598,7 +686,7 @@ class RequestExecutor:
         if config is None:
             config = HTTPRequestConfig()
             
-        async with HTTPClient() as client:
+        async with HTTPClient(session) as client:
             # リクエスト文字列を抽出
             request_texts = [req["request"] for req in requests]
             
@@ -610,8 +698,8 @@ class RequestExecutor:
                 print(f"並列実行モード: {len(request_texts)}件のリクエストを並列実行します")
                 responses = await client.send_multiple_requests(request_texts, config)
             
-            # 結果を結合
-            results = []
+            # 結果を結合（件数は確定しているため、リストを事前に確保）
+            results = [None] * min(len(requests), len(responses))
             for i, (request, response) in enumerate(zip(requests, responses)):
                 print(f"DEBUG: RequestExecutor - リクエスト {i+1} データ: {request}")
                 if isinstance(response, Exception):
@@ -649,6 +737,6 @@ class RequestExecutor:
                         }
                     }
                 print(f"DEBUG: RequestExecutor - 結果データ: {result}")
-                results.append(result)
+                results[i] = result
             
             return results 
\ No newline at end of file
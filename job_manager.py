@@ -6,30 +6,126 @@ JobManager - バックグラウンドジョブ管理システム
 """
 
 import asyncio
-import uuid
+import heapq
+import logging
+import os
+import secrets
+import hashlib
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
-from enum import Enum
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Optional, Any, Callable, Set, Tuple
+from enum import IntEnum
+from collections import OrderedDict
+from collections.abc import Mapping
 import threading
-from dataclasses import dataclass, asdict
+import _thread
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import json
+import orjson
+
+try:
+    # 利用可能であれば、ジョブ処理スレッドのイベントループに uvloop を使用
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # データベース関連のインポート
 from database import db_manager, Job as DBJob, JobResult as DBJobResult
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import scoped_session
+
+# リクエストごとの詳細はDEBUGレベルで出力（環境変数 JOB_LOG_LEVEL で変更可能）
+logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv('JOB_LOG_LEVEL', 'INFO').upper())
+
+
+class _RateLimitFilter(logging.Filter):
+    """
+    ポーリング経路のエラーログを間引くフィルター
+    
+    extra={'rate_limited': True} を指定したログのみを対象とし、
+    同じメッセージは interval 秒に1回だけ出力します。
+    """
+
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self._interval = interval
+        self._last_emit: Dict[str, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, 'rate_limited', False):
+            return True
+        now = time.monotonic()
+        last = self._last_emit.get(record.msg)
+        if last is not None and now - last < self._interval:
+            return False
+        self._last_emit[record.msg] = now
+        return True
+
+
+logger.addFilter(_RateLimitFilter())
+
+
+class JobStatus(IntEnum):
+    """
+    ジョブの状態を表す列挙型
+
+    内部では整数値で保持し、APIやデータベースとの境界でのみ文字列ラベルに変換します。
+    """
+    PENDING = 0    # 待機中
+    RUNNING = 1    # 実行中
+    COMPLETED = 2  # 完了
+    FAILED = 3     # 失敗
+    CANCELLED = 4  # キャンセル
+
+    @property
+    def label(self) -> str:
+        """文字列ラベル（"pending"など）"""
+        return _JOB_STATUS_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> 'JobStatus':
+        """文字列ラベルから列挙値を取得"""
+        return _JOB_STATUS_BY_LABEL[label]
+
+
+_JOB_STATUS_LABELS = tuple(status.name.lower() for status in JobStatus)
+_JOB_STATUS_BY_LABEL = {label: status for status, label in zip(JobStatus, _JOB_STATUS_LABELS)}
+
+class _StatusDistribution(Mapping):
+    """
+    状態ラベルごとのジョブ数の読み取り専用ビュー
+    
+    各状態の件数は参照されたときにのみ求めます（dict() での展開やJSON変換も可能）。
+    """
+    __slots__ = ('_count',)
 
+    def __init__(self, count: Callable[[JobStatus], int]):
+        self._count = count
 
-class JobStatus(str, Enum):
-    """ジョブの状態を表す列挙型"""
-    PENDING = "pending"      # 待機中
-    RUNNING = "running"      # 実行中
-    COMPLETED = "completed"  # 完了
-    FAILED = "failed"        # 失敗
-    CANCELLED = "cancelled"  # キャンセル
+    def __getitem__(self, label: str) -> int:
+        return self._count(_JOB_STATUS_BY_LABEL[label])
 
+    def __iter__(self):
+        return iter(_JOB_STATUS_LABELS)
 
-@dataclass
+    def __len__(self) -> int:
+        return len(_JOB_STATUS_LABELS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+# 再開可能な状態
+_RESUMABLE_STATUSES = frozenset({JobStatus.CANCELLED, JobStatus.FAILED})
+# メモリから外してデータベースのみに残せる終了状態
+_EVICTABLE_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+# 実行結果が確定しており、データベースから読み込める状態
+_RESULTS_FINAL_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED})
+
+
+@dataclass(slots=True)
 class JobProgress:
     """ジョブの進捗状況"""
     total_requests: int = 0
@@ -43,17 +139,20 @@ class JobProgress:
 
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
-        result = asdict(self)
-        if self.start_time:
-            result['start_time'] = self.start_time.isoformat()
-        if self.end_time:
-            result['end_time'] = self.end_time.isoformat()
-        
-        # 計算プロパティを追加
-        result['progress_percentage'] = self.progress_percentage
-        result['elapsed_time'] = self.elapsed_time
-        
-        return result
+        # asdict()は各フィールドをdeepcopyするため、辞書リテラルで直接構築
+        return {
+            'total_requests': self.total_requests,
+            'completed_requests': self.completed_requests,
+            'successful_requests': self.successful_requests,
+            'failed_requests': self.failed_requests,
+            'current_request': self.current_request,
+            'start_time': self.start_time.isoformat() if self.start_time else None,
+            'end_time': self.end_time.isoformat() if self.end_time else None,
+            'estimated_remaining_time': self.estimated_remaining_time,
+            # 計算プロパティ
+            'progress_percentage': self.progress_percentage,
+            'elapsed_time': self.elapsed_time
+        }
 
     @property
     def progress_percentage(self) -> float:
@@ -71,7 +170,7 @@ class JobProgress:
         return (end - self.start_time).total_seconds()
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """ジョブ情報"""
     id: str
@@ -84,13 +183,29 @@ class Job:
     http_config: Optional[Dict[str, Any]] = None
     results: Optional[List[Dict[str, Any]]] = None
     error_message: Optional[str] = None
+    _static_json: bytes = field(default=b"", init=False, repr=False, compare=False)
+    # 終了したジョブのJSON（状態・更新日時と組で保持し、いずれかが変わったら作り直す）
+    _json_cache: Optional[Tuple[JobStatus, datetime, bytes]] = field(default=None, init=False, repr=False, compare=False)
+    _progress_flushed_at: float = field(default=0.0, init=False, repr=False, compare=False)
+    # 実行開始時に処理スレッドのイベントループ上で生成されるキャンセル通知
+    cancel_event: Optional[asyncio.Event] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # 不変フィールドは生成時に一度だけシリアライズしておく
+        self._static_json = orjson.dumps({
+            'id': self.id,
+            'name': self.name,
+            'created_at': self.created_at.isoformat(),
+            'request_id': self.request_id,
+            'http_config': self.http_config
+        })
 
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
         return {
             'id': self.id,
             'name': self.name,
-            'status': self.status.value,
+            'status': self.status.label,
             'progress': self.progress.to_dict(),
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
@@ -100,19 +215,219 @@ class Job:
             'error_message': self.error_message
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        JSONバイト列に変換（不変フィールドは事前シリアライズ済みの断片を再利用）
+        
+        終了したジョブは状態か更新日時が変わるまで内容が変化しないため、変換結果を再利用します。
+        実行結果を保持しているジョブは、大きなバイト列を重複して持たないようキャッシュしません。
+        """
+        # 状態の変更では更新日時が最後に書き込まれるため、先に読んだ組をキーにする
+        status, updated_at = self.status, self.updated_at
+        cache = self._json_cache
+        if cache is not None and cache[0] is status and cache[1] == updated_at and self.results is None:
+            return cache[2]
+        cacheable = self.progress.end_time is not None and self.results is None
+        data = self._encode_json()
+        if cacheable:
+            self._json_cache = (status, updated_at, data)
+        return data
+
+    def _encode_json(self) -> bytes:
+        """JSONバイト列を作成"""
+        mutable_json = orjson.dumps({
+            'status': self.status.label,
+            'progress': self.progress.to_dict(),
+            'updated_at': self.updated_at.isoformat(),
+            'results': self.results,
+            'error_message': self.error_message
+        }, option=orjson.OPT_NON_STR_KEYS)  # aiohttpのヘッダー名はstrのサブクラス
+        # {"id":...} と {"status":...} を1つのオブジェクトに結合
+        return self._static_json[:-1] + b',' + mutable_json[1:]
+
+    def to_status_json_bytes(self) -> bytes:
+        """状態・進捗のみのJSONバイト列に変換（実行結果は含めない）"""
+        return orjson.dumps({
+            'job_id': self.id,
+            'status': self.status.label,
+            'progress': self.progress.to_dict(),
+            'updated_at': self.updated_at.isoformat(),
+            'error_message': self.error_message
+        })
+
+
+@dataclass(slots=True)
+class RequestResult:
+    """1件のリクエストの実行結果（辞書への変換は保存・返却時に一度だけ行う）"""
+    request: str
+    placeholder: str
+    payload: str
+    position: int
+    status_code: int
+    headers: Dict[str, str]
+    body: str
+    url: str
+    elapsed_time: float
+    error: Optional[str] = None
+    actual_request: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        return {
+            "request": self.request,
+            "placeholder": self.placeholder,
+            "payload": self.payload,
+            "position": self.position,
+            "http_response": {
+                "status_code": self.status_code,
+                "headers": self.headers,
+                "body": self.body,
+                "url": self.url,
+                "elapsed_time": self.elapsed_time,
+                "error": self.error,
+                "actual_request": self.actual_request
+            }
+        }
+
+
+# データベース統計の取得に使うスレッドプール（呼び出し元をDBの応答待ちで長時間ブロックしない）
+_stats_executor = ThreadPoolExecutor(max_workers=2)
+# 統計取得スレッドごとに再利用するセッション（接続はトランザクション終了時にプールへ返却）
+_stats_session = scoped_session(db_manager.SessionLocal)
+
+
+# JobProgressの初期化に使える進捗フィールド
+_PROGRESS_FIELDS = frozenset({
+    'total_requests', 'completed_requests', 'successful_requests',
+    'failed_requests', 'current_request', 'start_time', 'end_time',
+    'estimated_remaining_time'
+})
+
+
+def _job_order_key(job: Job) -> Tuple[float, str]:
+    """ジョブ一覧の並び順のキー（作成日時、同時刻の場合はジョブID）"""
+    return job.created_at.timestamp(), job.id
+
+
+def job_cursor(job: Job) -> str:
+    """
+    ジョブ一覧のカーソルを作成（このジョブより古いジョブから続きを取得するために使用）
+    
+    Args:
+        job (Job): ページの最後のジョブ
+        
+    Returns:
+        str: カーソル文字列
+    """
+    timestamp, job_id = _job_order_key(job)
+    return f"{timestamp!r}_{job_id}"
+
+
+def parse_job_cursor(cursor: str) -> Tuple[float, str]:
+    """
+    ジョブ一覧のカーソルを解析
+    
+    Args:
+        cursor (str): job_cursor で作成したカーソル文字列
+        
+    Returns:
+        Tuple[float, str]: 並び順のキー
+        
+    Raises:
+        ValueError: カーソルの形式が正しくない場合
+    """
+    timestamp, separator, job_id = cursor.partition("_")
+    if not separator or not job_id:
+        raise ValueError(f"無効なカーソル: {cursor}")
+    return float(timestamp), job_id
+
+
+def _db_job_to_job(db_job: DBJob, results: Optional[List[Dict[str, Any]]] = None) -> Job:
+    """
+    データベースのジョブをメモリ内のJobオブジェクトに変換
+    
+    Args:
+        db_job (DBJob): データベースのジョブ
+        results (Optional[List[Dict[str, Any]]]): ジョブに設定する実行結果
+        
+    Returns:
+        Job: 変換後のジョブ
+    """
+    # 日時はデータベース層でdatetimeとして取得済み
+    progress_init_data = {k: v for k, v in db_job.get_progress().items() if k in _PROGRESS_FIELDS}
+    
+    return Job(
+        id=db_job.id,
+        name=db_job.name,
+        # 復元ループで呼ばれるため、classmethod を経由せずに辞書を直接参照
+        status=_JOB_STATUS_BY_LABEL[db_job.status],
+        progress=JobProgress(**progress_init_data),
+        created_at=db_job.created_at,
+        updated_at=db_job.updated_at,
+        request_id=db_job.fuzzer_request_id,
+        http_config=db_job.http_config,
+        results=results,
+        error_message=db_job.error_message
+    )
+
 
 class JobManager:
     """バックグラウンドジョブ管理クラス"""
     
+    # 属性はすべて __init__ と _start_job_processor で設定する（インスタンス辞書を持たない）
+    __slots__ = (
+        '_jobs', '_max_jobs_in_memory', '_status_counts', '_job_heap', '_lock', '_max_concurrent_jobs',
+        '_progress_flush_every', '_progress_flush_seconds',
+        '_stats_cache', '_stats_cache_ts', '_stats_invalidated_at', '_stats_ttl',
+        '_stats_inflight_lock', '_stats_future', '_stats_timeout', '_stats_version',
+        '_stats_result', '_stats_encoded',
+        '_db_pool_size', '_job_processor_active', '_running_tasks', '_results_loaded',
+        '_result_flush_size',
+        '_processor_loop', '_pending_queue', '_processor_tasks',
+        '_processor_task', '_processor_thread', '_cleanup_interval', '_cleanup_max_age_hours',
+        '_subscribers',
+    )
+    
     def __init__(self):
-        self._jobs: Dict[str, Job] = {}
-        self._lock = threading.Lock()
-        self._executor = None
+        # メモリ内のジョブ（終了した順に末尾へ移動し、上限を超えたら先頭の終了済みジョブから外す）
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._max_jobs_in_memory = 10_000
+        # 状態ごとのジョブ数（JobStatusの値をインデックスとし、状態遷移のたびに更新）
+        self._status_counts: List[int] = [0] * len(JobStatus)
+        # 作成日時の古い順に取り出せるヒープ（削除済みジョブのエントリは取り出し時に読み飛ばす）
+        self._job_heap: List[Tuple[float, str]] = []
+        # 非競合時のオーバーヘッドが最小の軽量ミューテックス
+        self._lock = _thread.allocate_lock()
         self._max_concurrent_jobs = 5
-        self._active_jobs = 0
-        self._db_session: Optional[Session] = None
+        # 進捗のデータベース反映は、この件数ごと、またはこの秒数経過ごとにまとめて行う
+        self._progress_flush_every = 50
+        self._progress_flush_seconds = 1.0
+        # データベース統計のキャッシュ（有効期限付き、同時に期限切れとなっても問い合わせは1回のみ）
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_ts = 0.0
+        self._stats_invalidated_at = 0.0
+        self._stats_ttl = 1.0
+        self._stats_inflight_lock = threading.Lock()
+        # 実行中のデータベース統計問い合わせ（この間に到着した呼び出しは同じ結果を待つ）
+        self._stats_future: Optional[Future] = None
+        self._stats_timeout = 2.0  # これ以上かかる場合はメモリ内の統計情報を返す
+        # 状態ごとのジョブ数が変わるたびに更新するバージョン番号
+        self._stats_version = 0
+        # 直近に返した統計情報（キー, 読み取り専用マッピング）と、そのJSON・ETag（マッピング, JSON, ETag）
+        self._stats_result: Optional[Tuple[Any, Mapping]] = None
+        self._stats_encoded: Optional[Tuple[Mapping, bytes, str]] = None
+        # 処理スレッドのイベントループで同期的なDB書き込みを実行するスレッド数
+        self._db_pool_size = int(os.getenv('DB_POOL', '8'))
         self._job_processor_active = True
         self._running_tasks: Dict[str, Any] = {}  # 実行中のタスクを追跡
+        # ジョブごとの変更通知の購読者（購読元のイベントループ, 通知用Event）
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        # データベースから実行結果を読み込み済みのジョブ（完了・再開時に無効化）
+        self._results_loaded: Set[str] = set()
+        self._result_flush_size = 200  # 実行結果をこの件数ごとにデータベースへ保存
+        # 古いジョブをこの秒数ごとにメモリから外す（0以下で定期クリーンアップを無効化）
+        self._cleanup_interval = float(os.getenv('JOB_CLEANUP_INTERVAL', '300'))
+        self._cleanup_max_age_hours = 24
         
         # 起動時にデータベースからジョブを復元
         self._restore_jobs_from_database()
@@ -120,171 +435,193 @@ class JobManager:
         # バックグラウンドでジョブを処理するスレッドを開始
         self._start_job_processor()
     
-    def _get_db_session(self) -> Session:
-        """データベースセッションを取得"""
-        if self._db_session is None:
-            self._db_session = db_manager.SessionLocal()
-        return self._db_session
-    
     def _restore_jobs_from_database(self):
         """データベースからジョブを復元"""
         try:
-            print("データベースからジョブを復元中...")
-            db = self._get_db_session()
-            db_jobs = db_manager.get_all_jobs(db)
+            logger.info("データベースからジョブを復元中...")
+            with db_manager.SessionLocal() as db:
+                db_jobs = db_manager.get_all_jobs(db)
             
             restored_count = 0
-            for db_job in db_jobs:
+            # 作成日時の古い順に登録し、上限を超えた場合は古い終了済みジョブから外す
+            for db_job in reversed(db_jobs):
                 try:
                     # データベースのジョブをメモリ内のJobオブジェクトに変換
-                    progress_data = db_job.get_progress()
-                    # JobProgressの有効なフィールドのみを抽出
-                    valid_fields = ['total_requests', 'completed_requests', 'successful_requests', 
-                                   'failed_requests', 'current_request', 'start_time', 'end_time', 
-                                   'estimated_remaining_time']
-                    progress_init_data = {k: v for k, v in progress_data.items() if k in valid_fields}
-                    
-                    # 日時文字列をdatetimeオブジェクトに変換
-                    if 'start_time' in progress_init_data and isinstance(progress_init_data['start_time'], str):
-                        progress_init_data['start_time'] = datetime.fromisoformat(progress_init_data['start_time'])
-                    if 'end_time' in progress_init_data and isinstance(progress_init_data['end_time'], str):
-                        progress_init_data['end_time'] = datetime.fromisoformat(progress_init_data['end_time'])
-                        
-                    progress = JobProgress(**progress_init_data)
-                    
-                    job = Job(
-                        id=db_job.id,
-                        name=db_job.name,
-                        status=JobStatus(db_job.status),
-                        progress=progress,
-                        created_at=db_job.created_at,
-                        updated_at=db_job.updated_at,
-                        request_id=db_job.fuzzer_request_id,
-                        http_config=db_job.http_config,
-                        results=[],
-                        error_message=db_job.error_message
-                    )
+                    job = _db_job_to_job(db_job)
                     
                     # メモリに復元
-                    with self._lock:
-                        self._jobs[db_job.id] = job
+                    self._lock.acquire()
+                    try:
+                        self._add_job(job)
+                    finally:
+                        self._lock.release()
                     
                     restored_count += 1
                     
                 except Exception as e:
-                    print(f"ジョブ {db_job.id} の復元に失敗: {e}")
+                    logger.error("ジョブ %s の復元に失敗: %s", db_job.id, e)
                     
-            print(f"データベースから {restored_count} 件のジョブを復元しました")
+            logger.info("データベースから %s 件のジョブを復元しました", restored_count)
             
         except Exception as e:
-            print(f"ジョブ復元時のエラー: {e}")
+            logger.error("ジョブ復元時のエラー: %s", e)
     
     def _start_job_processor(self):
         """バックグラウンドジョブ処理スレッドを開始"""
-        def job_processor():
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
+        # 処理スレッド専用のイベントループと、PENDINGジョブIDのキュー
+        self._processor_loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        # asyncio.to_thread で使用するDB書き込み用のスレッドプール
+        self._processor_loop.set_default_executor(ThreadPoolExecutor(max_workers=self._db_pool_size))
+        self._pending_queue: asyncio.Queue = asyncio.Queue()
+        self._processor_tasks = []  # 常駐するジョブワーカーのタスク
+        
+        # 復元されたPENDINGジョブを一度だけキューに投入（絞り込みはDB側で行う）
+        try:
+            with db_manager.SessionLocal() as db:
+                pending_job_ids = [db_job.id for db_job in db_manager.get_pending_jobs(db)]
+        except Exception as e:
+            logger.error("PENDINGジョブ取得エラー: %s", e)
+            pending_job_ids = []
+        for job_id in pending_job_ids:
+            if job_id in self._jobs:
+                self._pending_queue.put_nowait(job_id)
+        
+        async def job_worker():
+            # キューからジョブIDを1件ずつ取り出して実行（ジョブごとにタスクを作成しない）
+            # ジョブの実行はキャンセルを内部で処理して正常に戻るため、停止要求はフラグで判定する
             while self._job_processor_active:
+                job_id = await self._pending_queue.get()
                 try:
-                    # PENDING状態のジョブを探す
-                    pending_jobs = []
-                    with self._lock:
-                        for job in self._jobs.values():
-                            if job.status == JobStatus.PENDING:
-                                pending_jobs.append(job)
-                    
-                    if pending_jobs:
-                        print(f"バックグラウンド処理: {len(pending_jobs)}件のPENDINGジョブを発見")
-                    
-                    # PENDING状態のジョブを実行（一つずつ）
-                    for job in pending_jobs:
-                        if self._active_jobs < self._max_concurrent_jobs:
-                            print(f"PENDING ジョブ {job.id} を実行開始 (アクティブ: {self._active_jobs}/{self._max_concurrent_jobs})")
-                            loop.run_until_complete(self._execute_pending_job(job.id))
-                        else:
-                            print(f"同時実行数制限に達しているため、ジョブ {job.id} はスキップ")
-                    
-                    time.sleep(5)  # 5秒間隔でチェック
+                    logger.info("PENDING ジョブ %s を実行開始 (アクティブ: %s/%s)", job_id, len(self._running_tasks), self._max_concurrent_jobs)
+                    await self._execute_pending_job(job_id)
                 except Exception as e:
-                    print(f"ジョブ処理スレッドエラー: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    time.sleep(5)
+                    logger.exception("ジョブ処理スレッドエラー: %s", e)
+        
+        async def cleanup_worker():
+            # リクエストを待たずに古い終了済みジョブを少しずつ削除し、メモリ使用量を一定に保つ
+            # （データベースからの削除で実行中のジョブを止めないよう、別スレッドで実行）
+            while self._job_processor_active:
+                await asyncio.sleep(self._cleanup_interval)
+                try:
+                    cleaned_count = await asyncio.to_thread(self.cleanup_old_jobs, self._cleanup_max_age_hours)
+                    if cleaned_count:
+                        logger.info("古いジョブを %d 件クリーンアップしました", cleaned_count)
+                except Exception as e:
+                    logger.error("定期クリーンアップエラー: %s", e)
+        
+        async def process_pending_jobs():
+            # 同時実行ジョブ数と同じ数のワーカーを常駐させ、同時に実行されるジョブ数を制限する
+            self._processor_tasks = [asyncio.create_task(job_worker()) for _ in range(self._max_concurrent_jobs)]
+            if self._cleanup_interval > 0:
+                self._processor_tasks.append(asyncio.create_task(cleanup_worker()))
+            try:
+                await asyncio.gather(*self._processor_tasks)
+            except asyncio.CancelledError:
+                # 停止要求: 実行中のジョブをキャンセルし、終了処理が完了するまで待つ
+                logger.info("ジョブ処理を停止中...")
+                for task in self._processor_tasks:
+                    task.cancel()
+                await asyncio.gather(*self._processor_tasks, return_exceptions=True)
+        
+        def job_processor():
+            from http_client import close_shared_connector
             
-            loop.close()
+            asyncio.set_event_loop(self._processor_loop)
+            try:
+                self._processor_loop.run_until_complete(self._processor_task)
+                self._processor_loop.run_until_complete(close_shared_connector())
+                self._processor_loop.run_until_complete(self._processor_loop.shutdown_default_executor())
+            finally:
+                self._processor_loop.close()
+            logger.info("バックグラウンドジョブ処理スレッドを停止しました")
+        
+        # ループ開始前にタスクを作成しておき、shutdown() からいつでもキャンセルできるようにする
+        self._processor_task = self._processor_loop.create_task(process_pending_jobs())
         
         # デーモンスレッドとして開始
-        processor_thread = threading.Thread(target=job_processor, daemon=True)
-        processor_thread.start()
-        print("バックグラウンドジョブ処理スレッドを開始しました")
+        self._processor_thread = threading.Thread(target=job_processor, daemon=True)
+        self._processor_thread.start()
+        logger.info("バックグラウンドジョブ処理スレッドを開始しました")
+    
+    async def shutdown(self) -> None:
+        """
+        バックグラウンドジョブ処理を停止
+        
+        処理スレッドのイベントループ上で処理タスクをキャンセルし、実行中のジョブの
+        終了処理が完了してからループを閉じます。
+        """
+        if not self._job_processor_active:
+            return
+        self._job_processor_active = False
+        
+        self._processor_loop.call_soon_threadsafe(self._processor_task.cancel)
+        await asyncio.to_thread(self._processor_thread.join)
+    
+    def _enqueue_pending_job(self, job_id: str):
+        """PENDINGジョブを処理キューに追加（任意のスレッドから呼び出し可能）"""
+        self._processor_loop.call_soon_threadsafe(self._pending_queue.put_nowait, job_id)
     
     async def _execute_pending_job(self, job_id: str):
         """PENDING状態のジョブを実行"""
-        self._active_jobs += 1
         try:
-            job = self.get_job(job_id)
-            if not job or job.status != JobStatus.PENDING:
-                print(f"ジョブ {job_id}: 実行対象外 - ステータス: {job.status if job else 'None'}")
+            job = self._peek_job(job_id)
+            if not job or job.status is not JobStatus.PENDING:
+                logger.warning("ジョブ %s: 実行対象外 - ステータス: %s", job_id, job.status.label if job else 'None')
                 return
             
-            print(f"PENDING ジョブ {job_id} の自動実行を開始")
+            logger.info("PENDING ジョブ %s の自動実行を開始", job_id)
             
             # 元のリクエストデータを取得
-            from database import db_manager
-            db = self._get_db_session()
-            
             try:
-                fuzzer_request = db_manager.get_fuzzer_request_by_id(db, job.request_id)
-                if not fuzzer_request:
-                    print(f"ジョブ {job_id}: リクエストデータが見つかりません (request_id: {job.request_id})")
-                    self.complete_job(job_id, [], f"リクエストデータが見つかりません (request_id: {job.request_id})")
-                    return
-                
-                print(f"ジョブ {job_id}: リクエストデータ取得成功")
-                
-                # 生成されたリクエストを抽出
-                requests_data = []
-                for gen_req in fuzzer_request.generated_requests:
-                    req_dict = {
-                        "request": gen_req.request_content,
-                        "placeholder": gen_req.placeholder,
-                        "payload": gen_req.payload,
-                        "position": gen_req.position
-                    }
-                    
-                    # applied_toフィールドがある場合は追加
-                    if gen_req.applied_to:
-                        req_dict["applied_to"] = gen_req.get_applied_to()
+                with db_manager.SessionLocal() as db:
+                    fuzzer_request = db_manager.get_fuzzer_request_by_id(db, job.request_id)
                     
-                    requests_data.append(req_dict)
-                
-                if not requests_data:
-                    print(f"ジョブ {job_id}: 生成されたリクエストが空です")
-                    self.complete_job(job_id, [], "生成されたリクエストが空です")
-                    return
-                
-                print(f"ジョブ {job_id}: {len(requests_data)}件の生成リクエストを実行開始")
-                
-                # リクエストを再実行
-                await self.execute_requests_job(job_id, requests_data, job.http_config)
-                
+                    # 生成されたリクエストを抽出
+                    requests_data = []
+                    for gen_req in (fuzzer_request.generated_requests if fuzzer_request else ()):
+                        req_dict = {
+                            "request": gen_req.request_content,
+                            "placeholder": gen_req.placeholder,
+                            "payload": gen_req.payload,
+                            "position": gen_req.position
+                        }
+                        
+                        # applied_toフィールドがある場合は追加
+                        if gen_req.applied_to:
+                            req_dict["applied_to"] = gen_req.get_applied_to()
+                        
+                        requests_data.append(req_dict)
             except Exception as db_error:
-                print(f"ジョブ {job_id}: データベースからのリクエスト取得エラー: {db_error}")
+                logger.error("ジョブ %s: データベースからのリクエスト取得エラー: %s", job_id, db_error)
                 self.complete_job(job_id, [], f"データベースエラー: {str(db_error)}")
                 return
             
+            # 完了処理は別セッションで書き込むため、読み取りセッションを閉じてから行う
+            if not fuzzer_request:
+                logger.warning("ジョブ %s: リクエストデータが見つかりません (request_id: %s)", job_id, job.request_id)
+                self.complete_job(job_id, [], f"リクエストデータが見つかりません (request_id: {job.request_id})")
+                return
+            
+            logger.info("ジョブ %s: リクエストデータ取得成功", job_id)
+            
+            if not requests_data:
+                logger.info("ジョブ %s: 生成されたリクエストが空です", job_id)
+                self.complete_job(job_id, [], "生成されたリクエストが空です")
+                return
+            
+            logger.info("ジョブ %s: %s件の生成リクエストを実行開始", job_id, len(requests_data))
+            
+            # リクエストを再実行（セッションは保持しない）
+            await self.execute_requests_job(job_id, requests_data, job.http_config)
+            
         except Exception as e:
-            print(f"PENDING ジョブ {job_id} の実行エラー: {e}")
+            logger.error("PENDING ジョブ %s の実行エラー: %s", job_id, e)
             self.complete_job(job_id, [], str(e))
-        finally:
-            self._active_jobs -= 1
     
     def create_job(self, name: str, request_id: int, total_requests: int, 
                    http_config: Optional[Dict[str, Any]] = None) -> str:
         """新しいジョブを作成"""
-        job_id = str(uuid.uuid4())
+        job_id = secrets.token_hex(16)
         now = datetime.now()
         
         progress = JobProgress(
@@ -300,251 +637,421 @@ class JobManager:
             created_at=now,
             updated_at=now,
             request_id=request_id,
-            http_config=http_config,
-            results=[]
+            http_config=http_config
         )
         
-        with self._lock:
-            self._jobs[job_id] = job
+        self._lock.acquire()
+        try:
+            self._add_job(job)
+        finally:
+            self._lock.release()
         
         # データベースにも保存
         try:
-            db = self._get_db_session()
-            db_manager.save_job(
-                db=db,
-                job_id=job_id,
-                name=name,
-                status=JobStatus.PENDING.value,
-                fuzzer_request_id=request_id,
-                http_config=http_config,
-                progress=progress.to_dict()
-            )
+            with db_manager.SessionLocal() as db:
+                db_manager.save_job(
+                    db=db,
+                    job_id=job_id,
+                    name=name,
+                    status=JobStatus.PENDING.label,
+                    fuzzer_request_id=request_id,
+                    http_config=http_config,
+                    progress=progress.to_dict(),
+                    # ジョブ一覧の並び順・カーソルがメモリ内のジョブと一致するよう、作成日時をそろえる
+                    created_at=now
+                )
+            self._invalidate_statistics()
         except Exception as e:
-            print(f"データベース保存エラー: {e}")
+            logger.error("データベース保存エラー: %s", e)
+        
+        # バックグラウンド処理キューに投入
+        self._enqueue_pending_job(job_id)
         
         return job_id
     
     def get_job(self, job_id: str) -> Optional[Job]:
         """ジョブを取得"""
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if job:
-                print(f"ジョブ {job_id}: メモリから取得 - 結果数: {len(job.results) if job.results else 0}")
-                
-                # データベースから実行結果を取得
+        job = self._load_job(job_id)
+        if job:
+            logger.debug("ジョブ %s: メモリから取得 - 結果数: %s", job_id, len(job.results) if job.results else 0)
+            
+            # 終了したジョブの実行結果は変化しないため、データベースからは一度だけ取得
+            if job_id not in self._results_loaded and job.status in _RESULTS_FINAL_STATUSES:
                 try:
-                    db = self._get_db_session()
-                    results = db_manager.get_job_results(db=db, job_id=job_id)
+                    with db_manager.SessionLocal() as db:
+                        results = db_manager.get_job_results(db=db, job_id=job_id)
                     if results:
-                        print(f"ジョブ {job_id}: データベースから結果を取得 - 結果数: {len(results)}")
+                        logger.debug("ジョブ %s: データベースから結果を取得 - 結果数: %s", job_id, len(results))
                         job.results = results
                     else:
-                        print(f"ジョブ {job_id}: データベースに結果が見つかりません")
+                        logger.debug("ジョブ %s: データベースに結果が見つかりません", job_id)
+                    self._results_loaded.add(job_id)
                 except Exception as e:
-                    print(f"データベース取得エラー: {e}")
-            else:
-                print(f"ジョブ {job_id}: メモリにジョブが見つかりません")
+                    logger.warning("データベース取得エラー: %s", e, extra={'rate_limited': True})
+        else:
+            logger.debug("ジョブ %s: メモリにジョブが見つかりません", job_id)
+        
+        return job
+    
+    def _load_job(self, job_id: str) -> Optional[Job]:
+        """
+        ジョブを取得（メモリから外れたジョブはデータベースから読み込み、再びメモリに登録）
+        
+        Args:
+            job_id (str): ジョブのID
             
+        Returns:
+            Optional[Job]: ジョブ（存在しない場合はNone）
+        """
+        # 辞書の単一キー参照はGIL下でアトミックなため、ロックは取得しない
+        job = self._jobs.get(job_id)
+        if job is not None:
             return job
-    
-    def get_all_jobs(self) -> List[Job]:
-        """全てのジョブを取得"""
-        with self._lock:
-            # メモリ内のジョブを取得
-            memory_jobs = list(self._jobs.values())
         
-        # データベースからも取得
         try:
-            db = self._get_db_session()
-            db_jobs = db_manager.get_all_jobs(db)
-            
-            # データベースのジョブをメモリ内のジョブとマージ
-            db_job_ids = {job.id for job in db_jobs}
-            memory_job_ids = {job.id for job in memory_jobs}
-            
-            # データベースにあってメモリにないジョブを復元
-            for db_job in db_jobs:
-                if db_job.id not in memory_job_ids:
-                    # データベースのジョブをメモリ内のJobオブジェクトに変換
-                    progress_data = db_job.get_progress()
-                    # JobProgressの有効なフィールドのみを抽出
-                    valid_fields = ['total_requests', 'completed_requests', 'successful_requests', 
-                                   'failed_requests', 'current_request', 'start_time', 'end_time', 
-                                   'estimated_remaining_time']
-                    progress_init_data = {k: v for k, v in progress_data.items() if k in valid_fields}
-                    
-                    # 日時文字列をdatetimeオブジェクトに変換
-                    if 'start_time' in progress_init_data and isinstance(progress_init_data['start_time'], str):
-                        progress_init_data['start_time'] = datetime.fromisoformat(progress_init_data['start_time'])
-                    if 'end_time' in progress_init_data and isinstance(progress_init_data['end_time'], str):
-                        progress_init_data['end_time'] = datetime.fromisoformat(progress_init_data['end_time'])
-                        
-                    progress = JobProgress(**progress_init_data)
-                    job = Job(
-                        id=db_job.id,
-                        name=db_job.name,
-                        status=JobStatus(db_job.status),
-                        progress=progress,
-                        created_at=db_job.created_at,
-                        updated_at=db_job.updated_at,
-                        request_id=db_job.fuzzer_request_id,
-                        http_config=db_job.http_config,
-                        results=[],
-                        error_message=db_job.error_message
-                    )
-                    memory_jobs.append(job)
-            
-            # メモリにあってデータベースにないジョブをデータベースに保存
-            for memory_job in memory_jobs:
-                if memory_job.id not in db_job_ids:
-                    try:
-                        db_manager.save_job(
-                            db=db,
-                            job_id=memory_job.id,
-                            name=memory_job.name,
-                            status=memory_job.status.value,
-                            fuzzer_request_id=memory_job.request_id,
-                            http_config=memory_job.http_config,
-                            progress=memory_job.progress.to_dict(),
-                            error_message=memory_job.error_message
-                        )
-                    except Exception as e:
-                        print(f"データベース保存エラー: {e}")
-                        
+            with db_manager.SessionLocal() as db:
+                db_job = db_manager.get_job_by_id(db, job_id)
+                if db_job is None:
+                    return None
+                job = _db_job_to_job(db_job)
         except Exception as e:
-            print(f"データベース取得エラー: {e}")
+            logger.warning("データベースからのジョブ読み込みエラー: %s", e, extra={'rate_limited': True})
+            return None
         
-        return memory_jobs
-    
-    def update_job_progress(self, job_id: str, completed: int, successful: int, 
-                           failed: int, current: int = None) -> bool:
-        """ジョブの進捗を更新"""
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
-            job.progress.completed_requests = completed
-            job.progress.successful_requests = successful
-            job.progress.failed_requests = failed
-            if current is not None:
-                job.progress.current_request = current
-            
-            # 残り時間の推定
-            if job.progress.completed_requests > 0 and job.progress.start_time:
-                elapsed = (datetime.now() - job.progress.start_time).total_seconds()
-                rate = job.progress.completed_requests / elapsed
-                remaining = job.progress.total_requests - job.progress.completed_requests
-                if rate > 0:
-                    job.progress.estimated_remaining_time = remaining / rate
+            # 読み込み中に他のスレッドが登録済みであればそれを使う
+            existing = self._jobs.get(job_id)
+            if existing is not None:
+                return existing
+            self._add_job(job)
+        return job
+    
+    def _add_job(self, job: Job) -> None:
+        """ジョブをメモリに登録し、上限を超えた分の終了済みジョブを外す（self._lock を保持して呼び出す）"""
+        self._jobs[job.id] = job
+        self._status_counts[job.status] += 1
+        self._stats_version += 1
+        heapq.heappush(self._job_heap, (job.created_at.timestamp(), job.id))
+        self._evict_finished_jobs()
+    
+    def _evict_finished_jobs(self) -> None:
+        """
+        メモリ内のジョブ数が上限を超えた分、終了してから最も時間の経ったジョブを外す（self._lock を保持して呼び出す）
+        
+        外したジョブはデータベースにのみ残り、参照時に _load_job で読み込み直します。
+        実行中・待機中のジョブは外しません。
+        """
+        excess = len(self._jobs) - self._max_jobs_in_memory
+        if excess <= 0:
+            return
+        
+        evicted = []
+        for job_id, job in self._jobs.items():
+            if job.status in _EVICTABLE_STATUSES:
+                evicted.append(job_id)
+                if len(evicted) == excess:
+                    break
+        for job_id in evicted:
+            job = self._jobs.pop(job_id)
+            self._status_counts[job.status] -= 1
+            self._results_loaded.discard(job_id)
+        self._stats_version += 1
+        
+        # 外したジョブのヒープのエントリが溜まりすぎないよう、必要に応じて作り直す
+        if len(self._job_heap) > 2 * len(self._jobs):
+            self._job_heap = [(job.created_at.timestamp(), job_id) for job_id, job in self._jobs.items()]
+            heapq.heapify(self._job_heap)
+    
+    def _set_status(self, job: Job, status: JobStatus) -> None:
+        """ジョブの状態を変更し、状態ごとのジョブ数を更新（self._lock を保持して呼び出す）"""
+        if self._jobs.get(job.id) is not job:
+            # ロック取得までの間にメモリから外されたジョブは件数に含まれていない
+            job.status = status
+            return
+        self._status_counts[job.status] -= 1
+        job.status = status
+        self._status_counts[status] += 1
+        self._stats_version += 1
+        if status in _EVICTABLE_STATUSES:
+            # 終了したジョブは、メモリから外す順番の最後尾に回す
+            self._jobs.move_to_end(job.id)
+            self._evict_finished_jobs()
+    
+    def _peek_job(self, job_id: str) -> Optional[Job]:
+        """メモリ内のジョブのみを参照（データベースからの結果読み込みは行わない）"""
+        return self._jobs.get(job_id)
+    
+    def iter_jobs(self, status: Optional[JobStatus] = None, limit: Optional[int] = 100,
+                  offset: int = 0, before: Optional[Tuple[float, str]] = None) -> List[Job]:
+        """
+        ジョブを作成日時の新しい順に取得（ページネーション対応）
+        
+        一覧はデータベースから作成し、メモリ内にあるジョブは実行中の最新の状態で置き換えます。
+        メモリから外れたジョブも一覧に含まれ、削除したジョブは含まれません。
+        データベースに接続できない場合は、メモリ内のジョブのみから作成します。
+        
+        Args:
+            status (Optional[JobStatus]): 絞り込むジョブの状態（Noneの場合は全て）
+            limit (Optional[int]): 取得件数の制限（Noneの場合は制限なし）
+            offset (int): オフセット
+            before (Optional[Tuple[float, str]]): 指定された場合、このキー（parse_job_cursor の結果）より
+                古いジョブのみを取得
             
-            job.updated_at = datetime.now()
+        Returns:
+            List[Job]: ジョブのリスト
+        """
+        try:
+            with db_manager.SessionLocal() as db:
+                db_jobs = db_manager.get_jobs_page(db, status=status.label if status is not None else None,
+                                                   limit=limit, offset=offset, before=before)
+                # メモリ内のジョブは登録し直さず、一覧の表示にのみ使う
+                return [self._jobs.get(db_job.id) or _db_job_to_job(db_job) for db_job in db_jobs]
+        except Exception as e:
+            logger.warning("データベースからのジョブ一覧取得エラー: %s", e, extra={'rate_limited': True})
         
-        # データベースも更新
+        # ロック内ではジョブへの参照のみをコピーし、絞り込みと並べ替えはロックの外で行う
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if status is not None:
+            jobs = [job for job in jobs if job.status is status]
+        if before is not None:
+            jobs = [job for job in jobs if _job_order_key(job) < before]
+        if limit is None:
+            ordered = sorted(jobs, key=_job_order_key, reverse=True)
+        else:
+            ordered = heapq.nlargest(offset + limit, jobs, key=_job_order_key)
+        return ordered[offset:]
+    
+    def count_jobs(self, status: Optional[JobStatus] = None) -> int:
+        """ジョブ数を取得（データベースに接続できない場合はメモリ内のジョブ数）"""
         try:
-            db = self._get_db_session()
-            db_manager.update_job(
-                db=db,
-                job_id=job_id,
-                progress=job.progress.to_dict()
-            )
+            with db_manager.SessionLocal() as db:
+                return db_manager.count_jobs(db, status.label if status is not None else None)
         except Exception as e:
-            print(f"データベース更新エラー: {e}")
+            logger.warning("データベースからのジョブ数取得エラー: %s", e, extra={'rate_limited': True})
+        with self._lock:
+            if status is None:
+                return len(self._jobs)
+            return self._status_counts[status]
+    
+    def get_all_jobs(self) -> List[Job]:
+        """全てのジョブを取得"""
+        return self.iter_jobs(limit=None)
+    
+    def watch_job(self, job_id: str, keepalive: float = 15.0) -> Optional[AsyncIterator[Optional[bytes]]]:
+        """
+        ジョブの状態・進捗の変更を購読（GET /api/jobs/{job_id} のポーリングの代わりに使用）
+        
+        最初に現在の状態を返し、以降は変更通知を受けたときのみ最新の状態を返します。
+        通知が続いた場合は最新の状態を1回だけ返すため、進捗の更新頻度によらず
+        未送信の状態が溜まることはありません。ジョブが終了するかメモリから外れると終了します。
+        
+        Args:
+            job_id (str): ジョブのID
+            keepalive (float): この秒数の間変更がなければNoneを返す（接続維持用）
+            
+        Returns:
+            Optional[AsyncIterator[Optional[bytes]]]: 状態のJSON（to_status_json_bytes）を返す
+                非同期イテレータ（ジョブが存在しない場合はNone）
+        """
+        job = self._load_job(job_id)
+        if job is None:
+            return None
+        return self._watch_job(job, keepalive)
+    
+    async def _watch_job(self, job: Job, keepalive: float) -> AsyncIterator[Optional[bytes]]:
+        """watch_job の本体（購読の登録・解除を行う）"""
+        event = asyncio.Event()
+        subscriber = (asyncio.get_running_loop(), event)
+        with self._lock:
+            self._subscribers.setdefault(job.id, []).append(subscriber)
+        try:
+            last_data = None
+            while True:
+                # 状態を読む前に通知をクリアし、読んだ後の変更は次の通知として受け取る
+                event.clear()
+                data = job.to_status_json_bytes()
+                if data != last_data:
+                    last_data = data
+                    yield data
+                if job.status in _EVICTABLE_STATUSES or self._jobs.get(job.id) is not job:
+                    return
+                try:
+                    await asyncio.wait_for(event.wait(), keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                subscribers = self._subscribers[job.id]
+                subscribers.remove(subscriber)
+                if not subscribers:
+                    del self._subscribers[job.id]
+    
+    def _notify_job(self, job_id: str) -> None:
+        """ジョブの変更を購読者に通知（任意のスレッドから呼び出し可能）"""
+        # 購読者がいない場合は辞書の参照のみで終わる
+        subscribers = self._subscribers.get(job_id)
+        if not subscribers:
+            return
+        for loop, event in tuple(subscribers):
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # 購読元のイベントループが既に閉じられている
+                pass
+    
+    async def update_job_progress(self, job_id: str, completed: int, successful: int, 
+                                  failed: int, current: int = None) -> bool:
+        """ジョブの進捗を更新（DB書き込みはスレッドプールで行い、イベントループを止めない）"""
+        # 進捗を更新するのは実行中のタスクのみのため、ロックは取得しない
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        
+        job.progress.completed_requests = completed
+        job.progress.successful_requests = successful
+        job.progress.failed_requests = failed
+        if current is not None:
+            job.progress.current_request = current
+        
+        # 残り時間の推定
+        if job.progress.completed_requests > 0 and job.progress.start_time:
+            elapsed = (datetime.now() - job.progress.start_time).total_seconds()
+            rate = job.progress.completed_requests / elapsed
+            remaining = job.progress.total_requests - job.progress.completed_requests
+            if rate > 0:
+                job.progress.estimated_remaining_time = remaining / rate
+        
+        job.updated_at = datetime.now()
+        self._notify_job(job_id)
         
+        # メモリは毎回更新し、データベースへの反映は間引く
+        now = time.monotonic()
+        if (completed % self._progress_flush_every != 0 and
+                now - job._progress_flushed_at < self._progress_flush_seconds):
+            return True
+        job._progress_flushed_at = now
+        
+        await asyncio.to_thread(self._save_job_progress, job_id, job.progress.to_dict())
         return True
     
-    def complete_job(self, job_id: str, results: List[Dict[str, Any]], 
+    def _save_job_progress(self, job_id: str, progress_dict: Dict[str, Any]) -> None:
+        """ジョブの進捗をデータベースに保存"""
+        try:
+            with db_manager.SessionLocal() as db:
+                db_manager.update_job(
+                    db=db,
+                    job_id=job_id,
+                    progress=progress_dict
+                )
+        except Exception as e:
+            logger.error("データベース更新エラー: %s", e)
+    
+    def complete_job(self, job_id: str, results: Optional[List[Dict[str, Any]]], 
                      error_message: Optional[str] = None) -> bool:
-        """ジョブを完了"""
-        print(f"ジョブ {job_id}: complete_job呼び出し - 結果数: {len(results) if results else 0}")
+        """ジョブを完了（results が None の場合、結果は保存済みとして状態のみ更新）"""
+        logger.debug("ジョブ %s: complete_job呼び出し - 結果数: %s", job_id, len(results) if results else 0)
+        
+        job = self._jobs.get(job_id)
+        if not job:
+            logger.warning("ジョブ %s: ジョブが見つかりません", job_id)
+            return False
         
+        # 状態遷移のみをロックで保護する
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                print(f"ジョブ {job_id}: ジョブが見つかりません")
-                return False
-            
-            job.status = JobStatus.FAILED if error_message else JobStatus.COMPLETED
+            self._set_status(job, JobStatus.FAILED if error_message else JobStatus.COMPLETED)
             job.progress.end_time = datetime.now()
             job.results = results
             job.error_message = error_message
             job.updated_at = datetime.now()
+            self._results_loaded.discard(job_id)
             
-            print(f"ジョブ {job_id}: メモリに結果を保存 - 結果数: {len(results) if results else 0}")
+            logger.debug("ジョブ %s: メモリに結果を保存 - 結果数: %s", job_id, len(results) if results else 0)
+        self._notify_job(job_id)
         
         # データベースも更新
         try:
-            db = self._get_db_session()
-            db_manager.update_job(
-                db=db,
-                job_id=job_id,
-                status=job.status.value,
-                progress=job.progress.to_dict(),
-                error_message=error_message
-            )
+            with db_manager.SessionLocal() as db:
+                db_manager.update_job(
+                    db=db,
+                    job_id=job_id,
+                    status=job.status.label,
+                    progress=job.progress.to_dict(),
+                    error_message=error_message
+                )
+                self._invalidate_statistics()
             
-            # 実行結果も保存
-            if results:
-                print(f"ジョブ {job_id}: データベースに結果を保存 - 結果数: {len(results)}")
-                db_manager.save_job_results(db=db, job_id=job_id, results=results)
-            else:
-                print(f"ジョブ {job_id}: 結果が空のためデータベース保存をスキップ")
+                # 実行結果も保存
+                if results:
+                    logger.info("ジョブ %s: データベースに結果を保存 - 結果数: %s", job_id, len(results))
+                    db_manager.save_job_results(db=db, job_id=job_id, results=results)
+                elif results is None:
+                    logger.info("ジョブ %s: 結果は実行中にデータベースへ保存済み", job_id)
+                else:
+                    logger.info("ジョブ %s: 結果が空のためデータベース保存をスキップ", job_id)
                 
         except Exception as e:
-            print(f"データベース更新エラー: {e}")
+            logger.error("データベース更新エラー: %s", e)
         
         return True
     
     def cancel_job(self, job_id: str) -> bool:
         """ジョブをキャンセル"""
+        job = self._load_job(job_id)
+        if not job:
+            return False
+        
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
             # 実行中のタスクをキャンセル
             if job_id in self._running_tasks:
                 task = self._running_tasks[job_id]
                 if hasattr(task, 'cancel'):
-                    print(f"ジョブ {job_id}: 実行中のタスクをキャンセル中...")
-                    task.cancel()
+                    logger.info("ジョブ %s: 実行中のタスクをキャンセル中...", job_id)
+                    # タスクは処理スレッドのイベントループに属するため、スレッドセーフに要求する
+                    self._processor_loop.call_soon_threadsafe(task.cancel)
                 del self._running_tasks[job_id]
             
-            job.status = JobStatus.CANCELLED
+            self._set_status(job, JobStatus.CANCELLED)
             job.progress.end_time = datetime.now()
             job.updated_at = datetime.now()
+            
+            # 待機中の実行ループを即座に起こす
+            if job.cancel_event is not None:
+                self._processor_loop.call_soon_threadsafe(job.cancel_event.set)
+        self._notify_job(job_id)
         
         # データベースも更新
         try:
-            db = self._get_db_session()
-            db_manager.update_job(
-                db=db,
-                job_id=job_id,
-                status=JobStatus.CANCELLED.value,
-                progress=job.progress.to_dict()
-            )
+            with db_manager.SessionLocal() as db:
+                db_manager.update_job(
+                    db=db,
+                    job_id=job_id,
+                    status=JobStatus.CANCELLED.label,
+                    progress=job.progress.to_dict()
+                )
+            self._invalidate_statistics()
         except Exception as e:
-            print(f"ジョブキャンセル時のデータベース更新エラー: {e}")
+            logger.error("ジョブキャンセル時のデータベース更新エラー: %s", e)
             
         return True
     
     def resume_job(self, job_id: str) -> bool:
         """ジョブを再開"""
+        job = self._load_job(job_id)
+        if not job:
+            logger.warning("ジョブ再開エラー: ジョブ %s が見つかりません", job_id)
+            return False
+        
         with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                print(f"ジョブ再開エラー: ジョブ {job_id} が見つかりません")
-                return False
-            
             # キャンセルまたは失敗状態のジョブのみ再開可能
-            if job.status not in [JobStatus.CANCELLED, JobStatus.FAILED]:
-                print(f"ジョブ再開エラー: ジョブ {job_id} は再開できない状態です (現在: {job.status})")
+            if job.status not in _RESUMABLE_STATUSES:
+                logger.warning("ジョブ再開エラー: ジョブ %s は再開できない状態です (現在: %s)", job_id, job.status.label)
                 return False
             
-            print(f"ジョブ {job_id} を再開: {job.status} -> PENDING")
+            logger.info("ジョブ %s を再開: %s -> pending", job_id, job.status.label)
             
             # ジョブを待機状態にリセット
-            job.status = JobStatus.PENDING
+            self._set_status(job, JobStatus.PENDING)
             job.progress.end_time = None
             job.error_message = None
             job.updated_at = datetime.now()
@@ -555,66 +1062,126 @@ class JobManager:
             # job.progress.successful_requests = 0 
             # job.progress.failed_requests = 0
             # job.progress.current_request = 0
-            job.results = []  # 結果もクリア
+            job.results = None  # 結果もクリア（必要になるまでリストを確保しない）
+            self._results_loaded.discard(job_id)
+        self._notify_job(job_id)
         
         # データベースも更新
         try:
-            db = self._get_db_session()
-            db_manager.update_job(
-                db=db,
-                job_id=job_id,
-                status=JobStatus.PENDING.value,
-                progress=job.progress.to_dict(),
-                error_message=None
-            )
-            print(f"ジョブ {job_id}: データベース更新完了")
+            with db_manager.SessionLocal() as db:
+                db_manager.update_job(
+                    db=db,
+                    job_id=job_id,
+                    status=JobStatus.PENDING.label,
+                    progress=job.progress.to_dict(),
+                    error_message=None
+                )
+            self._invalidate_statistics()
+            logger.info("ジョブ %s: データベース更新完了", job_id)
         except Exception as e:
-            print(f"ジョブ再開時のデータベース更新エラー: {e}")
+            logger.error("ジョブ再開時のデータベース更新エラー: %s", e)
             return False
             
-        print(f"ジョブ {job_id}: 再開準備完了、バックグラウンド処理待ち")
+        self._enqueue_pending_job(job_id)
+        logger.info("ジョブ %s: 再開準備完了、バックグラウンド処理待ち", job_id)
         return True
     
     def delete_job(self, job_id: str) -> bool:
-        """ジョブを削除"""
+        """
+        ジョブを削除
+        
+        メモリとデータベースの両方から削除するため、削除したジョブが一覧や
+        データベースからの読み込みで再び現れることはありません。実行中のジョブは停止します。
+        """
         with self._lock:
-            if job_id in self._jobs:
-                del self._jobs[job_id]
-                return True
-            return False
+            job = self._jobs.pop(job_id, None)
+            if job is not None:
+                self._status_counts[job.status] -= 1
+                self._stats_version += 1
+                self._results_loaded.discard(job_id)
+                # 実行中のタスクは処理スレッドのイベントループに属するため、スレッドセーフに停止を要求する
+                task = self._running_tasks.pop(job_id, None)
+                if task is not None:
+                    self._processor_loop.call_soon_threadsafe(task.cancel)
+                if job.cancel_event is not None:
+                    self._processor_loop.call_soon_threadsafe(job.cancel_event.set)
+        
+        try:
+            with db_manager.SessionLocal() as db:
+                deleted = db_manager.delete_job(db, job_id)
+            self._invalidate_statistics()
+        except Exception as e:
+            logger.error("ジョブ削除時のデータベースエラー: %s", e)
+            deleted = False
+        
+        self._notify_job(job_id)
+        return job is not None or deleted
     
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
-        """古いジョブを削除"""
+        """
+        古い終了済みジョブを削除
+        
+        delete_job() と同様にメモリとデータベースの両方から削除するため、削除したジョブは
+        一覧や統計情報にも現れなくなります。待機中・実行中のジョブは古くても削除しません。
+        
+        Args:
+            max_age_hours (int): これより前に作成された終了済みジョブを削除する（時間）
+            
+        Returns:
+            int: 削除されたジョブ数
+        """
         cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
-        deleted_count = 0
+        deleted_ids: Set[str] = set()
         
+        # 最も古いジョブから順に取り出し、期限内のジョブに達した時点で終了
         with self._lock:
-            job_ids_to_delete = []
-            for job_id, job in self._jobs.items():
-                if job.created_at.timestamp() < cutoff_time:
-                    job_ids_to_delete.append(job_id)
-            
-            for job_id in job_ids_to_delete:
-                del self._jobs[job_id]
-                deleted_count += 1
+            unfinished = []
+            while self._job_heap and self._job_heap[0][0] < cutoff_time:
+                entry = heapq.heappop(self._job_heap)
+                job = self._jobs.get(entry[1])
+                if job is None:
+                    continue
+                if job.status not in _EVICTABLE_STATUSES:
+                    unfinished.append(entry)
+                    continue
+                del self._jobs[job.id]
+                self._status_counts[job.status] -= 1
+                self._stats_version += 1
+                self._results_loaded.discard(job.id)
+                deleted_ids.add(job.id)
+            # 終了していないジョブはヒープに戻す
+            for entry in unfinished:
+                heapq.heappush(self._job_heap, entry)
         
-        return deleted_count
+        # メモリに無いジョブも含め、データベースから削除
+        try:
+            with db_manager.SessionLocal() as db:
+                deleted_ids.update(db_manager.delete_jobs_created_before(
+                    db, cutoff_time, [status.label for status in _EVICTABLE_STATUSES]))
+            self._invalidate_statistics()
+        except Exception as e:
+            logger.error("古いジョブ削除時のデータベースエラー: %s", e)
+        
+        for job_id in deleted_ids:
+            self._notify_job(job_id)
+        return len(deleted_ids)
     
     async def execute_requests_job(self, job_id: str, requests: List[Dict[str, Any]], 
                                    http_config: Optional[Dict[str, Any]] = None) -> None:
         """リクエスト実行ジョブを実行"""
-        job = self.get_job(job_id)
+        job = self._peek_job(job_id)
         if not job:
             return
         
         # ジョブを実行中に設定
         with self._lock:
-            job.status = JobStatus.RUNNING
+            self._set_status(job, JobStatus.RUNNING)
             job.updated_at = datetime.now()
+        self._notify_job(job_id)
         
         try:
             # HTTPRequestConfigを作成
-            from http_client import HTTPRequestConfig, RequestExecutor
+            from http_client import HTTPRequestConfig
             
             config = HTTPRequestConfig()
             if http_config:
@@ -626,41 +1193,41 @@ class JobManager:
                 config.headers = http_config.get('additional_headers')
                 config.sequential_execution = http_config.get('sequential_execution', False)
                 config.request_delay = http_config.get('request_delay', 0.0)
+                config.max_concurrency = http_config.get('max_concurrency', config.max_concurrency)
             
-            print(f"ジョブ {job_id}: リクエスト実行開始 - {len(requests)}件のリクエスト")
+            logger.info("ジョブ %s: リクエスト実行開始 - %s件のリクエスト", job_id, len(requests))
             
             # リクエストを実行（キャンセル可能なタスクとして）
-            task = asyncio.create_task(
-                self._execute_requests_with_cancellation(job_id, requests, config)
-            )
+            # いずれの実行モードでも、結果はメモリに溜め込まず実行中にデータベースへ保存する
+            if config.sequential_execution:
+                task = asyncio.create_task(
+                    self._execute_requests_sequential_with_cancel(job_id, requests, config)
+                )
+            else:
+                task = asyncio.create_task(
+                    self._execute_requests_parallel(job_id, requests, config)
+                )
             
             # 実行中のタスクを記録
-            with self._lock:
+            self._lock.acquire()
+            try:
                 self._running_tasks[job_id] = task
+            finally:
+                self._lock.release()
             
             # タスクを実行
-            results = await task
-            
-            print(f"ジョブ {job_id}: リクエスト実行完了 - 結果数: {len(results)}")
-            print(f"ジョブ {job_id}: 結果の詳細: {results[:2]}...")  # 最初の2件を表示
-            
-            # 成功・失敗をカウント
-            successful = sum(1 for r in results if not r.get('http_response', {}).get('error'))
-            failed = len(results) - successful
-            
-            print(f"ジョブ {job_id}: 成功={successful}, 失敗={failed}")
-            
-            # 進捗を更新
-            self.update_job_progress(job_id, len(results), successful, failed)
+            completed, successful, failed = await task
+            logger.info("ジョブ %s: リクエスト実行完了 - 結果数: %s, 成功=%s, 失敗=%s", job_id, completed, successful, failed)
+            await self.update_job_progress(job_id, completed, successful, failed)
             
-            # ジョブ完了
-            self.complete_job(job_id, results)
+            # ジョブ完了（結果は保存済み）
+            self.complete_job(job_id, None)
             
         except asyncio.CancelledError:
-            print(f"ジョブ {job_id}: キャンセルされました")
+            logger.info("ジョブ %s: キャンセルされました", job_id)
             # ジョブはすでにキャンセル状態になっているはず
         except Exception as e:
-            print(f"ジョブ {job_id}: エラー発生 - {e}")
+            logger.error("ジョブ %s: エラー発生 - %s", job_id, e)
             # エラーでジョブ終了
             self.complete_job(job_id, [], str(e))
         finally:
@@ -669,145 +1236,414 @@ class JobManager:
                 if job_id in self._running_tasks:
                     del self._running_tasks[job_id]
     
-    async def _execute_requests_with_cancellation(self, job_id: str, requests: List[Dict[str, Any]], 
-                                                  config: 'HTTPRequestConfig') -> List[Dict[str, Any]]:
-        """キャンセル対応のリクエスト実行"""
-        from http_client import RequestExecutor
-        
-        # 定期的にキャンセル状態をチェックしながら実行
-        if config.sequential_execution:
-            # 同期実行の場合は一つずつ実行し、キャンセルチェックを行う
-            return await self._execute_requests_sequential_with_cancel(job_id, requests, config)
-        else:
-            # 並列実行の場合
-            return await RequestExecutor.execute_requests(requests, config)
+    @staticmethod
+    def _to_request_result(request: Dict[str, Any], response: Any) -> RequestResult:
+        """生成されたリクエストと送信結果（HTTPResponse、または送信時の例外）から実行結果を作成"""
+        if isinstance(response, Exception):
+            return RequestResult(
+                request=request.get("request", ""),
+                placeholder=request.get("placeholder", ""),
+                payload=request.get("payload", ""),
+                position=request.get("position", 0),
+                status_code=0,
+                headers={},
+                body="",
+                url="",
+                elapsed_time=0,
+                error=str(response)
+            )
+        return RequestResult(
+            request=request.get("request", ""),
+            placeholder=request.get("placeholder", ""),
+            payload=request.get("payload", ""),
+            position=request.get("position", 0),
+            status_code=response.status_code,
+            headers=response.headers,
+            body=response.body,
+            url=response.url,
+            elapsed_time=response.elapsed_time,
+            error=response.error,
+            actual_request=response.actual_request
+        )
     
-    async def _execute_requests_sequential_with_cancel(self, job_id: str, requests: List[Dict[str, Any]], 
-                                                       config: 'HTTPRequestConfig') -> List[Dict[str, Any]]:
-        """キャンセル対応の同期実行"""
+    async def _execute_requests_parallel(self, job_id: str, requests: List[Dict[str, Any]],
+                                         config: 'HTTPRequestConfig') -> Tuple[int, int, int]:
+        """
+        並列実行
+        
+        送信中のリクエストは常に config.max_concurrency 件までとし、1件完了するごとに次の
+        リクエストの送信を開始します。結果は完了した順にリクエスト番号付きで受け取り、
+        一定件数ごとにデータベースへ保存するため、応答の遅いリクエストがあっても
+        他の結果をメモリに溜め込みません。進捗も実行中に更新します。
+        
+        Returns:
+            Tuple[int, int, int]: （実行件数, 成功数, 失敗数）
+        """
         from http_client import HTTPClient
         
-        results = []
+        buffer: List[RequestResult] = []
+        numbers: List[int] = []
+        saved = 0
+        successful = 0
+        failed = 0
+        
+        # 再実行時は前回の部分的な結果を破棄してから保存を始める
+        await asyncio.to_thread(self._delete_job_results, job_id)
+        
+        max_concurrency = max(1, config.max_concurrency)
+        # 送信中のタスクとリクエストのインデックス
+        pending: Dict[asyncio.Task, int] = {}
+        next_index = 0
         
         async with HTTPClient() as client:
-            for i, request in enumerate(requests):
-                # キャンセル状態をチェック
-                job = self.get_job(job_id)
-                if job and job.status == JobStatus.CANCELLED:
-                    print(f"ジョブ {job_id}: リクエスト {i+1} でキャンセル検出、実行を停止")
-                    break
-                
-                print(f"同期実行: リクエスト {i+1}/{len(requests)} を送信中...")
-                try:
-                    response = await client.send_request(request["request"], config)
-                    result = {
-                        "request": request.get("request", ""),
-                        "placeholder": request.get("placeholder", ""),
-                        "payload": request.get("payload", ""),
-                        "position": request.get("position", 0),
-                        "http_response": {
-                            "status_code": response.status_code,
-                            "headers": response.headers,
-                            "body": response.body,
-                            "url": response.url,
-                            "elapsed_time": response.elapsed_time,
-                            "error": response.error,
-                            "actual_request": response.actual_request
-                        }
-                    }
-                    results.append(result)
-                    print(f"同期実行: リクエスト {i+1} 完了 - ステータス: {response.status_code}")
+            try:
+                while next_index < len(requests) or pending:
+                    # 空いた枠の分だけ次のリクエストの送信を開始
+                    while next_index < len(requests) and len(pending) < max_concurrency:
+                        task = asyncio.create_task(client.send_request(requests[next_index]["request"], config))
+                        pending[task] = next_index
+                        next_index += 1
                     
-                    # 進捗を更新
-                    self.update_job_progress(job_id, i+1, len([r for r in results if not r.get('http_response', {}).get('error')]), 
-                                           len([r for r in results if r.get('http_response', {}).get('error')]), i+1)
+                    done, _ = await asyncio.wait(pending.keys(), return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        i = pending.pop(task)
+                        try:
+                            response = task.result()
+                        except Exception as e:
+                            # 1件の失敗で他のリクエストを中断しない
+                            logger.warning("並列実行: リクエスト %s エラー - %s", i+1, e)
+                            response = e
+                        
+                        result = self._to_request_result(requests[i], response)
+                        if result.error:
+                            failed += 1
+                        else:
+                            successful += 1
+                        buffer.append(result)
+                        numbers.append(i+1)
+                        if len(buffer) >= self._result_flush_size:
+                            saved += await self._flush_result_buffer(job_id, buffer, saved + 1, numbers)
+                        
+                        # 進捗を更新
+                        completed = successful + failed
+                        await self.update_job_progress(job_id, completed, successful, failed, completed)
+            finally:
+                # キャンセルされた場合は送信中のリクエストを取り消し、それまでの結果は保存しておく
+                for task in pending:
+                    task.cancel()
+                saved += await self._flush_result_buffer(job_id, buffer, saved + 1, numbers)
+        
+        return saved, successful, failed
+    
+    async def _execute_requests_sequential_with_cancel(self, job_id: str, requests: List[Dict[str, Any]], 
+                                                       config: 'HTTPRequestConfig') -> Tuple[int, int, int]:
+        """
+        キャンセル対応の同期実行
+        
+        実行結果はメモリに溜め込まず、一定件数ごとにデータベースへ保存します。
+        
+        Returns:
+            Tuple[int, int, int]: （実行件数, 成功数, 失敗数）
+        """
+        from http_client import HTTPClient
+        
+        buffer: List[RequestResult] = []
+        saved = 0
+        successful = 0
+        failed = 0
+        
+        # 再実行時は前回の部分的な結果を破棄してから保存を始める
+        await asyncio.to_thread(self._delete_job_results, job_id)
+        
+        # キャンセルはイベントで通知されるため、ループ内でジョブを再取得しない
+        cancel_event = asyncio.Event()
+        job = self._peek_job(job_id)
+        if job:
+            job.cancel_event = cancel_event
+            if job.status is JobStatus.CANCELLED:
+                cancel_event.set()
+        
+        try:
+            async with HTTPClient() as client:
+                for i, request in enumerate(requests):
+                    # キャンセル状態をチェック
+                    if cancel_event.is_set():
+                        logger.info("ジョブ %s: リクエスト %s でキャンセル検出、実行を停止", job_id, i+1)
+                        break
                     
-                    # リクエスト間の待機時間（最後のリクエスト以外）
-                    if i < len(requests) - 1 and config.request_delay > 0:
-                        print(f"同期実行: {config.request_delay}秒待機中...")
+                    logger.debug("同期実行: リクエスト %s/%s を送信中...", i+1, len(requests))
+                    try:
+                        response = await client.send_request(request["request"], config)
+                        buffer.append(self._to_request_result(request, response))
+                        if response.error:
+                            failed += 1
+                        else:
+                            successful += 1
+                        if len(buffer) >= self._result_flush_size:
+                            saved += await self._flush_result_buffer(job_id, buffer, saved + 1)
+                        logger.debug("同期実行: リクエスト %s 完了 - ステータス: %s", i+1, response.status_code)
+                        
+                        # 進捗を更新
+                        await self.update_job_progress(job_id, i+1, successful, failed, i+1)
                         
-                        # 待機中もキャンセルチェック（1秒刻みで）
-                        wait_time = config.request_delay
-                        while wait_time > 0:
-                            sleep_duration = min(1.0, wait_time)
-                            await asyncio.sleep(sleep_duration)
-                            wait_time -= sleep_duration
+                        # リクエスト間の待機時間（最後のリクエスト以外）
+                        if i < len(requests) - 1 and config.request_delay > 0:
+                            logger.debug("同期実行: %s秒待機中...", config.request_delay)
                             
-                            # キャンセルチェック
-                            job = self.get_job(job_id)
-                            if job and job.status == JobStatus.CANCELLED:
-                                print(f"ジョブ {job_id}: 待機中にキャンセル検出、実行を停止")
-                                return results
+                            # 待機中にキャンセルされた場合は即座に停止
+                            try:
+                                await asyncio.wait_for(cancel_event.wait(), timeout=config.request_delay)
+                                logger.info("ジョブ %s: 待機中にキャンセル検出、実行を停止", job_id)
+                                break
+                            except asyncio.TimeoutError:
+                                pass
+                            
+                    except Exception as e:
+                        logger.warning("同期実行: リクエスト %s エラー - %s", i+1, e)
+                        buffer.append(self._to_request_result(request, e))
+                        failed += 1
+                        if len(buffer) >= self._result_flush_size:
+                            saved += await self._flush_result_buffer(job_id, buffer, saved + 1)
                         
-                except Exception as e:
-                    print(f"同期実行: リクエスト {i+1} エラー - {str(e)}")
-                    result = {
-                        "request": request.get("request", ""),
-                        "placeholder": request.get("placeholder", ""),
-                        "payload": request.get("payload", ""),
-                        "position": request.get("position", 0),
-                        "http_response": {
-                            "status_code": 0,
-                            "headers": {},
-                            "body": "",
-                            "url": "",
-                            "elapsed_time": 0,
-                            "error": str(e)
-                        }
-                    }
-                    results.append(result)
-                    
-                    # 進捗を更新
-                    self.update_job_progress(job_id, i+1, len([r for r in results if not r.get('http_response', {}).get('error')]), 
-                                           len([r for r in results if r.get('http_response', {}).get('error')]), i+1)
-                    
-                    # エラーが発生してもウェイトを入れる（オプション）
-                    if i < len(requests) - 1 and config.request_delay > 0:
-                        await asyncio.sleep(config.request_delay)
+                        # 進捗を更新
+                        await self.update_job_progress(job_id, i+1, successful, failed, i+1)
                         
-        return results
+                        # エラーが発生してもウェイトを入れる（オプション）
+                        if i < len(requests) - 1 and config.request_delay > 0:
+                            await asyncio.sleep(config.request_delay)
+        finally:
+            # キャンセルされた場合も、それまでの結果は保存しておく
+            saved += await self._flush_result_buffer(job_id, buffer, saved + 1)
+        
+        return saved, successful, failed
     
-    def get_job_statistics(self) -> Dict[str, Any]:
-        """ジョブ統計情報を取得"""
-        with self._lock:
-            total_jobs = len(self._jobs)
-            status_counts = {}
-            for status in JobStatus:
-                status_counts[status.value] = 0
+    async def _flush_result_buffer(self, job_id: str, buffer: List[RequestResult], start_number: int,
+                                   request_numbers: Optional[List[int]] = None) -> int:
+        """
+        バッファ内の実行結果をデータベースに保存し、バッファを空にする
+        
+        Args:
+            job_id (str): ジョブID
+            buffer (List[RequestResult]): 保存する実行結果
+            start_number (int): 先頭の結果のリクエスト番号
+            request_numbers (Optional[List[int]]): 各結果のリクエスト番号（指定時は保存後に空にする。
+                省略時は start_number からの連番）
             
-            for job in self._jobs.values():
-                status_counts[job.status.value] += 1
+        Returns:
+            int: 保存した件数
+        """
+        if not buffer:
+            return 0
+        rows = [result.to_dict() for result in buffer]
+        buffer.clear()
+        numbers = None
+        if request_numbers is not None:
+            numbers = list(request_numbers)
+            request_numbers.clear()
+        await asyncio.to_thread(self._save_job_results, job_id, rows, start_number, numbers)
+        return len(rows)
+    
+    def _save_job_results(self, job_id: str, rows: List[Dict[str, Any]], start_number: int,
+                          request_numbers: Optional[List[int]] = None) -> None:
+        """実行結果をデータベースに保存"""
+        try:
+            with db_manager.SessionLocal() as db:
+                db_manager.save_job_results(db=db, job_id=job_id, results=rows, start_number=start_number,
+                                            request_numbers=request_numbers)
+        except Exception as e:
+            logger.error("実行結果の保存エラー: %s", e)
+    
+    def _delete_job_results(self, job_id: str) -> None:
+        """データベースに保存されたジョブの実行結果を削除"""
+        try:
+            with db_manager.SessionLocal() as db:
+                db_manager.delete_job_results(db, job_id)
+        except Exception as e:
+            logger.error("実行結果の削除エラー: %s", e)
+    
+    def get_job_statistics(self) -> Mapping[str, Any]:
+        """
+        ジョブ統計情報を取得（データベースへの問い合わせ中は呼び出し元のスレッドをブロックする）
+        
+        Returns:
+            Mapping[str, Any]: 統計情報の読み取り専用マッピング（内容が変わらない間は同じオブジェクトを返す）
+        """
+        # キャッシュが切れている場合は、データベースへの問い合わせを別スレッドで先に開始
+        future = None if self._stats_cache_valid() else self._db_statistics_future()
+        snapshot = self._stats_snapshot()
         
-        # データベースからも統計情報を取得
+        # データベースの統計情報を優先
         try:
-            db = self._get_db_session()
-            db_stats = db_manager.get_job_statistics(db)
-            
-            # データベースの統計情報を優先
-            return {
-                'total_jobs': db_stats['total_jobs'],
-                'status_distribution': {
-                    'pending': db_stats.get('pending_jobs', 0),
-                    'running': db_stats.get('running_jobs', 0),
-                    'completed': db_stats.get('completed_jobs', 0),
-                    'failed': db_stats.get('failed_jobs', 0),
-                    'cancelled': 0  # データベース統計に含まれていない場合
-                },
-                'active_jobs': self._active_jobs,
-                'total_requests': db_stats.get('total_requests', 0),
-                'avg_execution_time': db_stats.get('avg_execution_time', 0)
-            }
+            db_stats = self._stats_cache if future is None else future.result(timeout=self._stats_timeout)
         except Exception as e:
-            print(f"データベース統計取得エラー: {e}")
-            # エラーが発生した場合はメモリ内の統計情報を返す
-            return {
-                'total_jobs': total_jobs,
-                'status_distribution': status_counts,
-                'active_jobs': self._active_jobs,
+            logger.warning("データベース統計取得エラー: %r", e, exc_info=True, extra={'rate_limited': True})
+            db_stats = None
+        return self._build_job_statistics(snapshot, db_stats)
+    
+    async def get_job_statistics_async(self) -> Mapping[str, Any]:
+        """
+        ジョブ統計情報を取得（イベントループ用。データベースへの問い合わせはブロックせずに待機する）
+        
+        Returns:
+            Mapping[str, Any]: get_job_statistics() と同じ統計情報
+        """
+        future = None if self._stats_cache_valid() else self._db_statistics_future()
+        snapshot = self._stats_snapshot()
+        
+        try:
+            if future is None:
+                db_stats = self._stats_cache
+            else:
+                # 問い合わせは他の呼び出しと共有しているため、タイムアウト時にキャンセルしない
+                db_stats = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)),
+                                                  timeout=self._stats_timeout)
+        except Exception as e:
+            logger.warning("データベース統計取得エラー: %r", e, exc_info=True, extra={'rate_limited': True})
+            db_stats = None
+        return self._build_job_statistics(snapshot, db_stats)
+    
+    def _stats_snapshot(self) -> Tuple[int, List[int], int]:
+        """統計情報に使うメモリ内の状態（バージョン番号、状態別件数、実行中のジョブ数）を取得"""
+        # 状態遷移時に更新している件数をコピー（リストのコピーはGIL下でアトミックなためロック不要）
+        # バージョン番号は件数より先に読み、コピー中の更新を取りこぼした結果を使い回さないようにする
+        version = self._stats_version
+        counts = list(self._status_counts)
+        # 実行中のジョブ数は dict の len() で求める（単一の読み取りはGIL下でアトミックなためロック不要）
+        active_jobs = len(self._running_tasks)
+        return version, counts, active_jobs
+    
+    def _build_job_statistics(self, snapshot: Tuple[int, List[int], int],
+                              db_stats: Optional[Dict[str, Any]]) -> Mapping[str, Any]:
+        """
+        統計情報のマッピングを作成（入力が前回と同じ場合は前回のオブジェクトを返す）
+        
+        Args:
+            snapshot (Tuple[int, List[int], int]): _stats_snapshot() の戻り値
+            db_stats (Optional[Dict[str, Any]]): データベースの統計情報（取得できなかった場合は None）
+            
+        Returns:
+            Mapping[str, Any]: 統計情報の読み取り専用マッピング
+        """
+        version, counts, active_jobs = snapshot
+        key = (version, active_jobs, db_stats)
+        cached = self._stats_result
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        if db_stats is not None:
+            by_status = db_stats['by_status']
+            stats = {
+                'total_jobs': sum(by_status.values()),
+                'status_distribution': _StatusDistribution(lambda status: by_status.get(status.label, 0)),
+                'active_jobs': active_jobs,
+                'total_requests': db_stats['total_requests'],
+                'avg_execution_time': db_stats['avg_execution_time']
+            }
+        else:
+            # エラーまたはタイムアウトの場合はメモリ内の統計情報を返す
+            stats = {
+                'total_jobs': sum(counts),
+                'status_distribution': _StatusDistribution(counts.__getitem__),
+                'active_jobs': active_jobs,
                 'total_requests': 0,
                 'avg_execution_time': 0
             }
+        
+        result = MappingProxyType(stats)
+        self._stats_result = (key, result)
+        return result
+    
+    def get_job_statistics_etag(self, stats: Mapping[str, Any]) -> str:
+        """
+        get_job_statistics() が返した統計情報のETagを取得（条件付きリクエスト用）
+        
+        Args:
+            stats (Mapping[str, Any]): get_job_statistics() の戻り値
+            
+        Returns:
+            str: JSON表現のSHA-1から作成した強いETag
+        """
+        return self._encode_statistics(stats)[1]
+    
+    def get_job_statistics_json(self, stats: Mapping[str, Any]) -> bytes:
+        """get_job_statistics() が返した統計情報のJSON表現を取得"""
+        return self._encode_statistics(stats)[0]
+    
+    def _encode_statistics(self, stats: Mapping[str, Any]) -> Tuple[bytes, str]:
+        """統計情報をJSONに変換してETagを計算（同じマッピングに対しては前回の結果を再利用）"""
+        encoded = self._stats_encoded
+        if encoded is not None and encoded[0] is stats:
+            return encoded[1], encoded[2]
+        body = orjson.dumps({name: dict(value) if isinstance(value, Mapping) else value
+                             for name, value in stats.items()})
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self._stats_encoded = (stats, body, etag)
+        return body, etag
+    
+    def _db_statistics_future(self) -> Future:
+        """
+        データベース統計の問い合わせを開始（実行中であればその問い合わせに相乗りする）
+        
+        Returns:
+            Future: 問い合わせ結果を受け取るFuture
+        """
+        with self._stats_inflight_lock:
+            future = self._stats_future
+            if future is None:
+                future = self._stats_future = _stats_executor.submit(self._get_db_statistics)
+            return future
+    
+    def _get_db_statistics(self) -> Dict[str, Any]:
+        """データベースのジョブ統計情報を取得（有効期限内はキャッシュを返す）"""
+        try:
+            if self._stats_cache_valid():
+                return self._stats_cache
+            
+            started_at = time.monotonic()
+            db = _stats_session()
+            with db.begin():
+                stats = db_manager.get_job_statistics_grouped(db)
+            self._stats_cache = stats
+            self._stats_cache_ts = started_at
+            return stats
+        finally:
+            # 結果を設定する前に枠を空け、以降の呼び出しは次の問い合わせを開始する
+            with self._stats_inflight_lock:
+                self._stats_future = None
+    
+    def _stats_cache_valid(self) -> bool:
+        """統計キャッシュが有効期限内かつ無効化後に取得されたものか"""
+        return (self._stats_cache is not None
+                and self._stats_cache_ts > self._stats_invalidated_at
+                and time.monotonic() - self._stats_cache_ts < self._stats_ttl)
+    
+    def _invalidate_statistics(self) -> None:
+        """ジョブの状態がデータベースに書き込まれた際に統計キャッシュを無効化"""
+        self._stats_invalidated_at = time.monotonic()
+
+
+# グローバルインスタンス（インポート時にはスレッドやDB接続を開始せず、初回使用時に作成）
+_job_manager_singleton: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    グローバルなJobManagerを取得（初回呼び出し時に作成）
+    
+    Returns:
+        JobManager: ジョブマネージャー
+    """
+    global _job_manager_singleton
+    if _job_manager_singleton is None:
+        with _job_manager_lock:
+            if _job_manager_singleton is None:
+                _job_manager_singleton = JobManager()
+    return _job_manager_singleton
 
 
-# グローバルインスタンス
-job_manager = JobManager() 
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """従来の job_manager 属性へのアクセスを get_job_manager() に委譲"""
+    if name == 'job_manager':
+        return get_job_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,23 +15,35 @@
 - 統計情報の提供
 """
 
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from dataclasses import asdict, dataclass
 import itertools
+import logging
+import logging.handlers
+import math
+import operator
+import orjson
+import queue
+import re
+import uuid
+from functools import lru_cache
 from enum import Enum
 import uvicorn
 import asyncio
+import hashlib
+import os
 from sqlalchemy.orm import Session
 
 # データベース関連のインポート
-from database import db_manager, FuzzerRequest, GeneratedRequest, Job as DBJob, JobResult as DBJobResult, User, get_db
+from database import db_manager, Job as DBJob, JobResult as DBJobResult, User, get_db
 
 # HTTPリクエスト送信関連のインポート
-from http_client import RequestExecutor, HTTPRequestConfig
-from job_manager import job_manager
+from http_client import HTTPClient, RequestExecutor, HTTPRequestConfig, close_shared_connector
+from job_manager import get_job_manager, job_cursor, parse_job_cursor, JobStatus
 
 # 認証関連のインポート
 from auth import auth_manager, get_current_user, get_current_active_user
@@ -52,9 +64,52 @@ from vulnerability_analysis import (
 app = FastAPI(
     title="プレースホルダ置換API",
     description="Burp Suite Intruderの4つの攻撃戦略を実装したAPI",
-    version="1.0.0"
+    version="1.0.0",
+    # 生成されたリクエストの一覧など大きなレスポンスも、C実装のorjsonでJSONに変換
+    default_response_class=ORJSONResponse
 )
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """ログレコードを書式化せずにキューへ渡すQueueHandler（トレースバックの書式化はリスナーのスレッドで行う）"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# エラーログはキュー経由でリスナーのスレッドから出力し、イベントループを止めない
+# （リスナーはアプリケーションの起動時に開始し、終了時に残りを出力して停止する）
+logger = logging.getLogger(__name__)
+logger.propagate = False
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(_DeferredQueueHandler(_log_queue))
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+
+def internal_error(message: str, exc: Exception) -> HTTPException:
+    """
+    500エラーを作成（例外の内容はサーバーのログにのみ出力）
+    
+    SQL文などを含み長大になりうる例外メッセージをレスポンスに埋め込まず、
+    ログと突き合わせるための短いエラーIDのみを返します。
+    
+    Args:
+        message (str): レスポンスに含めるエラーの概要
+        exc (Exception): 発生した例外
+        
+    Returns:
+        HTTPException: 送出する500エラー
+    """
+    error_id = uuid.uuid4().hex
+    logger.error("%s (%s)", message, error_id, exc_info=exc)
+    return HTTPException(status_code=500, detail=f"{message}（エラーID: {error_id}）")
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """処理されなかった例外を、エラーIDのみを含むJSONの500エラーとして返す（トレースバックはエラーIDとともにログに出力）"""
+    error_id = uuid.uuid4().hex
+    logger.error("未処理の例外 (%s): %s %s", error_id, request.method, request.url.path, exc_info=exc)
+    return ORJSONResponse({"detail": f"内部エラー（エラーID: {error_id}）"}, status_code=500)
+
 # ビルトインアカウントを作成する関数
 def create_builtin_account():
     """アプリケーション起動時にビルトインアカウントを作成"""
@@ -93,10 +148,26 @@ def create_builtin_account():
 async def startup_event():
     """アプリケーション起動時の処理"""
     print("アプリケーションを起動しています...")
+    _log_listener.start()
     # ビルトインアカウントを作成
     create_builtin_account()
+    # ジョブマネージャーを作成し、未完了のジョブの復元とジョブ処理スレッドを開始
+    get_job_manager()
+    # HTMLページはリクエストのたびにファイルを読まないよう、起動時に読み込んでおく
+    load_html_page("web_test.html")
+    load_html_page("history.html")
     print("アプリケーションの起動が完了しました")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """アプリケーション終了時の処理"""
+    # 実行中のジョブを停止してからジョブ処理スレッドを終了
+    await get_job_manager().shutdown()
+    # リクエスト実行で共有していた接続プールを閉じる
+    await close_shared_connector()
+    # キューに残っているログを出力してからリスナーを停止
+    _log_listener.stop()
+
 # APIルーターを作成
 from fastapi import APIRouter
 
@@ -150,22 +221,14 @@ def process_mutation_values(values: List[Union[str, MutationValue]]) -> List[str
     Returns:
         List[str]: 処理されたペイロードのリスト
     """
-    processed_payloads = []
-    
-    for value in values:
-        if isinstance(value, str):
-            # 文字列の場合はそのまま追加
-            processed_payloads.append(value)
-        elif isinstance(value, MutationValue):
-            # MutationValueの場合はrepeat機能を処理
-            if value.repeat is not None and value.repeat > 0:
-                # repeat回数分繰り返す
-                processed_payloads.append(value.value * value.repeat)
-            else:
-                # repeatが指定されていない場合はそのまま追加
-                processed_payloads.append(value.value)
-    
-    return processed_payloads
+    # 要素の型はPydanticの検証時に str か MutationValue に確定しているため、型の比較のみで振り分ける
+    # （MutationValueはrepeatが正の場合のみvalueをrepeat回繰り返す）
+    return [
+        value if type(value) is str
+        else value.value * value.repeat if (value.repeat or 0) > 0
+        else value.value
+        for value in values
+    ]
 
 class Mutation(BaseModel):
     """
@@ -279,6 +342,7 @@ class HTTPRequestConfigModel(BaseModel):
         additional_headers (Dict[str, str]): 追加のヘッダー
         sequential_execution (bool): 同期実行フラグ（True: 順次実行, False: 並列実行）
         request_delay (float): リクエスト間の待機時間（秒）
+        max_concurrency (int): 並列実行時に同時に送信するリクエスト数の上限
     """
     timeout: int = 30
     follow_redirects: bool = True
@@ -288,6 +352,7 @@ class HTTPRequestConfigModel(BaseModel):
     additional_headers: Optional[Dict[str, str]] = None
     sequential_execution: bool = False
     request_delay: float = 0.0
+    max_concurrency: int = 100
 
 class ExecuteRequestModel(BaseModel):
     """
@@ -476,9 +541,11 @@ class JobListResponseModel(BaseModel):
     Attributes:
         jobs (List[Dict[str, Any]]): ジョブのリスト
         total (int): 総ジョブ数
+        next_cursor (Optional[str]): 続きのジョブを取得するためのカーソル（続きがない場合はNone）
     """
     jobs: List[Dict[str, Any]]
     total: int
+    next_cursor: Optional[str] = None
 
 # 認証関連のPydanticモデル
 class UserRegisterRequest(BaseModel):
@@ -546,11 +613,147 @@ class TokenData(BaseModel):
     """
     user_id: Optional[int] = None
 
+@dataclass(slots=True)
+class GeneratedItem:
+    """攻撃で生成された1件のリクエスト（辞書への変換はJSON化・保存時に一度だけ行う）"""
+    request: str
+    placeholder: Optional[str] = None
+    payload: Optional[str] = None
+    payloads: Optional[Dict[str, str]] = None
+    position: Optional[int] = None
+    applied_to: Optional[List[str]] = None
+    strategy: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換（攻撃戦略ごとに使用しないフィールドは含めない）"""
+        return {name: value for name in self.__slots__ if (value := getattr(self, name)) is not None}
+
+def dumps_generated(content: Any) -> bytes:
+    """
+    生成されたリクエスト（GeneratedItem）を含む値をJSONバイト列に変換
+    
+    Args:
+        content (Any): GeneratedItem、またはそれを含むリスト・辞書
+        
+    Returns:
+        bytes: JSONバイト列
+    """
+    return orjson.dumps(content, default=GeneratedItem.to_dict, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+
+def compile_placeholder_pattern(placeholders: List[str]) -> "re.Pattern[str]":
+    """
+    いずれかのプレースホルダ <<名前>> に一致し、名前をグループ1として取り出す正規表現を作成
+    
+    Args:
+        placeholders (List[str]): プレースホルダ名のリスト
+        
+    Returns:
+        re.Pattern[str]: コンパイル済みの正規表現（プレースホルダがない場合は何にも一致しない）
+    """
+    if not placeholders:
+        return re.compile(r"(?!)")
+    return re.compile("<<(" + "|".join(re.escape(placeholder) for placeholder in placeholders) + ")>>")
+
+@lru_cache(maxsize=256)
+def split_template(template: str, placeholders: Optional[Tuple[str, ...]] = None) -> Tuple[str, ...]:
+    """
+    テンプレートを固定部分とプレースホルダ名に分割（同じテンプレートの分割結果はキャッシュ）
+    
+    キャッシュは呼び出し間で共有されるため、結果は変更できないタプルで返します。
+    
+    Args:
+        template (str): プレースホルダを含むテンプレート文字列
+        placeholders (Optional[Tuple[str, ...]]): プレースホルダ名のタプル
+            （Noneの場合はSniper攻撃用の固定プレースホルダ <<>> で分割）
+        
+    Returns:
+        Tuple[str, ...]: 分割されたテンプレート（placeholders指定時は奇数番目がプレースホルダ名）
+    """
+    if placeholders is None:
+        return tuple(template.split("<<>>"))
+    return tuple(compile_placeholder_pattern(placeholders).split(template))
+
+@lru_cache(maxsize=256)
+def strip_placeholders(template: str, placeholders: Optional[Tuple[str, ...]] = None) -> str:
+    """
+    全てのプレースホルダを空文字列で置換したオリジナルのテンプレートを作成（結果はキャッシュ）
+    
+    split_template の分割結果の固定部分を連結するだけで求められるため、
+    テンプレートを置換で再走査しません。
+    
+    Args:
+        template (str): プレースホルダを含むテンプレート文字列
+        placeholders (Optional[Tuple[str, ...]]): プレースホルダ名のタプル
+            （Noneの場合はSniper攻撃用の固定プレースホルダ <<>> を対象とする）
+        
+    Returns:
+        str: オリジナルのテンプレート
+    """
+    parts = split_template(template, placeholders)
+    if placeholders is None:
+        return "".join(parts)
+    return "".join(parts[0::2])
+
+def compile_slot_filler(template: str, placeholders: List[str]) -> Callable[[Sequence[str]], str]:
+    """
+    プレースホルダの位置順に並んだペイロードからリクエストを組み立てる関数を作成
+    
+    テンプレートの分割と、各枠に入れるペイロードの位置の解決は最初に一度だけ行い、
+    組み立て時は split_template の固定部分とペイロードを交互に並べて "".join で連結するのみで
+    リクエストを作成します。
+    
+    Args:
+        template (str): プレースホルダを含むテンプレート文字列
+        placeholders (List[str]): プレースホルダ名のリスト
+        
+    Returns:
+        Callable[[Sequence[str]], str]: placeholders と同じ順のペイロードを受け取り、リクエストを返す関数
+    """
+    parts = split_template(template, tuple(placeholders))
+    if len(parts) == 1:
+        return lambda payloads: template
+    
+    # 同名のプレースホルダが複数ある場合は、後ろのペイロードを使用（dict(zip(...)) と同じ）
+    index_of = {placeholder: i for i, placeholder in enumerate(placeholders)}
+    sources = [index_of[placeholder] for placeholder in parts[1::2]]
+    if len(sources) > 1:
+        pick = operator.itemgetter(*sources)
+    else:
+        pick = lambda payloads: (payloads[sources[0]],)
+    
+    def fill(payloads: Sequence[str]) -> str:
+        # 分割結果（キャッシュで共有）は書き換えず、呼び出しごとのリストで枠をペイロードに置き換える
+        pieces = list(parts)
+        pieces[1::2] = pick(payloads)
+        return "".join(pieces)
+    
+    return fill
+
+# Cluster Bomb攻撃で生成できる組み合わせ数の上限（全ペイロードセットの積がこれを超える場合は拒否）
+MAX_COMBINATIONS = int(os.getenv('MAX_COMBINATIONS', '1000000'))
+
 class FuzzerEngine:
     def __init__(self):
         pass
     
-    def sniper_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
+    def original_template(self, template: str, placeholders: Optional[List[str]] = None) -> str:
+        """
+        プレースホルダを空文字列で置換したオリジナルのテンプレートを取得（各攻撃の最初のリクエスト）
+        
+        Args:
+            template (str): プレースホルダを含むテンプレート文字列
+            placeholders (Optional[List[str]]): プレースホルダ名のリスト（Noneの場合は <<>> を対象とする）
+            
+        Returns:
+            str: オリジナルのテンプレート
+        """
+        return strip_placeholders(template, None if placeholders is None else tuple(placeholders))
+    
+    def sniper_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[GeneratedItem]:
+        """Sniper攻撃で生成される全てのリクエストをリストで取得（詳細は iter_sniper_attack を参照）"""
+        return list(self.iter_sniper_attack(template, placeholders, payload_sets))
+    
+    def iter_sniper_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> Iterator[GeneratedItem]:
         """
         Sniper攻撃: 各ペイロードを各位置に順番に配置
         
@@ -563,8 +766,8 @@ class FuzzerEngine:
             placeholders (List[str]): 使用されない（Sniper攻撃では固定プレースホルダを使用）
             payload_sets (List[PayloadSet]): ペイロードセットのリスト（最初のセットのみ使用）
             
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
+        Yields:
+            GeneratedItem: 生成されたリクエスト（オリジナルのテンプレートが最初）
             
         Raises:
             ValueError: ペイロードセットが提供されていない場合
@@ -573,51 +776,39 @@ class FuzzerEngine:
             raise ValueError("少なくとも1つのペイロードセットが必要です")
         
         payload_set = payload_sets[0]
-        requests = []
+        
+        # Sniper攻撃では固定のプレースホルダ <<>> を使用し、テンプレートの分割結果はキャッシュを使う
+        placeholder_pattern = "<<>>"
+        parts = split_template(template)
         
         # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template.replace("<<>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payload": "",
-            "position": 0
-        })
+        original_template = self.original_template(template)
+        yield GeneratedItem(request=original_template, placeholder="original", payload="", position=0)
         
-        # Sniper攻撃では固定のプレースホルダ <<>> を使用
-        placeholder_pattern = "<<>>"
-        placeholder_count = template.count(placeholder_pattern)
+        # 各プレースホルダの位置をオリジナルのテンプレート上のオフセットとして一度だけ計算
+        positions_list = list(itertools.accumulate(len(part) for part in parts[:-1]))
         
         for payload in payload_set.payloads:
-            for position in range(placeholder_count):
-                result = template
-                # 指定された位置のプレースホルダのみを置換
-                current_pos = 0
-                start = 0
-                while current_pos <= position:
-                    pos = result.find(placeholder_pattern, start)
-                    if pos == -1:
-                        break
-                    if current_pos == position:
-                        # この位置のプレースホルダを置換
-                        result = result[:pos] + payload + result[pos + len(placeholder_pattern):]
-                        break
-                    start = pos + 1
-                    current_pos += 1
+            # 「<」「>」を含まない（空でない）ペイロードは前後の文字とプレースホルダを形成しないため、
+            # オリジナルのテンプレートへの挿入のみで、置換してから残りを空文字列にした結果と一致する
+            simple = bool(payload) and "<" not in payload and ">" not in payload
+            for position, offset in enumerate(positions_list):
+                if simple:
+                    # 指定された位置にのみペイロードを挿入（他のプレースホルダは既に空文字列）
+                    result = original_template[:offset] + payload + original_template[offset:]
+                else:
+                    # 指定された位置のプレースホルダのみを置換し、置換されていないプレースホルダ
+                    # （ペイロードと前後の文字で形成されたものを含む）を空文字列で置換
+                    result = (placeholder_pattern.join(parts[:position + 1]) + payload +
+                              placeholder_pattern.join(parts[position + 1:])).replace(placeholder_pattern, "")
                 
-                # 置換されていないプレースホルダを空文字列で置換
-                result = result.replace(placeholder_pattern, "")
-                
-                requests.append({
-                    "request": result,
-                    "placeholder": "<<>>",
-                    "payload": payload,
-                    "position": position + 1
-                })
-        
-        return requests
+                yield GeneratedItem(request=result, placeholder="<<>>", payload=payload, position=position + 1)
+    
+    def battering_ram_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[GeneratedItem]:
+        """Battering Ram攻撃で生成される全てのリクエストをリストで取得（詳細は iter_battering_ram_attack を参照）"""
+        return list(self.iter_battering_ram_attack(template, placeholders, payload_sets))
     
-    def battering_ram_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
+    def iter_battering_ram_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> Iterator[GeneratedItem]:
         """
         Battering Ram攻撃: 同じペイロードを全ての位置に同時に配置
         
@@ -629,8 +820,8 @@ class FuzzerEngine:
             placeholders (List[str]): プレースホルダ名のリスト
             payload_sets (List[PayloadSet]): ペイロードセットのリスト（最初のセットのみ使用）
             
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
+        Yields:
+            GeneratedItem: 生成されたリクエスト（オリジナルのテンプレートが最初）
             
         Raises:
             ValueError: ペイロードセットが提供されていない場合
@@ -639,32 +830,23 @@ class FuzzerEngine:
             raise ValueError("少なくとも1つのペイロードセットが必要です")
         
         payload_set = payload_sets[0]
-        requests = []
+        # テンプレートは一度だけ分割し、固定部分をペイロードを区切りとして連結する
+        # （全ての枠に同じペイロードが入るため、1回のjoinで必要な長さを確保して組み立てられる）
+        literals = split_template(template, tuple(placeholders))[0::2]
         
         # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template
-        for placeholder in placeholders:
-            original_template = original_template.replace(f"<<{placeholder}>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payload": "",
-            "applied_to": []
-        })
+        original_template = self.original_template(template, placeholders)
+        yield GeneratedItem(request=original_template, placeholder="original", payload="", applied_to=[])
         
         for payload in payload_set.payloads:
-            result = template
-            for placeholder in placeholders:
-                result = result.replace(f"<<{placeholder}>>", payload)
-            requests.append({
-                "request": result,
-                "payload": payload,
-                "applied_to": placeholders
-            })
-        
-        return requests
+            result = payload.join(literals)
+            yield GeneratedItem(request=result, payload=payload, applied_to=placeholders)
     
-    def pitchfork_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
+    def pitchfork_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[GeneratedItem]:
+        """Pitchfork攻撃で生成される全てのリクエストをリストで取得（詳細は iter_pitchfork_attack を参照）"""
+        return list(self.iter_pitchfork_attack(template, placeholders, payload_sets))
+    
+    def iter_pitchfork_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> Iterator[GeneratedItem]:
         """
         Pitchfork攻撃: 各位置に異なるペイロードセットを使用し、同時に配置
         
@@ -677,8 +859,8 @@ class FuzzerEngine:
             placeholders (List[str]): プレースホルダ名のリスト
             payload_sets (List[PayloadSet]): ペイロードセットのリスト
             
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
+        Yields:
+            GeneratedItem: 生成されたリクエスト（オリジナルのテンプレートが最初）
             
         Raises:
             ValueError: ペイロードセットの数がプレースホルダの数と一致しない場合
@@ -686,89 +868,86 @@ class FuzzerEngine:
         if len(payload_sets) != len(placeholders):
             raise ValueError("ペイロードセットの数はプレースホルダの数と一致する必要があります")
         
-        requests = []
+        # テンプレートは一度だけ分割し、組み合わせごとにプレースホルダの枠を埋めて連結する
+        fill = compile_slot_filler(template, placeholders)
         
         # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template
-        for placeholder in placeholders:
-            original_template = original_template.replace(f"<<{placeholder}>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payloads": {}
-        })
+        original_template = self.original_template(template, placeholders)
+        yield GeneratedItem(request=original_template, placeholder="original", payloads={})
         
         # 最小のペイロードセットのサイズを取得
         min_payload_count = min(len(ps.payloads) for ps in payload_sets)
         
         for i in range(min_payload_count):
-            result = template
-            placeholder_payload_map = {}
-            
-            for j, (placeholder, payload_set) in enumerate(zip(placeholders, payload_sets)):
-                payload = payload_set.payloads[i]
-                result = result.replace(f"<<{placeholder}>>", payload)
-                placeholder_payload_map[placeholder] = payload
+            combination = [payload_set.payloads[i] for payload_set in payload_sets]
+            placeholder_payload_map = dict(zip(placeholders, combination))
+            result = fill(combination)
             
-            requests.append({
-                "request": result,
-                "payloads": placeholder_payload_map
-            })
-        
-        return requests
+            yield GeneratedItem(request=result, payloads=placeholder_payload_map)
     
-    def cluster_bomb_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
+    def cluster_bomb_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet],
+                            limit: Optional[int] = None) -> List[GeneratedItem]:
+        """Cluster Bomb攻撃で生成される全てのリクエストをリストで取得（詳細は iter_cluster_bomb_attack を参照）"""
+        return list(self.iter_cluster_bomb_attack(template, placeholders, payload_sets, limit))
+    
+    def iter_cluster_bomb_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet],
+                                 limit: Optional[int] = None) -> Iterator[GeneratedItem]:
         """
         Cluster Bomb攻撃: 全てのペイロードの組み合わせをテスト
         
         Cluster Bomb攻撃では、各プレースホルダに対応するペイロードセットがあり、
         全てのペイロードの組み合わせをテストします。
+        生成する組み合わせ数が MAX_COMBINATIONS を超える場合は、生成を始める前に拒否します。
         
         Args:
             template (str): プレースホルダを含むテンプレート文字列
             placeholders (List[str]): プレースホルダ名のリスト
             payload_sets (List[PayloadSet]): ペイロードセットのリスト
+            limit (Optional[int]): 先頭から生成する組み合わせ数の上限（Noneの場合は全ての組み合わせ）
             
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
+        Yields:
+            GeneratedItem: 生成されたリクエスト（オリジナルのテンプレートが最初）
             
         Raises:
-            ValueError: ペイロードセットの数がプレースホルダの数と一致しない場合
+            ValueError: ペイロードセットの数がプレースホルダの数と一致しない場合、
+                または組み合わせ数が上限を超える場合
         """
         if len(payload_sets) != len(placeholders):
             raise ValueError("ペイロードセットの数はプレースホルダの数と一致する必要があります")
+        if limit is not None and limit < 0:
+            raise ValueError("limitは0以上である必要があります")
+        
+        # 組み合わせを展開する前に総数だけを計算し、上限を超える入力は即座に拒否する
+        total_combinations = math.prod(len(ps.payloads) for ps in payload_sets)
+        if limit is not None:
+            total_combinations = min(total_combinations, limit)
+        if total_combinations > MAX_COMBINATIONS:
+            raise ValueError(
+                f"組み合わせ数が多すぎます（{total_combinations}件、上限: {MAX_COMBINATIONS}件）。"
+                "ペイロードを減らすか、limitを指定してください"
+            )
         
-        requests = []
+        # テンプレートは一度だけ分割し、組み合わせごとにプレースホルダの枠を埋めて連結する
+        fill = compile_slot_filler(template, placeholders)
         
         # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template
-        for placeholder in placeholders:
-            original_template = original_template.replace(f"<<{placeholder}>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payloads": {}
-        })
+        original_template = self.original_template(template, placeholders)
+        yield GeneratedItem(request=original_template, placeholder="original", payloads={})
         
-        # 全てのペイロードの組み合わせを生成
-        payload_combinations = list(itertools.product(*[ps.payloads for ps in payload_sets]))
+        # 全てのペイロードの組み合わせを、リストに展開せず順に生成
+        # （組み合わせの各値とマップのキーは payload_sets / placeholders の文字列をそのまま参照し、
+        #   同じ文字列が生成されたリクエストごとに複製されることはない）
+        payload_combinations = itertools.product(*(ps.payloads for ps in payload_sets))
+        if limit is not None:
+            payload_combinations = itertools.islice(payload_combinations, limit)
         
         for combination in payload_combinations:
-            result = template
-            placeholder_payload_map = {}
-            
-            for placeholder, payload in zip(placeholders, combination):
-                result = result.replace(f"<<{placeholder}>>", payload)
-                placeholder_payload_map[placeholder] = payload
+            placeholder_payload_map = dict(zip(placeholders, combination))
+            result = fill(combination)
             
-            requests.append({
-                "request": result,
-                "payloads": placeholder_payload_map
-            })
-        
-        return requests
+            yield GeneratedItem(request=result, payloads=placeholder_payload_map)
 
-    def mutation_attack(self, template: str, mutations: List[Mutation]) -> List[Dict[str, Any]]:
+    def mutation_attack(self, template: str, mutations: List[Mutation]) -> List[GeneratedItem]:
         """
         変異ベース攻撃: 各トークンに対して指定された変異を適用
         
@@ -780,7 +959,7 @@ class FuzzerEngine:
             mutations (List[Mutation]): 変異のリスト
             
         Returns:
-            List[Dict[str, Any]]: 生成されたリクエストのリスト
+            List[GeneratedItem]: 生成されたリクエストのリスト
         """
         requests = []
         
@@ -788,28 +967,27 @@ class FuzzerEngine:
         original_template = template
         for mutation in mutations:
             original_template = original_template.replace(mutation.token, "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payload": "",
-            "position": 0
-        })
+        requests.append(GeneratedItem(request=original_template, placeholder="original", payload="", position=0))
         
         # 各変異に対して処理
         for mutation in mutations:
             # 変異値を処理してペイロードリストを生成
             payloads = process_mutation_values(mutation.values)
             
+            # テンプレートはトークンの位置で一度だけ分割し、各リクエストはペイロードで連結して作成
+            # （str.replace と同じく全ての出現箇所を置換。空のトークンは分割できないため置換を使用）
+            pieces = template.split(mutation.token) if mutation.token else None
+            
             # 各ペイロードに対してリクエストを生成
             for i, payload in enumerate(payloads):
-                result = template.replace(mutation.token, payload)
-                requests.append({
-                    "request": result,
-                    "placeholder": mutation.token,
-                    "payload": payload,
-                    "position": i + 1,
-                    "strategy": mutation.strategy
-                })
+                result = payload.join(pieces) if pieces is not None else template.replace(mutation.token, payload)
+                requests.append(GeneratedItem(
+                    request=result,
+                    placeholder=mutation.token,
+                    payload=payload,
+                    position=i + 1,
+                    strategy=mutation.strategy
+                ))
         
         return requests
 
@@ -837,9 +1015,9 @@ async def execute_single_request_async(request_data: Dict[str, Any], http_config
             config.base_url = http_config.get('base_url', 'localhost:8000')
             config.additional_headers = http_config.get('additional_headers')
         
-        # リクエスト実行
-        executor = RequestExecutor(config)
-        result = await executor.execute_request(request_data['request'])
+        # リクエスト実行（共有接続プールの接続を再利用）
+        async with HTTPClient() as client:
+            result = asdict(await client.send_request(request_data['request'], config))
         
         return {
             'request': request_data,
@@ -853,8 +1031,31 @@ async def execute_single_request_async(request_data: Dict[str, Any], http_config
             'success': False
         }
 
+def _placeholder_response(strategy: str, requests: List[GeneratedItem], fuzzer_request_id: int) -> Response:
+    """
+    PlaceholderResponse と同じ形式のJSONレスポンスを作成
+    
+    Args:
+        strategy (str): 使用された攻撃戦略
+        requests (List[GeneratedItem]): 生成されたリクエストのリスト
+        fuzzer_request_id (int): データベースに保存されたリクエストのID
+        
+    Returns:
+        Response: JSONレスポンス
+    """
+    return Response(
+        content=dumps_generated({
+            "strategy": strategy,
+            "total_requests": len(requests),
+            "requests": requests,
+            "request_id": fuzzer_request_id
+        }),
+        media_type="application/json"
+    )
+
 @app.post("/api/replace-placeholders", response_model=PlaceholderResponse)
-async def replace_placeholders(request: PlaceholderRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+async def replace_placeholders(request: PlaceholderRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user),
+                               limit: Optional[int] = None):
     """
     プレースホルダ置換APIエンドポイント
     
@@ -865,6 +1066,7 @@ async def replace_placeholders(request: PlaceholderRequest, db: Session = Depend
     Args:
         request (PlaceholderRequest): 置換リクエスト
         db (Session): データベースセッション
+        limit (Optional[int]): 生成する組み合わせ数の上限（Cluster Bomb攻撃のみ、先頭から取得）
         
     Returns:
         PlaceholderResponse: 攻撃戦略名、総リクエスト数、リクエストリスト、リクエストIDを含むレスポンス
@@ -873,15 +1075,15 @@ async def replace_placeholders(request: PlaceholderRequest, db: Session = Depend
         HTTPException: 無効な攻撃戦略が指定された場合
     """
     try:
-        # 攻撃戦略に基づいて適切なメソッドを呼び出し
+        # 攻撃戦略に基づいて適切なメソッドを呼び出し（生成処理はイベントループを止めないようスレッドで実行）
         if request.strategy == AttackStrategy.SNIPER:
-            requests = fuzzer.sniper_attack(request.template, request.placeholders, request.payload_sets)
+            requests = await asyncio.to_thread(fuzzer.sniper_attack, request.template, request.placeholders, request.payload_sets)
         elif request.strategy == AttackStrategy.BATTERING_RAM:
-            requests = fuzzer.battering_ram_attack(request.template, request.placeholders, request.payload_sets)
+            requests = await asyncio.to_thread(fuzzer.battering_ram_attack, request.template, request.placeholders, request.payload_sets)
         elif request.strategy == AttackStrategy.PITCHFORK:
-            requests = fuzzer.pitchfork_attack(request.template, request.placeholders, request.payload_sets)
+            requests = await asyncio.to_thread(fuzzer.pitchfork_attack, request.template, request.placeholders, request.payload_sets)
         elif request.strategy == AttackStrategy.CLUSTER_BOMB:
-            requests = fuzzer.cluster_bomb_attack(request.template, request.placeholders, request.payload_sets)
+            requests = await asyncio.to_thread(fuzzer.cluster_bomb_attack, request.template, request.placeholders, request.payload_sets, limit)
         else:
             raise HTTPException(status_code=400, detail=f"無効な攻撃戦略: {request.strategy}")
         
@@ -889,7 +1091,7 @@ async def replace_placeholders(request: PlaceholderRequest, db: Session = Depend
         payload_sets_dict = [{"name": ps.name, "payloads": ps.payloads} for ps in request.payload_sets]
         
         # データベースに保存
-        fuzzer_request = db_manager.save_fuzzer_request(
+        fuzzer_request_id = db_manager.save_fuzzer_request(
             db=db,
             template=request.template,
             placeholders=request.placeholders,
@@ -898,16 +1100,88 @@ async def replace_placeholders(request: PlaceholderRequest, db: Session = Depend
             generated_requests=requests
         )
         
-        return PlaceholderResponse(
-            strategy=request.strategy.value,
-            total_requests=len(requests),
-            requests=requests,
-            request_id=fuzzer_request.id
-        )
+        # 生成されたリクエストはPydanticの検証を経ずに、そのままJSONへ変換して返す
+        return _placeholder_response(request.strategy.value, requests, fuzzer_request_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"内部エラー: {str(e)}")
+        raise internal_error("内部エラー", e)
+
+def _stream_generated_requests(generated: Iterator[GeneratedItem], fuzzer_request_id: int,
+                               batch_size: int = 1000) -> Iterator[bytes]:
+    """
+    生成されたリクエストを batch_size件ごとにデータベースへ保存しながら、NDJSON（1行1件）として返す
+    
+    クライアントが途中で切断した場合も、それまでに保存した件数を総数として記録します。
+    
+    Args:
+        generated (Iterator[GeneratedItem]): 生成されたリクエストのイテレータ
+        fuzzer_request_id (int): 保存先のファザーリクエストのID
+        batch_size (int): まとめて保存・送信する件数
+        
+    Yields:
+        bytes: batch_size件分のNDJSON
+    """
+    total = 0
+    with db_manager.SessionLocal() as db:
+        try:
+            while True:
+                batch = list(itertools.islice(generated, batch_size))
+                if not batch:
+                    break
+                db_manager.save_generated_requests(db, fuzzer_request_id, batch, start_number=total + 1)
+                total += len(batch)
+                yield b"".join([dumps_generated(req) + b"\n" for req in batch])
+        finally:
+            db_manager.update_fuzzer_request_total(db, fuzzer_request_id, total)
+
+@app.post("/api/replace-placeholders/stream")
+async def replace_placeholders_stream(request: PlaceholderRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user),
+                                      limit: Optional[int] = None):
+    """
+    プレースホルダ置換APIエンドポイント（NDJSONストリーミング版）
+    
+    生成されたリクエストを全件メモリに保持せず、生成しながら1行1件のJSON
+    （application/x-ndjson）として返します。データベースへの保存も送信と並行して
+    まとめて行い、リクエストIDは X-Request-Id ヘッダーで返します。
+    
+    Args:
+        request (PlaceholderRequest): 置換リクエスト
+        db (Session): データベースセッション
+        limit (Optional[int]): 生成する組み合わせ数の上限（Cluster Bomb攻撃のみ、先頭から取得）
+        
+    Returns:
+        StreamingResponse: 生成されたリクエストのNDJSONストリーム
+        
+    Raises:
+        HTTPException: 入力が攻撃戦略の条件を満たさない場合
+    """
+    if request.strategy == AttackStrategy.CLUSTER_BOMB:
+        generated = fuzzer.iter_cluster_bomb_attack(request.template, request.placeholders, request.payload_sets, limit)
+    else:
+        generated = getattr(fuzzer, f"iter_{request.strategy.value}_attack")(
+            request.template, request.placeholders, request.payload_sets
+        )
+    try:
+        # 最初の1件（オリジナルのテンプレート）を取り出し、入力の検証エラーはストリーム開始前に返す
+        first = next(generated)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    fuzzer_request_id = db_manager.create_fuzzer_request(
+        db,
+        template=request.template,
+        placeholders=request.placeholders,
+        strategy=request.strategy.value,
+        payload_sets=[{"name": ps.name, "payloads": ps.payloads} for ps in request.payload_sets]
+    )
+    db.commit()
+    
+    return StreamingResponse(
+        _stream_generated_requests(itertools.chain([first], generated), fuzzer_request_id),
+        media_type="application/x-ndjson",
+        headers={"X-Request-Id": str(fuzzer_request_id)}
+    )
 
 @app.post("/api/mutations", response_model=PlaceholderResponse)
 async def apply_mutations(request: MutationRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
@@ -926,39 +1200,19 @@ async def apply_mutations(request: MutationRequest, db: Session = Depends(get_db
     """
     try:
         # 変異ベース攻撃を実行
-        requests = fuzzer.mutation_attack(request.template, request.mutations)
+        requests = await asyncio.to_thread(fuzzer.mutation_attack, request.template, request.mutations)
         
-        # データベースに保存
-        fuzzer_request = FuzzerRequest(
+        # データベースに保存（mutationsではpayload_setsは使用しない）
+        fuzzer_request_id = db_manager.save_fuzzer_request(
+            db=db,
             template=request.template,
+            placeholders=[mutation.token for mutation in request.mutations],
             strategy="mutation",
-            total_requests=len(requests)
+            payload_sets=[],
+            generated_requests=requests
         )
-        fuzzer_request.set_placeholders([mutation.token for mutation in request.mutations])
-        fuzzer_request.set_payload_sets([])  # mutationsではpayload_setsは使用しない
-        db.add(fuzzer_request)
-        db.commit()
-        db.refresh(fuzzer_request)
-        
-        # 生成されたリクエストをデータベースに保存
-        for i, req in enumerate(requests):
-            generated_request = GeneratedRequest(
-                fuzzer_request_id=fuzzer_request.id,
-                request_number=i + 1,
-                request_content=req["request"],
-                placeholder=req.get("placeholder", ""),
-                payload=req.get("payload", ""),
-                position=req.get("position", 0)
-            )
-            db.add(generated_request)
-        db.commit()
         
-        return PlaceholderResponse(
-            strategy="mutation",
-            total_requests=len(requests),
-            requests=requests,
-            request_id=fuzzer_request.id
-        )
+        return _placeholder_response("mutation", requests, fuzzer_request_id)
         
     except Exception as e:
         db.rollback()
@@ -1034,7 +1288,7 @@ async def get_history(db: Session = Depends(get_db), limit: int = 50, offset: in
         history.append(FuzzerRequestResponse(
             id=req.id,
             template=req.template,
-            placeholders=req.get_placeholders(),
+            placeholders=req.placeholders or [],
             strategy=req.strategy,
             total_requests=req.total_requests,
             created_at=req.created_at.isoformat() if req.created_at else ""
@@ -1062,20 +1316,7 @@ async def get_request_detail(request_id: int, db: Session = Depends(get_db), cur
         raise HTTPException(status_code=404, detail="リクエストが見つかりません")
     
     # 生成されたリクエストを取得
-    generated_requests = []
-    for gen_req in fuzzer_request.generated_requests:
-        req_dict = {
-            "request": gen_req.request_content,
-            "placeholder": gen_req.placeholder,
-            "payload": gen_req.payload,
-            "position": gen_req.position
-        }
-        
-        # applied_toフィールドがある場合は追加
-        if gen_req.applied_to:
-            req_dict["applied_to"] = gen_req.get_applied_to()
-        
-        generated_requests.append(req_dict)
+    generated_requests = [gen_req.to_dict() for gen_req in fuzzer_request.generated_requests]
     
     return PlaceholderResponse(
         strategy=fuzzer_request.strategy,
@@ -1137,58 +1378,24 @@ async def execute_requests(request: ExecuteRequestModel, db: Session = Depends(g
         HTTPException: リクエストが見つからない場合
     """
     try:
-        # リクエストを取得
-        fuzzer_request = db_manager.get_fuzzer_request_by_id(db, request.request_id)
-        if not fuzzer_request:
+        # 生成されたリクエストの総数のみを取得（リクエスト本体はジョブの実行時に読み込まれる）
+        total_requests = db_manager.get_fuzzer_request_total(db, request.request_id)
+        if total_requests is None:
             raise HTTPException(status_code=404, detail="リクエストが見つかりません")
         
-        # 生成されたリクエストを取得
-        generated_requests = []
-        for gen_req in fuzzer_request.generated_requests:
-            req_dict = {
-                "request": gen_req.request_content,
-                "placeholder": gen_req.placeholder,
-                "payload": gen_req.payload,
-                "position": gen_req.position
-            }
-            
-            # applied_toフィールドがある場合は追加
-            if gen_req.applied_to:
-                req_dict["applied_to"] = gen_req.get_applied_to()
-            
-            generated_requests.append(req_dict)
-        
-        # HTTP設定を辞書形式に変換
-        http_config_dict = None
-        if request.http_config:
-            http_config_dict = {
-                'timeout': request.http_config.timeout,
-                'follow_redirects': request.http_config.follow_redirects,
-                'verify_ssl': request.http_config.verify_ssl,
-                'scheme': request.http_config.scheme,
-                'base_url': request.http_config.base_url,
-                'additional_headers': request.http_config.additional_headers,
-                'sequential_execution': request.http_config.sequential_execution,
-                'request_delay': request.http_config.request_delay
-            }
+        # HTTP設定を辞書形式に変換（キーはモデルのフィールド名のまま）
+        http_config_dict = request.http_config.model_dump() if request.http_config else None
         
         # ジョブを作成
         job_name = f"Execute Requests - ID {request.request_id}"
-        job_id = job_manager.create_job(
+        job_id = get_job_manager().create_job(
             name=job_name,
             request_id=request.request_id,
-            total_requests=len(generated_requests),
+            total_requests=total_requests,
             http_config=http_config_dict
         )
         
-        # バックグラウンドでジョブを実行
-        asyncio.create_task(
-            job_manager.execute_requests_job(
-                job_id=job_id,
-                requests=generated_requests,
-                http_config=http_config_dict
-            )
-        )
+        # ジョブはJobManagerの処理キューに投入され、バックグラウンドで実行される
         
         return JobResponseModel(
             job_id=job_id,
@@ -1199,16 +1406,37 @@ async def execute_requests(request: ExecuteRequestModel, db: Session = Depends(g
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"実行エラー: {str(e)}")
+        raise internal_error("実行エラー", e)
+
+def load_single_request(request_id: int, position: int) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    個別実行するリクエストをデータベースから取得（スレッドで実行するため、専用のセッションを使用）
+    
+    指定された位置の生成されたリクエストのみを1行取得し、見つからない場合のみ
+    ファザーリクエスト自体の有無を確認します。
+    
+    Args:
+        request_id (int): ファザーリクエストのID
+        position (int): リクエストの位置（0始まり）
+        
+    Returns:
+        Tuple[Optional[Dict[str, Any]], bool]: （生成されたリクエスト（見つからない場合はNone）,
+            ファザーリクエストが存在するか）
+    """
+    with db_manager.SessionLocal() as db:
+        # リクエスト番号は1始まり
+        gen_req = db_manager.get_generated_request(db, request_id, position + 1) if position >= 0 else None
+        if gen_req is not None:
+            return gen_req.to_dict(), True
+        return None, db_manager.fuzzer_request_exists(db, request_id)
 
 @app.post("/api/execute-single-request", response_model=ExecuteSingleResponseModel)
-async def execute_single_request(request: ExecuteSingleRequestModel, db: Session = Depends(get_db)):
+async def execute_single_request(request: ExecuteSingleRequestModel):
     """
     個別のリクエストを実行するエンドポイント
     
     Args:
         request (ExecuteSingleRequestModel): 個別実行リクエスト
-        db (Session): データベースセッション
         
     Returns:
         ExecuteSingleResponseModel: 実行結果
@@ -1216,106 +1444,117 @@ async def execute_single_request(request: ExecuteSingleRequestModel, db: Session
     Raises:
         HTTPException: リクエストが見つからない場合、または位置が無効な場合
     """
-    # ファザーリクエストを取得
-    fuzzer_request = db_manager.get_fuzzer_request_by_id(db, request.request_id)
-    if not fuzzer_request:
-        raise HTTPException(status_code=404, detail="リクエストが見つかりません")
-    
-    # 生成されたリクエストを取得
-    generated_requests = []
-    for gen_req in fuzzer_request.generated_requests:
-        req_dict = {
-            "request": gen_req.request_content,
-            "placeholder": gen_req.placeholder,
-            "payload": gen_req.payload,
-            "position": gen_req.position
-        }
-        
-        # applied_toフィールドがある場合は追加
-        if gen_req.applied_to:
-            req_dict["applied_to"] = gen_req.get_applied_to()
-        
-        generated_requests.append(req_dict)
-    
-    # 位置の妥当性をチェック
-    if request.position < 0 or request.position >= len(generated_requests):
+    # 同期的なデータベース読み込みはイベントループをブロックしないようスレッドで実行
+    # （セッションはスレッド間で共有できないため、リクエストのセッションは渡さない）
+    single_request, exists = await asyncio.to_thread(load_single_request, request.request_id, request.position)
+    if single_request is None:
+        # 見つからない場合は、ファザーリクエスト自体の有無でエラーを切り分ける
+        if not exists:
+            raise HTTPException(status_code=404, detail="リクエストが見つかりません")
         raise HTTPException(status_code=400, detail="無効なリクエスト位置です")
     
-    # 指定された位置のリクエストのみを取得
-    single_request = generated_requests[request.position]
-    
     # HTTP設定を準備
     http_config = None
     if request.http_config:
-        http_config = HTTPRequestConfig(
-            timeout=request.http_config.timeout,
-            follow_redirects=request.http_config.follow_redirects,
-            verify_ssl=request.http_config.verify_ssl,
-            scheme=request.http_config.scheme,
-            base_url=request.http_config.base_url,
-            headers=request.http_config.additional_headers
-            # 単一リクエストなのでsequential_executionやrequest_delayは不要
-        )
+        # 単一リクエストのため、sequential_executionやrequest_delayは使用されない
+        config_dict = request.http_config.model_dump()
+        config_dict['headers'] = config_dict.pop('additional_headers')
+        http_config = HTTPRequestConfig(**config_dict)
     
     try:
         # 単一リクエストを実行
         results = await RequestExecutor.execute_requests([single_request], http_config)
         
-        return ExecuteSingleResponseModel(
-            request_id=request.request_id,
-            position=request.position,
-            request=single_request,
-            http_response=results[0].get("http_response") if results else None
-        )
+        # 応答はサーバー側で組み立てた値のみのため、レスポンスモデルによる再検証を省いて直接返す
+        # （ExecuteSingleResponseModel はAPIドキュメントのスキーマとしてのみ使用）
+        return ORJSONResponse({
+            "request_id": request.request_id,
+            "position": request.position,
+            "request": single_request,
+            "http_response": results[0].get("http_response") if results else None
+        })
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"リクエスト実行エラー: {str(e)}")
+        raise internal_error("リクエスト実行エラー", e)
 
 @app.get("/api/jobs", response_model=JobListResponseModel)
-async def get_jobs(current_user: User = Depends(get_current_active_user)):
+async def get_jobs(status: Optional[str] = None, limit: Optional[int] = None, offset: int = 0,
+                   cursor: Optional[str] = None, current_user: User = Depends(get_current_active_user)):
     """
-    ジョブ一覧を取得するエンドポイント
+    ジョブ一覧を取得するエンドポイント（作成日時の新しい順、ページネーション付き）
+    
+    limit を指定しない場合は全件を返します。limit を指定した場合、レスポンスの next_cursor を
+    cursor に指定すると、前のページの続きから取得できます。
     
+    Args:
+        status (Optional[str]): 絞り込むジョブの状態（pending, running, completed, failed, cancelled）
+        limit (Optional[int]): 取得件数の制限（デフォルト: 制限なし）
+        offset (int): オフセット（デフォルト: 0）
+        cursor (Optional[str]): 前のページの next_cursor（指定された場合、それより古いジョブを取得）
+        
     Returns:
         JobListResponseModel: ジョブ一覧
     """
-    jobs = job_manager.get_all_jobs()
-    return JobListResponseModel(
-        jobs=[job.to_dict() for job in jobs],
-        total=len(jobs)
-    )
+    try:
+        status_filter = JobStatus.from_label(status) if status else None
+    except KeyError:
+        raise HTTPException(status_code=400, detail=f"無効なジョブ状態: {status}")
+    try:
+        before = parse_job_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # 一覧はデータベースから作成するため、イベントループを止めないようスレッドで取得
+    jobs = await asyncio.to_thread(get_job_manager().iter_jobs, status=status_filter, limit=limit,
+                                   offset=offset, before=before)
+    total = await asyncio.to_thread(get_job_manager().count_jobs, status_filter)
+    # 取得件数が上限に達した場合のみ、最後のジョブから続きを取得するカーソルを返す
+    next_cursor = job_cursor(jobs[-1]) if jobs and limit is not None and len(jobs) >= limit else None
+    # ジョブごとのJSON断片を連結し、デフォルトのJSONエンコーダーを経由せずに返す
+    content = (b'{"jobs":[' + b','.join(job.to_json_bytes() for job in jobs) +
+               b'],"total":' + str(total).encode() +
+               b',"next_cursor":' + orjson.dumps(next_cursor) + b'}')
+    return Response(content=content, media_type="application/json")
+
+# ジョブ統計情報を取得できなかった場合に返す空の統計情報（通常時と同じ形式）
+_EMPTY_JOB_STATISTICS = orjson.dumps({
+    "total_jobs": 0,
+    "status_distribution": {status.label: 0 for status in JobStatus},
+    "active_jobs": 0,
+    "total_requests": 0,
+    "avg_execution_time": 0
+})
+_EMPTY_JOB_STATISTICS_ETAG = '"' + hashlib.sha1(_EMPTY_JOB_STATISTICS).hexdigest() + '"'
 
 @app.get("/api/jobs/statistics")
-async def get_job_statistics(current_user: User = Depends(get_current_active_user)):
+async def get_job_statistics(request: Request, current_user: User = Depends(get_current_active_user)):
     """
     ジョブ統計情報を取得するエンドポイント
+    
+    統計情報が変わっていなければ、If-None-Match に一致するETagに対して 304 を返す
     """
     try:
-        stats = job_manager.get_job_statistics()
-        print(f"[DEBUG] /api/jobs/statistics response: {stats}")
-        return stats
+        stats = await get_job_manager().get_job_statistics_async()
+        etag = get_job_manager().get_job_statistics_etag(stats)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=get_job_manager().get_job_statistics_json(stats),
+                        media_type="application/json", headers={"ETag": etag})
     except Exception as e:
-        print(f"[ERROR] /api/jobs/statistics: {e}")
-        # 空の統計情報を返す
-        return {
-            "total_jobs": 0,
-            "pending_jobs": 0,
-            "running_jobs": 0,
-            "completed_jobs": 0,
-            "failed_jobs": 0,
-            "cancelled_jobs": 0,
-            "total_requests": 0,
-            "avg_execution_time": 0
-        }
+        logger.error("ジョブ統計情報の取得エラー", exc_info=e)
+        # 通常時と同じ形式の空の統計情報を返す
+        if request.headers.get("if-none-match") == _EMPTY_JOB_STATISTICS_ETAG:
+            return Response(status_code=304, headers={"ETag": _EMPTY_JOB_STATISTICS_ETAG})
+        return Response(content=_EMPTY_JOB_STATISTICS, media_type="application/json",
+                        headers={"ETag": _EMPTY_JOB_STATISTICS_ETAG})
 
 @app.get("/api/jobs/{job_id}", response_model=JobSummaryResponseModel)
-async def get_job_status(job_id: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+async def get_job_status(job_id: str, current_user: User = Depends(get_current_active_user)):
     """
     ジョブのサマリー情報を取得するエンドポイント
     
     Args:
         job_id (str): ジョブのID
-        db: データベースセッション
         
     Returns:
         JobSummaryResponseModel: ジョブのサマリー情報
@@ -1323,46 +1562,14 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db), current_use
     Raises:
         HTTPException: ジョブが見つからない場合
     """
-    # メモリ内のジョブを取得
-    job = job_manager.get_job(job_id)
+    # メモリ内のジョブを取得（メモリにない場合はデータベースから読み込まれる）
+    job = get_job_manager().get_job(job_id)
     if not job:
-        # データベースからも確認
-        db_job = db_manager.get_job_by_id(db, job_id)
-        if not db_job:
-            raise HTTPException(status_code=404, detail="ジョブが見つかりません")
-        
-        # データベースのジョブをメモリ内のJobオブジェクトに変換
-        progress_data = db_job.get_progress()
-        # JobProgressの有効なフィールドのみを抽出
-        valid_fields = ['total_requests', 'completed_requests', 'successful_requests', 
-                       'failed_requests', 'current_request', 'start_time', 'end_time', 
-                       'estimated_remaining_time']
-        progress_init_data = {k: v for k, v in progress_data.items() if k in valid_fields}
-        
-        # 日時文字列をdatetimeオブジェクトに変換
-        from datetime import datetime
-        if 'start_time' in progress_init_data and isinstance(progress_init_data['start_time'], str):
-            progress_init_data['start_time'] = datetime.fromisoformat(progress_init_data['start_time'])
-        if 'end_time' in progress_init_data and isinstance(progress_init_data['end_time'], str):
-            progress_init_data['end_time'] = datetime.fromisoformat(progress_init_data['end_time'])
-            
-        progress = job_manager.JobProgress(**progress_init_data)
-        job = job_manager.Job(
-            id=db_job.id,
-            name=db_job.name,
-            status=job_manager.JobStatus(db_job.status),
-            progress=progress,
-            created_at=db_job.created_at,
-            updated_at=db_job.updated_at,
-            request_id=db_job.fuzzer_request_id,
-            http_config=db_job.http_config,
-            results=[],
-            error_message=db_job.error_message
-        )
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
     
     return JobSummaryResponseModel(
         job_id=job.id,
-        status=job.status.value,
+        status=job.status.label,
         progress=job.progress.to_dict(),
         error_message=job.error_message,
         created_at=job.created_at.isoformat() if job.created_at else "",
@@ -1370,6 +1577,38 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db), current_use
         request_id=job.request_id
     )
 
+async def _stream_job_events(updates: AsyncIterator[Optional[bytes]]) -> AsyncIterator[bytes]:
+    """ジョブの状態をServer-Sent Eventsの形式で送信（変更がない間は接続維持のコメントを送る）"""
+    async for data in updates:
+        yield b": keep-alive\n\n" if data is None else b"data: " + data + b"\n\n"
+
+@app.get("/api/jobs/{job_id}/stream")
+async def stream_job_status(job_id: str, current_user: User = Depends(get_current_active_user)):
+    """
+    ジョブの状態・進捗をServer-Sent Events（text/event-stream）で配信するエンドポイント
+    
+    状態や進捗が変わったときのみイベントを送るため、GET /api/jobs/{job_id} を
+    繰り返しポーリングする必要はありません。ジョブが終了するとストリームを閉じます。
+    
+    Args:
+        job_id (str): ジョブのID
+        
+    Returns:
+        StreamingResponse: ジョブの状態（job_id, status, progress, updated_at, error_message）のイベント
+        
+    Raises:
+        HTTPException: ジョブが見つからない場合
+    """
+    updates = get_job_manager().watch_job(job_id)
+    if updates is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    
+    return StreamingResponse(
+        _stream_job_events(updates),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @app.post("/api/jobs/{job_id}/stop")
 async def stop_job(job_id: str):
     """
@@ -1384,7 +1623,7 @@ async def stop_job(job_id: str):
     Raises:
         HTTPException: ジョブが見つからない場合
     """
-    success = job_manager.cancel_job(job_id)
+    success = get_job_manager().cancel_job(job_id)
     if not success:
         raise HTTPException(status_code=404, detail="ジョブが見つかりません")
     
@@ -1404,7 +1643,7 @@ async def resume_job(job_id: str):
     Raises:
         HTTPException: ジョブが見つからない、または再開できない場合
     """
-    success = job_manager.resume_job(job_id)
+    success = get_job_manager().resume_job(job_id)
     if not success:
         raise HTTPException(status_code=400, detail="ジョブが見つからないか、再開できない状態です")
     
@@ -1424,7 +1663,7 @@ async def cancel_job(job_id: str):
     Raises:
         HTTPException: ジョブが見つからない場合
     """
-    success = job_manager.cancel_job(job_id)
+    success = get_job_manager().cancel_job(job_id)
     if not success:
         raise HTTPException(status_code=404, detail="ジョブが見つかりません")
     
@@ -1444,7 +1683,7 @@ async def delete_job(job_id: str):
     Raises:
         HTTPException: ジョブが見つからない場合
     """
-    success = job_manager.delete_job(job_id)
+    success = get_job_manager().delete_job(job_id)
     if not success:
         raise HTTPException(status_code=404, detail="ジョブが見つかりません")
     
@@ -1455,6 +1694,9 @@ async def cleanup_jobs(max_age_hours: int = 24):
     """
     古いジョブをクリーンアップ
     
+    指定時間より前に作成された終了済み（完了・失敗・キャンセル）のジョブを、実行結果とともに
+    メモリとデータベースから削除します。削除したジョブは一覧や統計情報にも現れなくなります。
+    
     Args:
         max_age_hours (int): クリーンアップする最大時間（時間）
         
@@ -1462,562 +1704,52 @@ async def cleanup_jobs(max_age_hours: int = 24):
         Dict[str, Any]: クリーンアップ結果
     """
     try:
-        cleaned_count = job_manager.cleanup_old_jobs(max_age_hours)
+        cleaned_count = await asyncio.to_thread(get_job_manager().cleanup_old_jobs, max_age_hours)
         return {
             "message": f"{cleaned_count}個の古いジョブをクリーンアップしました",
             "cleaned_jobs": cleaned_count
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"クリーンアップエラー: {str(e)}")
+        raise internal_error("クリーンアップエラー", e)
 
 # 古い統合分析APIは削除済み - 新しい3つの専用APIに置き換えられました
 
-# 認証関連のPydanticモデル
-class UserRegisterRequest(BaseModel):
+@lru_cache(maxsize=None)
+def load_html_page(filename: str) -> Optional[bytes]:
     """
-    ユーザー登録リクエストの定義
+    HTMLページの内容を読み込む（初回のみファイルを読み、以降はキャッシュしたバイト列を返す）
     
-    Attributes:
-        username (str): ユーザー名
-        email (str): メールアドレス
-        password (str): パスワード
+    Args:
+        filename (str): HTMLファイル名
+        
+    Returns:
+        Optional[bytes]: HTMLの内容（ファイルが存在しない場合はNone）
     """
-    username: str
-    email: str
-    password: str
+    try:
+        with open(filename, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
-class UserLoginRequest(BaseModel):
+@app.get("/test", response_class=HTMLResponse)
+async def test_page():
     """
-    ユーザーログインリクエストの定義
+    テスト用HTMLページを提供するエンドポイント
     
-    Attributes:
-        username (str): ユーザー名
-        password (str): パスワード
+    APIの動作をテストするためのWebインターフェースを提供します。
+    
+    Returns:
+        HTMLResponse: テスト用HTMLページ
     """
-    username: str
-    password: str
+    content = load_html_page("web_test.html")
+    if content is None:
+        raise HTTPException(status_code=404, detail="テストページが見つかりません")
+    return HTMLResponse(content=content)
 
-class UserResponse(BaseModel):
+@app.get("/api/test-response")
+async def test_response():
     """
-    ユーザー情報レスポンスの定義
-    
-    Attributes:
-        id (int): ユーザーID
-        username (str): ユーザー名
-        email (str): メールアドレス
-        is_active (bool): アクティブフラグ
-        created_at (str): 作成日時
-        updated_at (str): 更新日時
-    """
-    id: int
-    username: str
-    email: str
-    is_active: bool
-    created_at: str
-    updated_at: str
-
-class Token(BaseModel):
-    """
-    トークンレスポンスの定義
-    
-    Attributes:
-        access_token (str): アクセストークン
-        token_type (str): トークンタイプ
-        user (UserResponse): ユーザー情報
-    """
-    access_token: str
-    token_type: str
-    user: UserResponse
-
-class TokenData(BaseModel):
-    """
-    トークンデータの定義
-    
-    Attributes:
-        user_id (Optional[int]): ユーザーID
-    """
-    user_id: Optional[int] = None
-
-class FuzzerEngine:
-    def __init__(self):
-        pass
-    
-    def sniper_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
-        """
-        Sniper攻撃: 各ペイロードを各位置に順番に配置
-        
-        Sniper攻撃では固定のプレースホルダ <<>> を使用し、同じプレースホルダが
-        複数ある場合に、各出現位置を順番にペイロードで置換します。
-        置換されなかったプレースホルダは空文字列で置換されます。
-        
-        Args:
-            template (str): プレースホルダを含むテンプレート文字列
-            placeholders (List[str]): 使用されない（Sniper攻撃では固定プレースホルダを使用）
-            payload_sets (List[PayloadSet]): ペイロードセットのリスト（最初のセットのみ使用）
-            
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
-            
-        Raises:
-            ValueError: ペイロードセットが提供されていない場合
-        """
-        if not payload_sets:
-            raise ValueError("少なくとも1つのペイロードセットが必要です")
-        
-        payload_set = payload_sets[0]
-        requests = []
-        
-        # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template.replace("<<>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payload": "",
-            "position": 0
-        })
-        
-        # Sniper攻撃では固定のプレースホルダ <<>> を使用
-        placeholder_pattern = "<<>>"
-        placeholder_count = template.count(placeholder_pattern)
-        
-        for payload in payload_set.payloads:
-            for position in range(placeholder_count):
-                result = template
-                # 指定された位置のプレースホルダのみを置換
-                current_pos = 0
-                start = 0
-                while current_pos <= position:
-                    pos = result.find(placeholder_pattern, start)
-                    if pos == -1:
-                        break
-                    if current_pos == position:
-                        # この位置のプレースホルダを置換
-                        result = result[:pos] + payload + result[pos + len(placeholder_pattern):]
-                        break
-                    start = pos + 1
-                    current_pos += 1
-                
-                # 置換されていないプレースホルダを空文字列で置換
-                result = result.replace(placeholder_pattern, "")
-                
-                requests.append({
-                    "request": result,
-                    "placeholder": "<<>>",
-                    "payload": payload,
-                    "position": position + 1
-                })
-        
-        return requests
-    
-    def battering_ram_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
-        """
-        Battering Ram攻撃: 同じペイロードを全ての位置に同時に配置
-        
-        Battering Ram攻撃では、1つのペイロードセットの各ペイロードを
-        全てのプレースホルダに同時に配置します。
-        
-        Args:
-            template (str): プレースホルダを含むテンプレート文字列
-            placeholders (List[str]): プレースホルダ名のリスト
-            payload_sets (List[PayloadSet]): ペイロードセットのリスト（最初のセットのみ使用）
-            
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
-            
-        Raises:
-            ValueError: ペイロードセットが提供されていない場合
-        """
-        if not payload_sets:
-            raise ValueError("少なくとも1つのペイロードセットが必要です")
-        
-        payload_set = payload_sets[0]
-        requests = []
-        
-        # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template
-        for placeholder in placeholders:
-            original_template = original_template.replace(f"<<{placeholder}>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payload": "",
-            "applied_to": []
-        })
-        
-        for payload in payload_set.payloads:
-            result = template
-            for placeholder in placeholders:
-                result = result.replace(f"<<{placeholder}>>", payload)
-            requests.append({
-                "request": result,
-                "payload": payload,
-                "applied_to": placeholders
-            })
-        
-        return requests
-    
-    def pitchfork_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
-        """
-        Pitchfork攻撃: 各位置に異なるペイロードセットを使用し、同時に配置
-        
-        Pitchfork攻撃では、各プレースホルダに対応するペイロードセットがあり、
-        各セットの同じインデックスのペイロードを同時に配置します。
-        最小のペイロードセットのサイズまで処理します。
-        
-        Args:
-            template (str): プレースホルダを含むテンプレート文字列
-            placeholders (List[str]): プレースホルダ名のリスト
-            payload_sets (List[PayloadSet]): ペイロードセットのリスト
-            
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
-            
-        Raises:
-            ValueError: ペイロードセットの数がプレースホルダの数と一致しない場合
-        """
-        if len(payload_sets) != len(placeholders):
-            raise ValueError("ペイロードセットの数はプレースホルダの数と一致する必要があります")
-        
-        requests = []
-        
-        # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template
-        for placeholder in placeholders:
-            original_template = original_template.replace(f"<<{placeholder}>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payloads": {}
-        })
-        
-        # 最小のペイロードセットのサイズを取得
-        min_payload_count = min(len(ps.payloads) for ps in payload_sets)
-        
-        for i in range(min_payload_count):
-            result = template
-            placeholder_payload_map = {}
-            
-            for j, (placeholder, payload_set) in enumerate(zip(placeholders, payload_sets)):
-                payload = payload_set.payloads[i]
-                result = result.replace(f"<<{placeholder}>>", payload)
-                placeholder_payload_map[placeholder] = payload
-            
-            requests.append({
-                "request": result,
-                "payloads": placeholder_payload_map
-            })
-        
-        return requests
-    
-    def cluster_bomb_attack(self, template: str, placeholders: List[str], payload_sets: List[PayloadSet]) -> List[Dict[str, str]]:
-        """
-        Cluster Bomb攻撃: 全てのペイロードの組み合わせをテスト
-        
-        Cluster Bomb攻撃では、各プレースホルダに対応するペイロードセットがあり、
-        全てのペイロードの組み合わせをテストします。
-        
-        Args:
-            template (str): プレースホルダを含むテンプレート文字列
-            placeholders (List[str]): プレースホルダ名のリスト
-            payload_sets (List[PayloadSet]): ペイロードセットのリスト
-            
-        Returns:
-            List[Dict[str, str]]: 生成されたリクエストのリスト
-            
-        Raises:
-            ValueError: ペイロードセットの数がプレースホルダの数と一致しない場合
-        """
-        if len(payload_sets) != len(placeholders):
-            raise ValueError("ペイロードセットの数はプレースホルダの数と一致する必要があります")
-        
-        requests = []
-        
-        # オリジナルのテンプレート（プレースホルダを空文字列で置換）を最初に追加
-        original_template = template
-        for placeholder in placeholders:
-            original_template = original_template.replace(f"<<{placeholder}>>", "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payloads": {}
-        })
-        
-        # 全てのペイロードの組み合わせを生成
-        payload_combinations = list(itertools.product(*[ps.payloads for ps in payload_sets]))
-        
-        for combination in payload_combinations:
-            result = template
-            placeholder_payload_map = {}
-            
-            for placeholder, payload in zip(placeholders, combination):
-                result = result.replace(f"<<{placeholder}>>", payload)
-                placeholder_payload_map[placeholder] = payload
-            
-            requests.append({
-                "request": result,
-                "payloads": placeholder_payload_map
-            })
-        
-        return requests
-
-    def mutation_attack(self, template: str, mutations: List[Mutation]) -> List[Dict[str, Any]]:
-        """
-        変異ベース攻撃: 各トークンに対して指定された変異を適用
-        
-        変異ベース攻撃では、各トークンに対して辞書的な値やrepeat機能付きの値を
-        適用してリクエストを生成します。
-        
-        Args:
-            template (str): プレースホルダを含むテンプレート文字列
-            mutations (List[Mutation]): 変異のリスト
-            
-        Returns:
-            List[Dict[str, Any]]: 生成されたリクエストのリスト
-        """
-        requests = []
-        
-        # オリジナルのテンプレート（全てのトークンを空文字列で置換）を最初に追加
-        original_template = template
-        for mutation in mutations:
-            original_template = original_template.replace(mutation.token, "")
-        requests.append({
-            "request": original_template,
-            "placeholder": "original",
-            "payload": "",
-            "position": 0
-        })
-        
-        # 各変異に対して処理
-        for mutation in mutations:
-            # 変異値を処理してペイロードリストを生成
-            payloads = process_mutation_values(mutation.values)
-            
-            # 各ペイロードに対してリクエストを生成
-            for i, payload in enumerate(payloads):
-                result = template.replace(mutation.token, payload)
-                requests.append({
-                    "request": result,
-                    "placeholder": mutation.token,
-                    "payload": payload,
-                    "position": i + 1,
-                    "strategy": mutation.strategy
-                })
-        
-        return requests
-
-fuzzer = FuzzerEngine()
-
-async def execute_single_request_async(request_data: Dict[str, Any], http_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """
-    単一リクエストを非同期で実行するヘルパー関数
-    
-    Args:
-        request_data (Dict[str, Any]): リクエストデータ
-        http_config (Optional[Dict[str, Any]]): HTTP設定
-        
-    Returns:
-        Dict[str, Any]: 実行結果
-    """
-    try:
-        # HTTP設定を適用
-        config = HTTPRequestConfig()
-        if http_config:
-            config.timeout = http_config.get('timeout', 30)
-            config.follow_redirects = http_config.get('follow_redirects', True)
-            config.verify_ssl = http_config.get('verify_ssl', False)
-            config.scheme = http_config.get('scheme', 'http')
-            config.base_url = http_config.get('base_url', 'localhost:8000')
-            config.additional_headers = http_config.get('additional_headers')
-        
-        # リクエスト実行
-        executor = RequestExecutor(config)
-        result = await executor.execute_request(request_data['request'])
-        
-        return {
-            'request': request_data,
-            'http_response': result,
-            'success': True
-        }
-    except Exception as e:
-        return {
-            'request': request_data,
-            'error': str(e),
-            'success': False
-        }
-
-@app.post("/api/replace-placeholders", response_model=PlaceholderResponse)
-async def replace_placeholders(request: PlaceholderRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    """
-    プレースホルダ置換APIエンドポイント
-    
-    指定された攻撃戦略に基づいてプレースホルダをペイロードで置換し、
-    生成されたリクエストのリストを返します。また、リクエストと生成された
-    リクエストをデータベースに永続化します。
-    
-    Args:
-        request (PlaceholderRequest): 置換リクエスト
-        db (Session): データベースセッション
-        
-    Returns:
-        PlaceholderResponse: 攻撃戦略名、総リクエスト数、リクエストリスト、リクエストIDを含むレスポンス
-        
-    Raises:
-        HTTPException: 無効な攻撃戦略が指定された場合
-    """
-    try:
-        # 攻撃戦略に基づいて適切なメソッドを呼び出し
-        if request.strategy == AttackStrategy.SNIPER:
-            requests = fuzzer.sniper_attack(request.template, request.placeholders, request.payload_sets)
-        elif request.strategy == AttackStrategy.BATTERING_RAM:
-            requests = fuzzer.battering_ram_attack(request.template, request.placeholders, request.payload_sets)
-        elif request.strategy == AttackStrategy.PITCHFORK:
-            requests = fuzzer.pitchfork_attack(request.template, request.placeholders, request.payload_sets)
-        elif request.strategy == AttackStrategy.CLUSTER_BOMB:
-            requests = fuzzer.cluster_bomb_attack(request.template, request.placeholders, request.payload_sets)
-        else:
-            raise HTTPException(status_code=400, detail=f"無効な攻撃戦略: {request.strategy}")
-        
-        # ペイロードセットを辞書形式に変換
-        payload_sets_dict = [{"name": ps.name, "payloads": ps.payloads} for ps in request.payload_sets]
-        
-        # データベースに保存
-        fuzzer_request = db_manager.save_fuzzer_request(
-            db=db,
-            template=request.template,
-            placeholders=request.placeholders,
-            strategy=request.strategy.value,
-            payload_sets=payload_sets_dict,
-            generated_requests=requests
-        )
-        
-        return PlaceholderResponse(
-            strategy=request.strategy.value,
-            total_requests=len(requests),
-            requests=requests,
-            request_id=fuzzer_request.id
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"内部エラー: {str(e)}")
-
-@app.post("/api/mutations", response_model=PlaceholderResponse)
-async def apply_mutations(request: MutationRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    """
-    変異ベースのプレースホルダ置換を実行
-    
-    各トークンに対して指定された変異（辞書的な値やrepeat機能付きの値）を適用して
-    リクエストを生成します。
-    
-    Args:
-        request (MutationRequest): 変異リクエスト
-        db (Session): データベースセッション
-        
-    Returns:
-        PlaceholderResponse: 生成されたリクエストの情報
-    """
-    try:
-        # 変異ベース攻撃を実行
-        requests = fuzzer.mutation_attack(request.template, request.mutations)
-        
-        # データベースに保存
-        fuzzer_request = FuzzerRequest(
-            template=request.template,
-            strategy="mutation",
-            total_requests=len(requests)
-        )
-        fuzzer_request.set_placeholders([mutation.token for mutation in request.mutations])
-        fuzzer_request.set_payload_sets([])  # mutationsではpayload_setsは使用しない
-        db.add(fuzzer_request)
-        db.commit()
-        db.refresh(fuzzer_request)
-        
-        # 生成されたリクエストをデータベースに保存
-        for i, req in enumerate(requests):
-            generated_request = GeneratedRequest(
-                fuzzer_request_id=fuzzer_request.id,
-                request_number=i + 1,
-                request_content=req["request"],
-                placeholder=req.get("placeholder", ""),
-                payload=req.get("payload", ""),
-                position=req.get("position", 0)
-            )
-            db.add(generated_request)
-        db.commit()
-        
-        return PlaceholderResponse(
-            strategy="mutation",
-            total_requests=len(requests),
-            requests=requests,
-            request_id=fuzzer_request.id
-        )
-        
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/api/intuitive", response_model=PlaceholderResponse)
-async def intuitive_replace_placeholders(request: IntuitiveRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    """
-    直感的なプレースホルダ置換API
-    
-    placeholdersを使わずに、payload_setsのtokenから自動的にプレースホルダを抽出します。
-    """
-    try:
-        # payload_setsからプレースホルダを自動抽出（<<>>を除去）
-        placeholders = []
-        for payload_set in request.payload_sets:
-            # <<username>> -> username に変換
-            placeholder_name = payload_set.token.strip("<>")
-            placeholders.append(placeholder_name)
-        
-        # payload_setsを従来の形式に変換
-        converted_payload_sets = []
-        for payload_set in request.payload_sets:
-            # valuesを処理してペイロードリストを生成
-            processed_payloads = process_mutation_values(payload_set.values)
-            
-            # プレースホルダ名をnameとして使用
-            placeholder_name = payload_set.token.strip("<>")
-            converted_payload_sets.append(PayloadSet(
-                name=placeholder_name,
-                payloads=processed_payloads
-            ))
-        
-        # 従来のリクエスト形式に変換
-        placeholder_request = PlaceholderRequest(
-            template=request.template,
-            placeholders=placeholders,
-            strategy=request.strategy,
-            payload_sets=converted_payload_sets
-        )
-        
-        # 既存の処理を再利用
-        return await replace_placeholders(placeholder_request, db)
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"リクエストの処理に失敗しました: {str(e)}")
-
-@app.get("/test", response_class=HTMLResponse)
-async def test_page():
-    """
-    テスト用HTMLページを提供するエンドポイント
-    
-    APIの動作をテストするためのWebインターフェースを提供します。
-    
-    Returns:
-        HTMLResponse: テスト用HTMLページ
-    """
-    try:
-        with open("web_test.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail="テストページが見つかりません")
-
-@app.get("/api/test-response")
-async def test_response():
-    """
-    テスト用レスポンスエンドポイント
+    テスト用レスポンスエンドポイント
     
     個別リクエスト実行のテスト用に使用します。
     
@@ -2044,11 +1776,10 @@ async def history_page():
     Returns:
         HTMLResponse: 履歴表示用HTMLページ
     """
-    try:
-        with open("history.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    content = load_html_page("history.html")
+    if content is None:
         raise HTTPException(status_code=404, detail="履歴ページが見つかりません")
+    return HTMLResponse(content=content)
 
 @app.get("/api/jobs/{job_id}/results", response_model=JobResultsResponseModel)
 async def get_job_results(job_id: str, db: Session = Depends(get_db), limit: int = 50, offset: int = 0, current_user: User = Depends(get_current_active_user)):
@@ -2068,7 +1799,7 @@ async def get_job_results(job_id: str, db: Session = Depends(get_db), limit: int
         HTTPException: ジョブが見つからない場合
     """
     # ジョブの存在確認
-    job = job_manager.get_job(job_id)
+    job = get_job_manager().get_job(job_id)
     if not job:
         db_job = db_manager.get_job_by_id(db, job_id)
         if not db_job:
@@ -2113,8 +1844,7 @@ async def get_job_results(job_id: str, db: Session = Depends(get_db), limit: int
         )
         
     except Exception as e:
-        print(f"結果取得エラー: {e}")
-        raise HTTPException(status_code=500, detail=f"結果取得エラー: {str(e)}")
+        raise internal_error("結果取得エラー", e)
 
 @app.get("/api/jobs/{job_id}/results/{result_id}", response_model=JobResultDetailResponseModel)
 async def get_job_result_detail(job_id: str, result_id: int, db: Session = Depends(get_db)):
@@ -2133,7 +1863,7 @@ async def get_job_result_detail(job_id: str, result_id: int, db: Session = Depen
         HTTPException: ジョブまたは結果が見つからない場合
     """
     # ジョブの存在確認
-    job = job_manager.get_job(job_id)
+    job = get_job_manager().get_job(job_id)
     if not job:
         db_job = db_manager.get_job_by_id(db, job_id)
         if not db_job:
@@ -2169,8 +1899,7 @@ async def get_job_result_detail(job_id: str, result_id: int, db: Session = Depen
     except HTTPException:
         raise
     except Exception as e:
-        print(f"結果詳細取得エラー: {e}")
-        raise HTTPException(status_code=500, detail=f"結果詳細取得エラー: {str(e)}")
+        raise internal_error("結果詳細取得エラー", e)
 
 # 古いVulnerabilityAnalyzerクラスは削除済み - vulnerability_analysis.pyの個別分析エンジンで置き換えられました
 # class VulnerabilityAnalyzer:
@@ -2306,10 +2035,29 @@ async def get_current_user_info(current_user: User = Depends(get_current_active_
 
 # 3つの専用脆弱性分析APIエンドポイント
 
+def run_job_analysis(analyze: Callable[..., Any], job_id: str, *args: Any) -> Optional[Any]:
+    """
+    ジョブの実行結果の分析を実行（スレッドで実行するため、専用のセッションを使用）
+    
+    分析は全件の応答のJSON解析と正規表現による検出を行うCPU処理のため、
+    イベントループの外で実行し、その間も他のリクエストやジョブの進捗配信を止めないようにします。
+    
+    Args:
+        analyze (Callable[..., Any]): 分析エンジンのメソッド（job_id, db, *args を受け取る）
+        job_id (str): 分析対象のジョブID
+        *args: 分析メソッドに渡す追加の引数
+        
+    Returns:
+        Optional[Any]: 分析結果（ジョブが存在しない場合はNone）
+    """
+    with db_manager.SessionLocal() as db:
+        if db_manager.get_job_by_id(db, job_id) is None:
+            return None
+        return analyze(job_id, db, *args)
+
 @app.post("/api/jobs/{job_id}/analyze/error-patterns", response_model=ErrorPatternAnalysisResult)
 async def analyze_error_patterns(job_id: str, 
                                 config: Optional[ErrorPatternConfigModel] = None,
-                                db: Session = Depends(get_db),
                                 current_user: User = Depends(get_current_active_user)):
     """
     エラーパターン検出分析
@@ -2317,39 +2065,31 @@ async def analyze_error_patterns(job_id: str,
     Args:
         job_id (str): 分析対象のジョブID
         config: エラーパターン検出設定
-        db: データベースセッション
         current_user: 現在のユーザー
         
     Returns:
         ErrorPatternAnalysisResult: エラーパターン分析結果
     """
-    # ジョブの存在確認
-    job = job_manager.get_job(job_id)
-    if not job:
-        db_job = db_manager.get_job_by_id(db, job_id)
-        if not db_job:
-            raise HTTPException(status_code=404, detail="ジョブが見つかりません")
-    
     try:
-        # エラーパターン分析を実行
+        # エラーパターン分析をスレッドで実行
         if config:
-            result = error_pattern_analyzer.analyze_job_errors(
-                job_id, db, config.error_patterns, config.case_sensitive
+            result = await asyncio.to_thread(
+                run_job_analysis, error_pattern_analyzer.analyze_job_errors,
+                job_id, config.error_patterns, config.case_sensitive
             )
         else:
-            result = error_pattern_analyzer.analyze_job_errors(job_id, db)
-        
-        return result
-        
+            result = await asyncio.to_thread(run_job_analysis, error_pattern_analyzer.analyze_job_errors, job_id)
     except Exception as e:
-        print(f"エラーパターン分析エラー: {e}")
-        raise HTTPException(status_code=500, detail=f"分析エラー: {str(e)}")
+        raise internal_error("エラーパターン分析エラー", e)
+    
+    if result is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    return result
 
 @app.get("/api/jobs/{job_id}/analyze/error-patterns", response_model=ErrorPatternAnalysisResult)
 async def analyze_error_patterns_get(job_id: str,
                                    error_patterns: Optional[str] = None,
                                    case_sensitive: bool = False,
-                                   db: Session = Depends(get_db),
                                    current_user: User = Depends(get_current_active_user)):
     """
     エラーパターン検出分析（GETバージョン）
@@ -2358,7 +2098,6 @@ async def analyze_error_patterns_get(job_id: str,
         job_id (str): 分析対象のジョブID
         error_patterns: カンマ区切りのエラーパターン
         case_sensitive: 大文字小文字を区別するかどうか
-        db: データベースセッション
         current_user: 現在のユーザー
         
     Returns:
@@ -2369,12 +2108,11 @@ async def analyze_error_patterns_get(job_id: str,
         case_sensitive=case_sensitive
     )
     
-    return await analyze_error_patterns(job_id, config, db, current_user)
+    return await analyze_error_patterns(job_id, config, current_user)
 
 @app.post("/api/jobs/{job_id}/analyze/payload-reflection", response_model=PayloadReflectionAnalysisResult)
 async def analyze_payload_reflection(job_id: str,
                                    config: Optional[PayloadReflectionConfigModel] = None,
-                                   db: Session = Depends(get_db),
                                    current_user: User = Depends(get_current_active_user)):
     """
     ペイロード反射検出分析
@@ -2382,37 +2120,30 @@ async def analyze_payload_reflection(job_id: str,
     Args:
         job_id (str): 分析対象のジョブID
         config: ペイロード反射検出設定
-        db: データベースセッション
         current_user: 現在のユーザー
         
     Returns:
         PayloadReflectionAnalysisResult: ペイロード反射分析結果
     """
-    # ジョブの存在確認
-    job = job_manager.get_job(job_id)
-    if not job:
-        db_job = db_manager.get_job_by_id(db, job_id)
-        if not db_job:
-            raise HTTPException(status_code=404, detail="ジョブが見つかりません")
-    
     try:
-        # ペイロード反射分析を実行
+        # ペイロード反射分析をスレッドで実行
         if config:
-            result = payload_reflection_analyzer.analyze_job_reflections(
-                job_id, db, 
+            result = await asyncio.to_thread(
+                run_job_analysis, payload_reflection_analyzer.analyze_job_reflections,
+                job_id,
                 config.check_html_encoding,
                 config.check_url_encoding,
                 config.check_js_encoding,
                 config.minimum_payload_length
             )
         else:
-            result = payload_reflection_analyzer.analyze_job_reflections(job_id, db)
-        
-        return result
-        
+            result = await asyncio.to_thread(run_job_analysis, payload_reflection_analyzer.analyze_job_reflections, job_id)
     except Exception as e:
-        print(f"ペイロード反射分析エラー: {e}")
-        raise HTTPException(status_code=500, detail=f"分析エラー: {str(e)}")
+        raise internal_error("ペイロード反射分析エラー", e)
+    
+    if result is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    return result
 
 @app.get("/api/jobs/{job_id}/analyze/payload-reflection", response_model=PayloadReflectionAnalysisResult)
 async def analyze_payload_reflection_get(job_id: str,
@@ -2420,7 +2151,6 @@ async def analyze_payload_reflection_get(job_id: str,
                                        check_url_encoding: bool = True,
                                        check_js_encoding: bool = True,
                                        minimum_payload_length: int = 3,
-                                       db: Session = Depends(get_db),
                                        current_user: User = Depends(get_current_active_user)):
     """
     ペイロード反射検出分析（GETバージョン）
@@ -2431,7 +2161,6 @@ async def analyze_payload_reflection_get(job_id: str,
         check_url_encoding: URLエンコーディングをチェックするかどうか
         check_js_encoding: JavaScriptエンコーディングをチェックするかどうか
         minimum_payload_length: 検出対象とする最小ペイロード長
-        db: データベースセッション
         current_user: 現在のユーザー
         
     Returns:
@@ -2444,12 +2173,11 @@ async def analyze_payload_reflection_get(job_id: str,
         minimum_payload_length=minimum_payload_length
     )
     
-    return await analyze_payload_reflection(job_id, config, db, current_user)
+    return await analyze_payload_reflection(job_id, config, current_user)
 
 @app.post("/api/jobs/{job_id}/analyze/time-delay", response_model=TimeDelayAnalysisResult)
 async def analyze_time_delay(job_id: str,
                            config: Optional[TimeDelayConfigModel] = None,
-                           db: Session = Depends(get_db),
                            current_user: User = Depends(get_current_active_user)):
     """
     時間遅延検出分析
@@ -2457,43 +2185,35 @@ async def analyze_time_delay(job_id: str,
     Args:
         job_id (str): 分析対象のジョブID
         config: 時間遅延検出設定
-        db: データベースセッション
         current_user: 現在のユーザー
         
     Returns:
         TimeDelayAnalysisResult: 時間遅延分析結果
     """
-    # ジョブの存在確認
-    job = job_manager.get_job(job_id)
-    if not job:
-        db_job = db_manager.get_job_by_id(db, job_id)
-        if not db_job:
-            raise HTTPException(status_code=404, detail="ジョブが見つかりません")
-    
     try:
-        # 時間遅延分析を実行
+        # 時間遅延分析をスレッドで実行
         if config:
-            result = time_delay_analyzer.analyze_job_time_delays(
-                job_id, db,
+            result = await asyncio.to_thread(
+                run_job_analysis, time_delay_analyzer.analyze_job_time_delays,
+                job_id,
                 config.time_threshold,
                 config.baseline_method,
                 config.consider_payload_type
             )
         else:
-            result = time_delay_analyzer.analyze_job_time_delays(job_id, db)
-        
-        return result
-        
+            result = await asyncio.to_thread(run_job_analysis, time_delay_analyzer.analyze_job_time_delays, job_id)
     except Exception as e:
-        print(f"時間遅延分析エラー: {e}")
-        raise HTTPException(status_code=500, detail=f"分析エラー: {str(e)}")
+        raise internal_error("時間遅延分析エラー", e)
+    
+    if result is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    return result
 
 @app.get("/api/jobs/{job_id}/analyze/time-delay", response_model=TimeDelayAnalysisResult)
 async def analyze_time_delay_get(job_id: str,
                                time_threshold: float = 2.0,
                                baseline_method: str = "first_request",
                                consider_payload_type: bool = True,
-                               db: Session = Depends(get_db),
                                current_user: User = Depends(get_current_active_user)):
     """
     時間遅延検出分析（GETバージョン）
@@ -2503,7 +2223,6 @@ async def analyze_time_delay_get(job_id: str,
         time_threshold: 遅延として判定する閾値（秒）
         baseline_method: ベースライン計算方法
         consider_payload_type: ペイロードタイプを考慮するかどうか
-        db: データベースセッション
         current_user: 現在のユーザー
         
     Returns:
@@ -2515,7 +2234,7 @@ async def analyze_time_delay_get(job_id: str,
         consider_payload_type=consider_payload_type
     )
     
-    return await analyze_time_delay(job_id, config, db, current_user)
+    return await analyze_time_delay(job_id, config, current_user)
 
 if __name__ == "__main__":
     import os
@@ -2528,6 +2247,8 @@ if __name__ == "__main__":
     # PORTは環境変数から取得（Renderで自動設定される）
     port = int(os.getenv("PORT", 8000))
     
-    # 本番環境では reload=False を設定
+    # 本番環境では reload=False を設定（reload にはアプリケーションをインポート文字列で渡す必要がある）
+    # ジョブの状態と処理スレッドはプロセス内に保持するため、ワーカーは1プロセスのみとする
+    # （複数ワーカーでは各プロセスが起動時に同じ未完了ジョブを復元して重複実行する）
     is_production = os.getenv("ENVIRONMENT") == "production"
-    uvicorn.run(app, host="0.0.0.0", port=port, reload=not is_production) 
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=not is_production, workers=1) 
\ No newline at end of file
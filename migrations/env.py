@@ -0,0 +1,54 @@
+"""
+Alembic マイグレーション実行環境
+
+アプリケーションからは DatabaseManager.create_tables が接続を config.attributes["connection"] に
+渡して実行します。alembic コマンドから実行した場合は database.py のエンジン（DATABASE_URL）を使用します。
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from database import Base, engine
+
+config = context.config
+
+# ロギングはコマンド実行時のみ設定し、アプリケーションのロガーは変更しない
+connection = config.attributes.get("connection")
+if connection is None and config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """SQLを出力するのみのモードでマイグレーションを実行"""
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """データベースに接続してマイグレーションを実行"""
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    with engine.connect() as conn:
+        context.configure(connection=conn, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,24 @@
+"""マイグレーション導入前のスキーマ
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-16 00:00:00
+
+マイグレーション導入前に Base.metadata.create_all で作成されたテーブルを表す起点のリビジョンです。
+既存のデータベースはこのリビジョンとして記録してから、以降のマイグレーションを適用します。
+"""
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
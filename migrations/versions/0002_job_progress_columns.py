@@ -0,0 +1,76 @@
+"""ジョブの進捗の専用カラムを追加
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00
+
+jobs テーブルに進捗の主要な項目（総数・完了数・開始/終了日時）のカラムを追加し、
+既存のジョブはJSONの進捗情報から値を埋めます（この埋め込みは一度だけ実行されます。
+SQLを出力するのみのモードでは行を読み込めないため、埋め込みは行いません）。
+"""
+import json
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns():
+    """追加するカラム（Column はテーブルに1つしか割り当てられないため、呼び出しごとに作成）"""
+    return [
+        sa.Column('total_requests', sa.Integer(), nullable=True, comment='総リクエスト数'),
+        sa.Column('completed_requests', sa.Integer(), nullable=True, comment='完了したリクエスト数'),
+        sa.Column('start_time', sa.DateTime(), nullable=True, comment='実行開始日時'),
+        sa.Column('end_time', sa.DateTime(), nullable=True, comment='実行終了日時'),
+    ]
+
+
+def _to_datetime(value):
+    """ISO形式の日時文字列をdatetimeに変換（それ以外の値はそのまま返す）"""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def upgrade() -> None:
+    # マイグレーション導入前の起動時処理で追加済みのカラムは作成しない
+    # （SQLを出力するのみのモードではデータベースを参照できないため、全て作成する）
+    offline = context.is_offline_mode()
+    existing = set() if offline else {column['name'] for column in sa.inspect(op.get_bind()).get_columns('jobs')}
+    for column in _columns():
+        if column.name not in existing:
+            op.add_column('jobs', column)
+    if offline:
+        return
+
+    # 既存のジョブの進捗（JSON文字列）から専用カラムの値を埋める
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', sa.String),
+        sa.column('progress', sa.JSON),
+        *(sa.column(column.name, column.type) for column in _columns()),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(jobs.c.id, jobs.c.progress).where(jobs.c.total_requests.is_(None))).all()
+    for job_id, progress in rows:
+        if isinstance(progress, str):
+            progress = json.loads(progress) if progress else {}
+        progress = progress or {}
+        bind.execute(
+            jobs.update().where(jobs.c.id == job_id).values(
+                total_requests=progress.get('total_requests'),
+                completed_requests=progress.get('completed_requests'),
+                start_time=_to_datetime(progress.get('start_time')),
+                end_time=_to_datetime(progress.get('end_time')),
+            )
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(_columns()):
+        op.drop_column('jobs', column.name)
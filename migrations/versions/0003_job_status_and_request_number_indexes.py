@@ -0,0 +1,39 @@
+"""ジョブの状態と生成リクエストの番号のインデックスを追加
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:00
+
+実行待ちジョブの検索（jobs.status）と、ファザーリクエストごとの番号順の読み込み・
+番号を指定した1件の取得（generated_requests.fuzzer_request_id, request_number）に使用します。
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    ('ix_jobs_status', 'jobs', ['status']),
+    ('ix_generated_requests_fuzzer_request_id_request_number', 'generated_requests',
+     ['fuzzer_request_id', 'request_number']),
+)
+
+
+def upgrade() -> None:
+    # マイグレーション導入前の起動時処理で作成済みのインデックスは作成しない
+    # （SQLを出力するのみのモードではデータベースを参照できないため、全て作成する）
+    inspector = None if context.is_offline_mode() else sa.inspect(op.get_bind())
+    for name, table, columns in _INDEXES:
+        if inspector is None or name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
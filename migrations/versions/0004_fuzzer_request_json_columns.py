@@ -0,0 +1,43 @@
+"""ファザーリクエストのプレースホルダとペイロードセットをJSON型に変更
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:00
+
+PostgreSQLではtext型のままではJSON型カラムとして読み込まれないため、型を変更します。
+SQLiteはJSONをテキストとして保存するため変更は不要です。
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ('placeholders', 'payload_sets')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    # 作成時からJSON型のカラムは変更しない（SQLを出力するのみのモードでは全て変更する）
+    existing = {} if context.is_offline_mode() else {
+        column['name']: column['type'] for column in sa.inspect(bind).get_columns('fuzzer_requests')
+    }
+    for name in _COLUMNS:
+        if isinstance(existing.get(name, sa.Text()), sa.Text):
+            op.alter_column('fuzzer_requests', name, type_=sa.JSON(), existing_nullable=False,
+                            postgresql_using=f'{name}::json')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name in _COLUMNS:
+        op.alter_column('fuzzer_requests', name, type_=sa.Text(), existing_nullable=False,
+                        postgresql_using=f'{name}::text')
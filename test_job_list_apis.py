@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+ジョブ一覧API テストスクリプト
+
+ジョブ一覧（GET /api/jobs）のカーソルによるページネーションと、
+ジョブ統計情報（GET /api/jobs/statistics）のETagによる条件付きリクエストをテストします。
+
+使用方法:
+    python test_job_list_apis.py
+
+前提条件:
+    - サーバーが http://localhost:8000 で起動していること
+      （ジョブは同じサーバーの /api/test-response に対してリクエストを送信します）
+"""
+
+import requests
+import time
+import random
+import string
+
+# 設定
+BASE_URL = "http://localhost:8000"
+TARGET_HOST = "localhost:8000"
+
+# テスト用に作成するジョブ数
+JOB_COUNT = 3
+
+def generate_test_user():
+    """ランダムなテストユーザーを生成"""
+    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    return {
+        "username": f"listuser_{random_suffix}",
+        "email": f"list_{random_suffix}@example.com",
+        "password": "TestPassword123!"
+    }
+
+class JobListAPITester:
+    def __init__(self):
+        self.base_url = BASE_URL
+        self.token = None
+        self.test_results = {
+            "passed": 0,
+            "failed": 0,
+            "errors": []
+        }
+
+    def log_result(self, test_name: str, success: bool, details: str = ""):
+        """テスト結果をログ"""
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name}")
+        if details and not success:
+            print(f"    詳細: {details}")
+
+        if success:
+            self.test_results["passed"] += 1
+        else:
+            self.test_results["failed"] += 1
+            self.test_results["errors"].append(f"{test_name}: {details}")
+
+    def make_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """認証ヘッダー付きリクエスト送信"""
+        headers = kwargs.pop('headers', {})
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        return requests.request(method, f"{self.base_url}{url}", headers=headers, **kwargs)
+
+    def login(self) -> bool:
+        """テストユーザーを登録してログイン"""
+        print("\n=== 0. 認証 ===")
+        user = generate_test_user()
+        response = requests.post(f"{self.base_url}/api/auth/register", json=user)
+        if response.status_code != 200:
+            self.log_result("ユーザー登録", False, f"HTTP {response.status_code}: {response.text}")
+            return False
+
+        response = requests.post(f"{self.base_url}/api/auth/login",
+                                 json={"username": user["username"], "password": user["password"]})
+        if response.status_code != 200:
+            self.log_result("ログイン", False, f"HTTP {response.status_code}: {response.text}")
+            return False
+
+        self.token = response.json()["access_token"]
+        self.log_result("ログイン", True)
+        return True
+
+    def create_jobs(self, count: int) -> list:
+        """テスト用のジョブを作成し、完了を待ってジョブIDのリストを返す"""
+        response = self.make_request('POST', '/api/replace-placeholders', json={
+            "template": f"GET /api/test-response?q=<<>> HTTP/1.1\nHost: {TARGET_HOST}\n\n",
+            "placeholders": [],
+            "strategy": "sniper",
+            "payload_sets": [{"name": "words", "payloads": ["one", "two"]}]
+        })
+        response.raise_for_status()
+        request_id = response.json()["request_id"]
+
+        job_ids = []
+        for _ in range(count):
+            response = self.make_request('POST', '/api/execute-requests', json={
+                "request_id": request_id,
+                "http_config": {"scheme": "http", "base_url": TARGET_HOST, "timeout": 10}
+            })
+            response.raise_for_status()
+            job_ids.append(response.json()["job_id"])
+
+        for job_id in job_ids:
+            for _ in range(30):  # 最大30秒待機
+                status = self.make_request('GET', f'/api/jobs/{job_id}').json()["status"]
+                if status in ["completed", "failed", "cancelled"]:
+                    break
+                time.sleep(1)
+        return job_ids
+
+    def test_cursor_pagination(self):
+        """カーソルによるページネーション（limit / cursor / next_cursor）のテスト"""
+        print("\n=== 1. カーソルによるページネーションテスト ===")
+
+        created = self.create_jobs(JOB_COUNT)
+        print(f"    作成したジョブ数: {len(created)}")
+
+        # パラメータなしでは全件を返し、next_cursor は null
+        response = self.make_request('GET', '/api/jobs')
+        full = response.json()
+        all_ids = [job["id"] for job in full["jobs"]]
+        self.log_result("パラメータなしで全件を取得", len(all_ids) == full["total"] and full["next_cursor"] is None,
+                        f"{len(all_ids)}件 / total {full['total']}, next_cursor {full['next_cursor']}")
+        self.log_result("作成したジョブが一覧に含まれる", all(job_id in all_ids for job_id in created))
+
+        # 作成日時の新しい順
+        created_at = [job["created_at"] for job in full["jobs"]]
+        self.log_result("作成日時の新しい順", created_at == sorted(created_at, reverse=True))
+
+        # next_cursor をたどると、全件を重複・欠落なく同じ順で取得できる
+        paged_ids = []
+        cursor = None
+        pages = 0
+        while True:
+            url = '/api/jobs?limit=2' + (f'&cursor={cursor}' if cursor else '')
+            page = self.make_request('GET', url).json()
+            pages += 1
+            paged_ids.extend(job["id"] for job in page["jobs"])
+            cursor = page["next_cursor"]
+            if cursor is None or pages > len(all_ids):
+                break
+        self.log_result("カーソルで全ページを取得", paged_ids == all_ids,
+                        f"{len(paged_ids)}件 / 期待値 {len(all_ids)}件（{pages}ページ）")
+
+        # 状態による絞り込みとの併用
+        page = self.make_request('GET', '/api/jobs?status=completed&limit=1').json()
+        self.log_result("状態による絞り込み", len(page["jobs"]) == 1 and page["jobs"][0]["status"] == "completed",
+                        str(page["jobs"]))
+        if page["next_cursor"]:
+            next_page = self.make_request('GET', f'/api/jobs?status=completed&limit=1&cursor={page["next_cursor"]}').json()
+            self.log_result("絞り込み時の次のページ",
+                            all(job["status"] == "completed" and job["id"] != page["jobs"][0]["id"] for job in next_page["jobs"]),
+                            str(next_page["jobs"]))
+
+        # 不正なカーソル・状態は400
+        response = self.make_request('GET', '/api/jobs?limit=1&cursor=invalid')
+        self.log_result("不正なカーソルは400", response.status_code == 400, f"HTTP {response.status_code}")
+        response = self.make_request('GET', '/api/jobs?status=unknown')
+        self.log_result("不正な状態は400", response.status_code == 400, f"HTTP {response.status_code}")
+
+    def test_statistics_etag(self):
+        """ジョブ統計情報のETag / If-None-Match（304）のテスト"""
+        print("\n=== 2. ジョブ統計情報のETagテスト ===")
+
+        response = self.make_request('GET', '/api/jobs/statistics')
+        etag = response.headers.get("ETag")
+        self.log_result("ETag ヘッダー", response.status_code == 200 and bool(etag),
+                        f"HTTP {response.status_code}, ETag {etag}")
+        if not etag:
+            return
+        stats = response.json()
+
+        # 統計情報が変わっていなければ304（本文なし）
+        response = self.make_request('GET', '/api/jobs/statistics', headers={"If-None-Match": etag})
+        self.log_result("一致するETagは304", response.status_code == 304 and not response.content,
+                        f"HTTP {response.status_code}")
+        self.log_result("304でも同じETagを返す", response.headers.get("ETag") == etag, response.headers.get("ETag", ""))
+
+        # 一致しないETagでは本文を返す
+        response = self.make_request('GET', '/api/jobs/statistics', headers={"If-None-Match": '"stale"'})
+        self.log_result("一致しないETagは200", response.status_code == 200 and response.json() == stats,
+                        f"HTTP {response.status_code}")
+
+        # ジョブを作成すると統計情報とETagが変わる
+        self.create_jobs(1)
+        response = self.make_request('GET', '/api/jobs/statistics', headers={"If-None-Match": etag})
+        new_etag = response.headers.get("ETag")
+        self.log_result("ジョブ作成後は200", response.status_code == 200, f"HTTP {response.status_code}")
+        self.log_result("ジョブ作成後はETagが変わる", bool(new_etag) and new_etag != etag, f"{etag} -> {new_etag}")
+        if response.status_code == 200:
+            self.log_result("ジョブ作成後の総ジョブ数", response.json()["total_jobs"] == stats["total_jobs"] + 1,
+                            f"{stats['total_jobs']} -> {response.json()['total_jobs']}")
+
+    def run_all_tests(self):
+        """全てのテストを実行"""
+        print("🚀 ジョブ一覧API テスト開始")
+        print(f"ベースURL: {self.base_url}")
+
+        if not self.login():
+            print("❌ 認証に失敗したため、テストを中止します")
+            return
+
+        self.test_cursor_pagination()
+        self.test_statistics_etag()
+
+        print("\n" + "=" * 50)
+        print("📊 テスト結果サマリー")
+        print("=" * 50)
+        print(f"✅ 成功: {self.test_results['passed']}")
+        print(f"❌ 失敗: {self.test_results['failed']}")
+        if self.test_results["errors"]:
+            print("\n失敗したテスト:")
+            for error in self.test_results["errors"]:
+                print(f"  - {error}")
+
+if __name__ == "__main__":
+    tester = JobListAPITester()
+    tester.run_all_tests()
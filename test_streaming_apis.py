@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+ストリーミングAPI テストスクリプト
+
+ジョブ状況の配信（Server-Sent Events）と、生成されたリクエストの
+NDJSONストリーミング（/api/replace-placeholders/stream）をテストします。
+
+使用方法:
+    python test_streaming_apis.py
+
+前提条件:
+    - サーバーが http://localhost:8000 で起動していること
+      （ジョブは同じサーバーの /api/test-response に対してリクエストを送信します）
+"""
+
+import requests
+import json
+import random
+import string
+
+# 設定
+BASE_URL = "http://localhost:8000"
+TARGET_HOST = "localhost:8000"
+
+# ジョブ実行用のテンプレート（Sniper攻撃で <<>> をペイロードに置換）
+TEMPLATE = f"GET /api/test-response?q=<<>> HTTP/1.1\nHost: {TARGET_HOST}\n\n"
+PAYLOADS = ["alpha", "beta", "gamma", "delta"]
+
+def generate_test_user():
+    """ランダムなテストユーザーを生成"""
+    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    return {
+        "username": f"streamuser_{random_suffix}",
+        "email": f"stream_{random_suffix}@example.com",
+        "password": "TestPassword123!"
+    }
+
+class StreamingAPITester:
+    def __init__(self):
+        self.base_url = BASE_URL
+        self.token = None
+        self.test_results = {
+            "passed": 0,
+            "failed": 0,
+            "errors": []
+        }
+
+    def log_result(self, test_name: str, success: bool, details: str = ""):
+        """テスト結果をログ"""
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status}: {test_name}")
+        if details and not success:
+            print(f"    詳細: {details}")
+
+        if success:
+            self.test_results["passed"] += 1
+        else:
+            self.test_results["failed"] += 1
+            self.test_results["errors"].append(f"{test_name}: {details}")
+
+    def make_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """認証ヘッダー付きリクエスト送信"""
+        headers = kwargs.pop('headers', {})
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        return requests.request(method, f"{self.base_url}{url}", headers=headers, **kwargs)
+
+    def login(self) -> bool:
+        """テストユーザーを登録してログイン"""
+        print("\n=== 0. 認証 ===")
+        user = generate_test_user()
+        response = requests.post(f"{self.base_url}/api/auth/register", json=user)
+        if response.status_code != 200:
+            self.log_result("ユーザー登録", False, f"HTTP {response.status_code}: {response.text}")
+            return False
+
+        response = requests.post(f"{self.base_url}/api/auth/login",
+                                 json={"username": user["username"], "password": user["password"]})
+        if response.status_code != 200:
+            self.log_result("ログイン", False, f"HTTP {response.status_code}: {response.text}")
+            return False
+
+        self.token = response.json()["access_token"]
+        self.log_result("ログイン", True)
+        return True
+
+    def create_request(self) -> int:
+        """ジョブ実行用のリクエストを生成し、リクエストIDを返す"""
+        response = self.make_request('POST', '/api/replace-placeholders', json={
+            "template": TEMPLATE,
+            "placeholders": [],
+            "strategy": "sniper",
+            "payload_sets": [{"name": "words", "payloads": PAYLOADS}]
+        })
+        response.raise_for_status()
+        return response.json()["request_id"]
+
+    def test_job_event_stream(self):
+        """ジョブ状況の配信（GET /api/jobs/{job_id}/stream）のテスト"""
+        print("\n=== 1. ジョブ状況の配信（SSE）テスト ===")
+
+        request_id = self.create_request()
+        response = self.make_request('POST', '/api/execute-requests', json={
+            "request_id": request_id,
+            "http_config": {"scheme": "http", "base_url": TARGET_HOST, "timeout": 10}
+        })
+        if response.status_code != 200:
+            self.log_result("ジョブ作成", False, f"HTTP {response.status_code}: {response.text}")
+            return
+        job_id = response.json()["job_id"]
+
+        # ジョブが終了するとサーバーがストリームを閉じる
+        response = self.make_request('GET', f'/api/jobs/{job_id}/stream', stream=True, timeout=60)
+        content_type = response.headers.get("content-type", "")
+        self.log_result("Content-Type が text/event-stream", content_type.startswith("text/event-stream"), content_type)
+
+        events = []
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("data: "):
+                events.append(json.loads(line[len("data: "):]))
+
+        if not events:
+            self.log_result("イベントの受信", False, "イベントがありません")
+            return
+        print(f"    受信したイベント数: {len(events)}")
+
+        last = events[-1]
+        total = len(PAYLOADS) + 1  # オリジナルのテンプレートを含む
+        self.log_result("イベントのジョブID", all(event["job_id"] == job_id for event in events))
+        self.log_result("最後のイベントが完了状態", last["status"] == "completed", last["status"])
+        self.log_result("最後のイベントの進捗", last["progress"]["completed_requests"] == total,
+                        f"{last['progress']['completed_requests']}/{total}")
+        completed = [event["progress"]["completed_requests"] for event in events]
+        self.log_result("進捗が減少しない", completed == sorted(completed), str(completed))
+
+        # 存在しないジョブ
+        response = self.make_request('GET', '/api/jobs/nonexistent-job/stream')
+        self.log_result("存在しないジョブは404", response.status_code == 404, f"HTTP {response.status_code}")
+
+    def test_ndjson_stream(self):
+        """生成されたリクエストのNDJSONストリーミング（POST /api/replace-placeholders/stream）のテスト"""
+        print("\n=== 2. NDJSONストリーミングテスト ===")
+
+        body = {
+            "template": "GET /search?a=<<a>>&b=<<b>> HTTP/1.1\nHost: example.com\n\n",
+            "placeholders": ["a", "b"],
+            "strategy": "cluster_bomb",
+            "payload_sets": [
+                {"name": "a", "payloads": ["1", "2", "3"]},
+                {"name": "b", "payloads": ["x", "y"]}
+            ]
+        }
+
+        # 通常版と同じリクエストが同じ順で1行1件返されること
+        expected = self.make_request('POST', '/api/replace-placeholders', json=body).json()["requests"]
+        response = self.make_request('POST', '/api/replace-placeholders/stream', json=body, stream=True)
+        if response.status_code != 200:
+            self.log_result("NDJSONストリーミング", False, f"HTTP {response.status_code}: {response.text}")
+            return
+        content_type = response.headers.get("content-type", "")
+        self.log_result("Content-Type が application/x-ndjson", content_type == "application/x-ndjson", content_type)
+
+        lines = [json.loads(line) for line in response.iter_lines(decode_unicode=True) if line]
+        self.log_result("通常版と同じリクエスト", lines == expected, f"{len(lines)}件 / 期待値 {len(expected)}件")
+
+        # 保存されたリクエストはX-Request-Idで参照できること
+        request_id = response.headers.get("X-Request-Id")
+        if request_id is None:
+            self.log_result("X-Request-Id ヘッダー", False, "ヘッダーがありません")
+            return
+        detail = self.make_request('GET', f'/api/history/{request_id}')
+        saved = detail.json().get("requests", []) if detail.status_code == 200 else []
+        # 履歴とはリクエスト本文のみを比較する（Cluster Bombのペイロードの組み合わせは保存されない）
+        self.log_result("保存されたリクエスト",
+                        [item["request"] for item in saved] == [item["request"] for item in lines],
+                        f"HTTP {detail.status_code}, {len(saved)}件")
+
+        # 入力エラーはストリーム開始前に400で返されること
+        response = self.make_request('POST', '/api/replace-placeholders/stream', json=dict(body, payload_sets=[]))
+        self.log_result("ペイロードセットなしは400", response.status_code == 400, f"HTTP {response.status_code}")
+
+    def run_all_tests(self):
+        """全てのテストを実行"""
+        print("🚀 ストリーミングAPI テスト開始")
+        print(f"ベースURL: {self.base_url}")
+
+        if not self.login():
+            print("❌ 認証に失敗したため、テストを中止します")
+            return
+
+        self.test_job_event_stream()
+        self.test_ndjson_stream()
+
+        print("\n" + "=" * 50)
+        print("📊 テスト結果サマリー")
+        print("=" * 50)
+        print(f"✅ 成功: {self.test_results['passed']}")
+        print(f"❌ 失敗: {self.test_results['failed']}")
+        if self.test_results["errors"]:
+            print("\n失敗したテスト:")
+            for error in self.test_results["errors"]:
+                print(f"  - {error}")
+
+if __name__ == "__main__":
+    tester = StreamingAPITester()
+    tester.run_all_tests()